@@ -1,4 +1,10 @@
-from .generator import CodeGenerator
-from .parser import Parser
-from .scanner import Scanner
-from .semantic import SemanticAnalyser
+__version__ = "0.1.0"
+
+from .util.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "CodeGenerator": ".generator",
+    "Parser": ".parser",
+    "Scanner": ".scanner",
+    "SemanticAnalyser": ".semantic",
+})
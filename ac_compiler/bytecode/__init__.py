@@ -0,0 +1,3 @@
+from .bytecode import Bytecode
+from .compiler import BytecodeCompiler
+from .vm import VirtualMachine
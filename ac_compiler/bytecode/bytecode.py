@@ -0,0 +1,123 @@
+from __future__ import annotations
+import sys
+from array import array
+from decimal import Decimal
+from struct import Struct
+from typing import BinaryIO, List, Union
+
+
+# Opcodes. Every instruction has one operand in Bytecode.args (0 when unused).
+PUSH = 0   # push constants[arg]
+LOAD = 1   # push the value of slot arg
+STORE = 2  # pop into slot arg
+ADD = 3    # pop right, pop left, push left + right
+SUB = 4    # pop right, pop left, push left - right
+PRINT = 5  # print the value of slot arg
+
+OPCODE_NAMES = ["PUSH", "LOAD", "STORE", "ADD", "SUB", "PRINT"]
+
+MAGIC = b"ACBC"
+VERSION = 1
+HEADER = Struct("<4sBIII")
+LENGTH = Struct("<I")
+INT_CONSTANT = 0
+DECIMAL_CONSTANT = 1
+
+
+class Bytecode:
+    """
+    A compiled ac program: opcodes packed in an array of bytes, one operand per instruction,
+    a pool of constants (ints and Decimals) and the names of the variable slots.
+    """
+    def __init__(self):
+        self.code = array("B")
+        self.args = array("I")
+        self.constants: List[Union[int, Decimal]] = list()
+        self.slots: List[str] = list()
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, Bytecode) and self.code == other.code
+                and self.args == other.args and self.constants == other.constants
+                and self.slots == other.slots)
+
+    def __str__(self) -> str:
+        lines = list()
+        for index, (opcode, arg) in enumerate(zip(self.code, self.args)):
+            if opcode == PUSH:
+                operand = str(self.constants[arg])
+            elif opcode in (LOAD, STORE, PRINT):
+                operand = self.slots[arg]
+            else:
+                operand = ""
+            lines.append(f"{index:>6} {OPCODE_NAMES[opcode]:<6} {operand}")
+        return "\n".join(lines)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialises the bytecode to its binary file format.
+        :return: the serialised bytecode
+        """
+        args = array("I", self.args)
+        if sys.byteorder == "big":
+            args.byteswap()
+        parts = [HEADER.pack(MAGIC, VERSION, len(self.code), len(self.constants),
+                             len(self.slots)), self.code.tobytes(), args.tobytes()]
+        for constant in self.constants:
+            text = str(constant).encode()
+            tag = INT_CONSTANT if isinstance(constant, int) else DECIMAL_CONSTANT
+            parts.extend([bytes([tag]), LENGTH.pack(len(text)), text])
+        for slot in self.slots:
+            name = slot.encode()
+            parts.extend([LENGTH.pack(len(name)), name])
+        return b"".join(parts)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> Bytecode:
+        """
+        Deserialises bytecode from its binary file format.
+        :param data: the serialised bytecode
+        :return: the deserialised bytecode
+        """
+        magic, version, instructions, constants, slots = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not an ac bytecode file of a supported version")
+        bytecode = Bytecode()
+        offset = HEADER.size
+        bytecode.code.frombytes(data[offset:offset + instructions])
+        offset += instructions
+        bytecode.args.frombytes(data[offset:offset + instructions * bytecode.args.itemsize])
+        if sys.byteorder == "big":
+            bytecode.args.byteswap()
+        offset += instructions * bytecode.args.itemsize
+
+        for _ in range(constants):
+            tag = data[offset]
+            (length,) = LENGTH.unpack_from(data, offset + 1)
+            text = data[offset + 1 + LENGTH.size:offset + 1 + LENGTH.size + length].decode()
+            bytecode.constants.append(int(text) if tag == INT_CONSTANT else Decimal(text))
+            offset += 1 + LENGTH.size + length
+        for _ in range(slots):
+            (length,) = LENGTH.unpack_from(data, offset)
+            bytecode.slots.append(data[offset + LENGTH.size:offset + LENGTH.size + length]
+                                  .decode())
+            offset += LENGTH.size + length
+        return bytecode
+
+    def dump(self, file: BinaryIO) -> None:
+        """
+        Writes the bytecode to a binary file.
+        :param file: the file to write to
+        """
+        file.write(self.to_bytes())
+
+    @staticmethod
+    def load(file: BinaryIO) -> Bytecode:
+        """
+        Reads bytecode from a binary file.
+        :param file: the file to read from
+        :return: the bytecode read
+        """
+        return Bytecode.from_bytes(file.read())
@@ -0,0 +1,92 @@
+from typing import Dict, Tuple
+from ..parser.ast import AST, Node
+from ..scanner.tokens import Tokens
+from ..util import to_decimal
+from ..util.numeric import Number
+from .bytecode import ADD, LOAD, PRINT, PUSH, STORE, SUB, Bytecode
+
+
+class BytecodeCompiler:
+    """
+    Lowers an analysed AST of the ac language to Bytecode, resolving variables to slot
+    indices and interning constants in the constant pool.
+    """
+    def __init__(self, ast: AST):
+        self.ast = ast
+        self.bytecode = Bytecode()
+        self.slot_indices: Dict[str, int] = dict()
+        self.constant_indices: Dict[Tuple[type, Number], int] = dict()
+
+    def slot(self, name: str) -> int:
+        """
+        Finds (or allocates) the slot of a variable.
+        :param name: the name of the variable
+        :return: the index of its slot
+        """
+        index = self.slot_indices.get(name)
+        if index is None:
+            index = self.slot_indices[name] = len(self.bytecode.slots)
+            self.bytecode.slots.append(name)
+        return index
+
+    def constant(self, value: Number) -> int:
+        """
+        Finds (or adds) a constant in the constant pool. Floats are stored as exact Decimals.
+        :param value: the value of the constant
+        :return: the index of the constant in the pool
+        """
+        if not isinstance(value, int):
+            value = to_decimal(value)
+        key = (type(value), value)
+        index = self.constant_indices.get(key)
+        if index is None:
+            index = self.constant_indices[key] = len(self.bytecode.constants)
+            self.bytecode.constants.append(value)
+        return index
+
+    def emit(self, opcode: int, arg: int = 0) -> None:
+        """
+        Appends an instruction to the bytecode.
+        :param opcode: the opcode of the instruction
+        :param arg: its operand
+        """
+        self.bytecode.code.append(opcode)
+        self.bytecode.args.append(arg)
+
+    def compile_expression(self, node: Node) -> None:
+        """
+        Compiles an expression by visiting its nodes in post-order with an explicit stack.
+        :param node: the root node of the expression
+        """
+        # Children are pushed left to right, so the reversed pre-order is the post-order
+        preorder = list()
+        stack = [node]
+        while stack:
+            top = stack.pop()
+            preorder.append(top)
+            stack.extend(top.get_children())
+
+        for top in reversed(preorder):
+            if top.type == Tokens.ID:
+                self.emit(LOAD, self.slot(top.value))
+            elif top.type == Tokens.PLUS:
+                self.emit(ADD)
+            elif top.type == Tokens.MINUS:
+                self.emit(SUB)
+            elif top.type in (Tokens.INUM, Tokens.FNUM):
+                self.emit(PUSH, self.constant(top.value))
+
+    def compile(self) -> Bytecode:
+        """
+        Compiles every statement of the program.
+        :return: the compiled bytecode
+        """
+        for statement in self.ast.root.get_children():
+            if statement.type in (Tokens.FLOATDCL, Tokens.INTDCL):
+                self.slot(statement.value.value)
+            elif statement.type == Tokens.ASSIGN:
+                self.compile_expression(statement.right())
+                self.emit(STORE, self.slot(statement.left().value))
+            elif statement.type == Tokens.PRINT:
+                self.emit(PRINT, self.slot(statement.value))
+        return self.bytecode
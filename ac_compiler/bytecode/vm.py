@@ -0,0 +1,49 @@
+import sys
+from typing import Dict, TextIO
+from ..util import format_dc
+from ..util.numeric import EXACT, Number
+from .bytecode import ADD, LOAD, PRINT, PUSH, STORE, SUB, Bytecode
+
+
+class VirtualMachine:
+    """
+    A stack machine executing ac Bytecode, printing exactly what dc prints for the same
+    program. Instructions are dispatched straight from the opcode and operand arrays.
+    Variables start as 0, as dc loads 0 from a register which was never stored to.
+    """
+    def __init__(self, bytecode: Bytecode, output: TextIO = None):
+        self.bytecode = bytecode
+        self.output = output if output is not None else sys.stdout
+        self.slots = [0] * len(bytecode.slots)
+
+    def run(self) -> Dict[str, Number]:
+        """
+        Executes the bytecode from start to finish.
+        :return: the final values of the program's variables
+        """
+        constants = self.bytecode.constants
+        slots = self.slots
+        stack = list()
+        push, pop = stack.append, stack.pop
+        write = self.output.write
+        add, subtract = EXACT.add, EXACT.subtract
+
+        for opcode, arg in zip(self.bytecode.code, self.bytecode.args):
+            if opcode == LOAD:
+                push(slots[arg])
+            elif opcode == PUSH:
+                push(constants[arg])
+            elif opcode == STORE:
+                slots[arg] = pop()
+            elif opcode == ADD:
+                right, left = pop(), pop()
+                push(left + right if type(left) is int and type(right) is int
+                     else add(left, right))
+            elif opcode == SUB:
+                right, left = pop(), pop()
+                push(left - right if type(left) is int and type(right) is int
+                     else subtract(left, right))
+            elif opcode == PRINT:
+                write(format_dc(slots[arg]) + "\n")
+
+        return dict(zip(self.bytecode.slots, slots))
@@ -0,0 +1,173 @@
+"""
+Command-line interface of the compiler: python -m ac_compiler <mode> [options] [file].
+
+Only the phases a mode needs are imported, and options are parsed by hand rather than with
+argparse, to keep the start-up time of a single compilation low.
+"""
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO
+
+USAGE = """usage: python -m ac_compiler <mode> [-O level] [-o output] [-t trace] [file]
+
+Reads the ac program in file (or standard input if omitted or "-").
+
+modes:
+  scan     print the tokens of the program
+  parse    print the abstract syntax tree of the program
+  check    check the program for errors, printing nothing if there are none
+  dc       compile the program to dc (the default output is standard output)
+  run      run the program, printing what dc would print
+  batch    compile many files in parallel (see python -m ac_compiler batch --help)
+  serve    run a compile server (see python -m ac_compiler serve --help)
+
+options:
+  -O level   optimisation level for dc (0 to 3; default 0)
+  -o output  write to output rather than standard output
+  -t trace   record the time spent in each phase to trace, as JSON lines if it ends in
+             .jsonl, otherwise as a Chrome trace (for chrome://tracing or Perfetto)
+  --version  print the version of the compiler
+"""
+
+
+def read(path: str) -> str:
+    if path == "-":
+        return sys.stdin.read()
+    with open(path) as file:
+        return file.read()
+
+
+def scan(source: str, output: TextIO, _: int, __: Any) -> None:
+    from .scanner.stream import iter_tokens
+    output.writelines(f"{token}\n" for token in iter_tokens(source))
+
+
+def parse(source: str, output: TextIO, _: int, __: Any) -> None:
+    from .parser.iterative_parser import IterativeParser
+    from .scanner.stream import iter_tokens
+    parser = IterativeParser(iter_tokens(source))
+    parser.parse()
+    # Pre-order, printing each node indented by its depth
+    stack = [(child, 0) for child in reversed(parser.ast.children)]
+    while stack:
+        node, depth = stack.pop()
+        value = node.value.value if hasattr(node.value, "value") else node.value
+        value = "" if value is None else f" {value}"
+        output.write(f"{'  ' * depth}{node.type.name}{value}\n")
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+
+
+def check(source: str, _: TextIO, __: int, tracer: Any) -> None:
+    from .driver.pipeline import analyse
+    analyse(source, tracer)
+
+
+def compile_dc(source: str, output: TextIO, level: int, tracer: Any) -> None:
+    if level == 0 and not tracer.enabled:
+        from .driver.pipeline import compile_stream
+        compile_stream(source, output)
+        return
+    from .driver.pipeline import compile_source
+    output.write(compile_source(source, level, tracer))
+
+
+def run(source: str, output: TextIO, _: int, tracer: Any) -> None:
+    from .driver.pipeline import analyse
+    from .evaluator.evaluator import Evaluator
+    ast = analyse(source, tracer)
+    with tracer.phase("run"):
+        Evaluator(ast, output).run()
+
+
+MODES: Dict[str, Callable[[str, TextIO, int, Any], None]] = {
+    "scan": scan,
+    "parse": parse,
+    "check": check,
+    "dc": compile_dc,
+    "run": run,
+}
+
+
+def open_tracer(path: Optional[str]) -> Any:
+    """
+    Opens the tracer recording phases to the given path (or the null tracer if none).
+    """
+    if path is None:
+        from .trace.tracer import NULL_TRACER
+        return NULL_TRACER
+    from .trace import ChromeTraceSink, JsonLinesSink, Tracer
+    return Tracer(JsonLinesSink(path) if path.endswith(".jsonl") else ChromeTraceSink(path))
+
+
+def delegate(mode: str, argv: List[str]) -> int:
+    """
+    Hands the remaining arguments to the command-line interface of another subsystem.
+    """
+    if mode == "batch":
+        from .driver.batch import main as batch
+        return batch(argv)
+    from .server.server import main as serve
+    return serve(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the command-line interface.
+    :param argv: the command-line arguments, excluding the program name
+    :return: the exit status
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        sys.stdout.write(USAGE)
+        return 0 if argv else 2
+    if argv[0] == "--version":
+        from . import __version__
+        print(__version__)
+        return 0
+    mode, argv = argv[0], argv[1:]
+    if mode in ("batch", "serve"):
+        return delegate(mode, argv)
+    if mode not in MODES:
+        print(f"Unknown mode {mode}\n", file=sys.stderr)
+        sys.stderr.write(USAGE)
+        return 2
+
+    level, output_path, trace_path, paths = 0, None, None, list()
+    arguments = iter(argv)
+    try:
+        for argument in arguments:
+            if argument in ("-O", "-o", "-t"):
+                value = next(arguments)
+                if argument == "-O":
+                    level = int(value)
+                elif argument == "-o":
+                    output_path = value
+                else:
+                    trace_path = value
+            elif argument.startswith("-O") and len(argument) > 2:
+                level = int(argument[2:])
+            elif argument.startswith("-") and argument != "-":
+                raise ValueError(f"Unknown option {argument}")
+            else:
+                paths.append(argument)
+        if len(paths) > 1:
+            raise ValueError("Expected at most one file")
+    except (StopIteration, ValueError) as error:
+        print(error or "Missing option value", file=sys.stderr)
+        return 2
+
+    from .util.error import Error
+    try:
+        source = read(paths[0] if paths else "-")
+        with open_tracer(trace_path) as tracer:
+            if output_path is None:
+                MODES[mode](source, sys.stdout, level, tracer)
+            else:
+                with open(output_path, "w") as output:
+                    MODES[mode](source, output, level, tracer)
+    except Error as error:
+        print(f"{type(error).__name__}: {error}", file=sys.stderr)
+        return 1
+    except OSError as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,13 @@
+from ..util.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "analyse": ".pipeline",
+    "compile_source": ".pipeline",
+    "compile_stream": ".pipeline",
+    "generate": ".pipeline",
+    "BatchCompiler": ".batch",
+    "BatchResult": ".batch",
+    "CompilationCache": ".cache",
+    "IncrementalCompiler": ".incremental",
+    "ParallelCompiler": ".parallel",
+})
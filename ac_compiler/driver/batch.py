@@ -0,0 +1,169 @@
+import sys
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from os import cpu_count, makedirs, path
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from ..util.error import Error
+from .pipeline import compile_source
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of compiling one file of a batch: either its dc program or its error.
+    """
+    path: str
+    dc: Optional[str] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+
+
+def compile_chunk(paths: Sequence[str], level: int = 0) -> List[BatchResult]:
+    """
+    Compiles a chunk of files, collecting errors rather than raising them.
+    :param paths: the paths of the ac files to compile
+    :param level: the optimisation level
+    :return: the result for each file, in order
+    """
+    results = list()
+    for path_ in paths:
+        try:
+            results.append(BatchResult(path_, dc=compile_source(Path(path_), level)))
+        except (Error, OSError, UnicodeDecodeError) as error:
+            results.append(BatchResult(path_, error=str(error),
+                                       error_type=type(error).__name__))
+    return results
+
+
+class BatchCompiler:
+    """
+    Compiles many ac files in parallel over a pool of worker processes. Files are submitted
+    in chunks, with a bounded number of chunks in flight, and results are streamed back
+    either in input order or as soon as each chunk completes.
+    """
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 32, level: int = 0):
+        self.workers = workers or cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.level = level
+
+    def chunks(self, paths: Iterable[str]) -> Iterator[List[str]]:
+        chunk = list()
+        for path_ in paths:
+            chunk.append(str(path_))
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = list()
+        if chunk:
+            yield chunk
+
+    def compile(self, paths: Iterable[str], ordered: bool = True) -> Iterator[BatchResult]:
+        """
+        Compiles every file in paths.
+        :param paths: the paths of the ac files to compile
+        :param ordered: whether to yield results in the order of paths, rather than as soon
+                        as they are ready
+        :return: an iterator over the result of each file
+        """
+        if self.workers == 1:
+            for chunk in self.chunks(paths):
+                yield from compile_chunk(chunk, self.level)
+            return
+
+        window = 2 * self.workers
+        with ProcessPoolExecutor(self.workers) as executor:
+            pending: Deque[Future] = deque()
+            for chunk in self.chunks(paths):
+                pending.append(executor.submit(compile_chunk, chunk, self.level))
+                if len(pending) >= window:
+                    yield from self.collect(pending, ordered)
+            while pending:
+                yield from self.collect(pending, ordered)
+
+    @staticmethod
+    def collect(pending: Deque[Future], ordered: bool) -> Iterator[BatchResult]:
+        """
+        Waits for (at least) one in-flight chunk and yields its results.
+        :param pending: the futures of the chunks in flight, in submission order
+        :param ordered: whether to wait for the oldest chunk rather than the first to finish
+        """
+        if ordered:
+            yield from pending.popleft().result()
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield from future.result()
+
+
+def expand(paths: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Expands directories into the .ac files they contain.
+    :param paths: paths of files and directories
+    :return: an iterator over file paths, each with its path relative to the directory it
+             was found in (or its name, if given directly)
+    """
+    for path_ in paths:
+        if path.isdir(path_):
+            for file in sorted(Path(path_).rglob("*.ac")):
+                yield str(file), str(file.relative_to(path_))
+        else:
+            yield path_, path.basename(path_)
+
+
+def output_paths(files: Iterable[Tuple[str, str]], directory: str) -> Dict[str, str]:
+    """
+    Maps each file to the path its dc program is written to: its relative path (see expand)
+    under the output directory, with a .dc extension.
+    :param files: the file paths and relative paths, from expand
+    :param directory: the output directory
+    :return: the output path of each file
+    :raise ValueError: if two different files would be written to the same output path
+    """
+    outputs: Dict[str, str] = dict()
+    sources: Dict[str, str] = dict()
+    for file, relative in files:
+        output = path.join(directory, path.splitext(relative)[0] + ".dc")
+        if sources.setdefault(output, file) != file:
+            raise ValueError(f"{sources[output]} and {file} would both be written to {output}")
+        outputs[file] = output
+    return outputs
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    arguments = ArgumentParser(description="Compile many ac files to dc in parallel.")
+    arguments.add_argument("paths", nargs="+", help="ac files, or directories of them")
+    arguments.add_argument("-j", "--workers", type=int, default=None,
+                           help="number of worker processes (default: one per CPU)")
+    arguments.add_argument("--chunk-size", type=int, default=32,
+                           help="number of files sent to a worker at a time")
+    arguments.add_argument("--unordered", action="store_true",
+                           help="report files as they complete rather than in order")
+    arguments.add_argument("-O", "--optimise", type=int, default=0, dest="level",
+                           help="optimisation level")
+    arguments.add_argument("-o", "--output-directory",
+                           help="write each dc program to <name>.dc here, mirroring the "
+                                "layout of input directories, rather than stdout")
+    options = arguments.parse_args(argv)
+
+    files = list(expand(options.paths))
+    if options.output_directory:
+        try:
+            outputs = output_paths(files, options.output_directory)
+        except ValueError as error:
+            arguments.error(str(error))
+    compiler = BatchCompiler(options.workers, options.chunk_size, options.level)
+    failures = 0
+    paths = (file for file, _ in files)
+    for result in compiler.compile(paths, ordered=not options.unordered):
+        if result.error is not None:
+            failures += 1
+            print(f"{result.path}: {result.error_type}: {result.error}", file=sys.stderr)
+        elif options.output_directory:
+            output = outputs[result.path]
+            makedirs(path.dirname(output), exist_ok=True)
+            with open(output, "w") as file:
+                file.write(result.dc)
+        else:
+            sys.stdout.write(f"# {result.path}\n{result.dc}")
+    return 1 if failures else 0
@@ -0,0 +1,229 @@
+import pickle
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import sha256
+from os import makedirs, path, remove, replace, scandir, utime, walk
+from tempfile import NamedTemporaryFile
+from typing import Dict, List, Optional, Tuple
+from .. import __version__
+from ..parser import AST
+from ..scanner import Token, iter_tokens
+from ..scanner.stream import Source, iter_chunks
+from ..util.directories import private_directory, user_cache_directory
+from .pipeline import analyse, compile_source
+
+
+DEFAULT_CACHE_DIRECTORY = user_cache_directory("cache")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MEMORY_ENTRIES = 256
+
+
+def read_source(source: Source) -> bytes:
+    """
+    Reads the whole of a source of ac code as UTF-8 bytes, for hashing.
+    :param source: anything accepted by iter_tokens
+    :return: the bytes of the source
+    """
+    if isinstance(source, bytes):
+        return source
+    return "".join(iter_chunks(source)).encode()
+
+
+@lru_cache(maxsize=None)
+def compiler_fingerprint() -> str:
+    """
+    Hashes the source of the compiler, so that cached artifacts are not reused once any pass
+    changes, even if the version number does not.
+    :return: the hex digest of the version and the source files of the compiler
+    """
+    package = path.dirname(path.dirname(path.abspath(__file__)))
+    digest = sha256(__version__.encode())
+    for directory, directories, files in sorted(walk(package)):
+        directories.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                digest.update(path.relpath(path.join(directory, name), package).encode())
+                with open(path.join(directory, name), "rb") as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+class CompilationCache:
+    """
+    Content-addressed cache of compilation artifacts (generated dc programs, and optionally
+    token streams and analysed ASTs), keyed by the hash of the source bytes, the compiler
+    version (and source, see compiler_fingerprint) and the compilation options.
+    Entries live in a cache directory private to the current user (as entries are
+    unpickled), written atomically and evicted least recently used first once the directory
+    exceeds max_bytes, with the most recently used entries also kept in memory. Hits and
+    misses are counted in statistics.
+    """
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 memory_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self.directory = directory or DEFAULT_CACHE_DIRECTORY
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.memory: OrderedDict = OrderedDict()
+        self.statistics: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0,
+                                           "writes": 0, "evictions": 0}
+        private_directory(self.directory)
+        self.size = sum(size for _, size, _ in self.entries())
+
+    @staticmethod
+    def key(source: bytes, artifact: str, level: int = 0) -> str:
+        """
+        Computes the cache key of an artifact compiled from the given source.
+        :param source: the bytes of the source
+        :param artifact: the kind of artifact ("dc", "tokens" or "ast")
+        :param level: the optimisation level the artifact is compiled with
+        :return: the hex digest identifying the artifact
+        """
+        digest = sha256(f"{compiler_fingerprint()}\0{artifact}\0{level}\0".encode())
+        digest.update(source)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return path.join(self.directory, key[:2], key)
+
+    def entries(self) -> List[Tuple[str, int, int]]:
+        """
+        Lists the entries stored in the cache directory.
+        :return: the path, size and last use time of every entry
+        """
+        entries = list()
+        for bucket in scandir(self.directory):
+            if bucket.is_dir():
+                for entry in scandir(bucket.path):
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        stat = entry.stat()
+                        entries.append((entry.path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def remember(self, key: str, data: bytes) -> None:
+        self.memory[key] = data
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Looks up an entry, first in memory and then on disk.
+        :param key: the key of the entry
+        :return: the data stored for the key, or None on a miss
+        """
+        data = self.memory.get(key)
+        if data is not None:
+            self.memory.move_to_end(key)
+            self.statistics["memory_hits"] += 1
+            return data
+
+        entry = self.path(key)
+        try:
+            with open(entry, "rb") as file:
+                data = file.read()
+            utime(entry)  # Marks the entry as recently used
+        except FileNotFoundError:
+            self.statistics["misses"] += 1
+            return None
+        self.statistics["disk_hits"] += 1
+        self.remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Stores an entry in memory and, atomically, on disk, evicting old entries if the
+        directory grows beyond max_bytes.
+        :param key: the key of the entry
+        :param data: the data to store
+        """
+        self.remember(key, data)
+        entry = self.path(key)
+        makedirs(path.dirname(entry), exist_ok=True)
+        with NamedTemporaryFile("wb", dir=path.dirname(entry), suffix=".tmp",
+                                delete=False) as file:
+            file.write(data)
+        try:
+            self.size -= path.getsize(entry)  # Overwriting an entry
+        except FileNotFoundError:
+            pass
+        replace(file.name, entry)
+        self.statistics["writes"] += 1
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            self.evict(keep=entry)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Removes the least recently used entries from disk until the cache fits in max_bytes.
+        :param keep: the path of an entry not to evict (i.e. the one just written)
+        """
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        self.size = sum(size for _, size, _ in entries)
+        for entry, size, _ in entries:
+            if self.size <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            try:
+                remove(entry)
+            except FileNotFoundError:
+                pass
+            self.size -= size
+            self.statistics["evictions"] += 1
+
+    def hit_rate(self) -> float:
+        """
+        :return: the fraction of lookups served from memory or disk
+        """
+        hits = self.statistics["memory_hits"] + self.statistics["disk_hits"]
+        lookups = hits + self.statistics["misses"]
+        return hits / lookups if lookups else 0.0
+
+    def compile(self, source: Source, level: int = 0) -> str:
+        """
+        Compiles an ac program to a dc program, through the cache.
+        :param source: anything accepted by iter_tokens
+        :param level: the optimisation level
+        :return: the text of the dc program
+        """
+        source = read_source(source)
+        key = CompilationCache.key(source, "dc", level)
+        data = self.get(key)
+        if data is None:
+            data = compile_source(source, level).encode()
+            self.put(key, data)
+        return data.decode()
+
+    def tokens(self, source: Source) -> List[Token]:
+        """
+        Scans an ac program, through the cache.
+        :param source: anything accepted by iter_tokens
+        :return: the list of tokens of the program
+        """
+        source = read_source(source)
+        key = CompilationCache.key(source, "tokens")
+        data = self.get(key)
+        if data is None:
+            tokens = list(iter_tokens(source))
+            self.put(key, pickle.dumps(tokens, pickle.HIGHEST_PROTOCOL))
+            return tokens
+        return pickle.loads(data)
+
+    def ast(self, source: Source) -> AST:
+        """
+        Scans, parses and analyses an ac program, through the cache. ASTs too deep to pickle
+        are returned without being cached.
+        :param source: anything accepted by iter_tokens
+        :return: the analysed AST of the program
+        """
+        source = read_source(source)
+        key = CompilationCache.key(source, "ast")
+        data = self.get(key)
+        if data is None:
+            ast = analyse(source)
+            try:
+                self.put(key, pickle.dumps(ast, pickle.HIGHEST_PROTOCOL))
+            except RecursionError:
+                pass
+            return ast
+        return pickle.loads(data)
@@ -0,0 +1,218 @@
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from ..generator import IterativeCodeGenerator, render_script
+from ..parser import AST, IterativeParser
+from ..parser.iterative_parser import DECLARATION_SET
+from ..scanner import Token, Tokens
+from ..scanner.regex_scanner import scan_token_spans
+from ..semantic import SemanticAnalyser, SymbolTable
+from ..util.error import Error
+from .pipeline import declare
+
+
+class Unit:
+    """
+    A span of a compiled program (the declaration block or a single statement), spanning
+    from its first token to the first token of the next unit, with its generated dc code and
+    the symbols it references.
+    """
+    def __init__(self, start: int, end: int, generated: List[str], names: Set[str]):
+        self.start = start
+        self.end = end
+        self.generated = generated
+        self.names = names
+
+
+def common_prefix(first: str, second: str) -> int:
+    """
+    Finds the length of the longest common prefix of two strings, by binary search over
+    slice comparisons (which run at memcmp speed).
+    :return: the length of the common prefix
+    """
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[low:middle] == second[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def common_suffix(first: str, second: str, limit: int) -> int:
+    """
+    Finds the length of the longest common suffix of two strings, up to limit characters.
+    :return: the length of the common suffix
+    """
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[len(first) - middle:len(first) - low] == \
+                second[len(second) - middle:len(second) - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class IncrementalCompiler:
+    """
+    Compiles successive versions of an ac program to dc, reusing the work done for the parts
+    of the program an edit did not touch. Statements are independent apart from the
+    declarations, so only the statements overlapping the edited span are rescanned,
+    reparsed, reanalysed and regenerated, along with any statements referencing a symbol
+    whose declaration changed. The regenerated dc is spliced between the cached dc of the
+    untouched statements.
+    """
+    def __init__(self):
+        self.source = ""
+        self.units: List[Unit] = list()
+        self.symbol_table = SymbolTable()
+        self.statistics: Dict[str, int] = {"full": 0, "incremental": 0,
+                                           "rescanned_characters": 0,
+                                           "regenerated_statements": 0}
+
+    def compile(self, source: str) -> str:
+        """
+        Compiles a new version of the program, incrementally if it has been compiled before.
+        :param source: the source text of the program
+        :return: the text of the dc program
+        """
+        if not self.units:
+            self.full(source)
+        elif source != self.source:
+            try:
+                self.update(source)
+            except Error:
+                # The edit may have changed how its neighbours parse; let a full compilation
+                # decide (and report any genuine error)
+                self.full(source)
+        return self.output()
+
+    def output(self) -> str:
+        return render_script(code for unit in self.units for code in unit.generated)
+
+    def full(self, source: str) -> None:
+        """
+        Compiles the whole program from scratch.
+        :param source: the source text of the program
+        """
+        symbol_table, units = self.build(source, 0, len(source), None)
+        self.source, self.symbol_table, self.units = source, symbol_table, units
+        self.statistics["full"] += 1
+
+    def update(self, source: str) -> None:
+        """
+        Recompiles the units of the program affected by the difference between the previous
+        source and the new one.
+        :param source: the new source text of the program
+        """
+        old = self.source
+        prefix = common_prefix(old, source)
+        suffix = common_suffix(old, source, min(len(old), len(source)) - prefix)
+        delta = len(source) - len(old)
+
+        # Units touching the edited span of the old source (inclusively, so that edits at a
+        # unit boundary reach both neighbours)
+        edited_end = len(old) - suffix
+        affected = [index for index, unit in enumerate(self.units)
+                    if unit.start <= edited_end and unit.end >= prefix]
+        first, last = affected[0], affected[-1]
+        start, end = self.units[first].start, self.units[last].end + delta
+
+        if first == 0:
+            symbol_table, rebuilt = self.build(source, start, end, None)
+        else:
+            symbol_table, rebuilt = self.build(source, start, end, self.symbol_table)
+        changed = {name for name in set(symbol_table.symbols) | set(self.symbol_table.symbols)
+                   if symbol_table.symbols.get(name) != self.symbol_table.symbols.get(name)}
+
+        # Shifted copies, so the cached units stay valid if the recompilation fails
+        after = [Unit(unit.start + delta, unit.end + delta, unit.generated, unit.names)
+                 for unit in self.units[last + 1:]]
+        before = self.units[1:first] if first > 0 else []
+        units = ([self.units[0]] if first > 0 else []) + before + rebuilt + after
+        if changed:
+            units = [self.rebuild(source, unit, symbol_table)
+                     if index > 0 and unit.names & changed and unit not in rebuilt else unit
+                     for index, unit in enumerate(units)]
+
+        self.source, self.symbol_table, self.units = source, symbol_table, units
+        self.statistics["incremental"] += 1
+
+    def rebuild(self, source: str, unit: Unit, symbol_table: SymbolTable) -> Unit:
+        """
+        Recompiles a single (textually unchanged) statement against a new symbol table.
+        """
+        return self.build(source, unit.start, unit.end, symbol_table)[1][0]
+
+    def build(self, source: str, start: int, end: int,
+              symbol_table: Optional[SymbolTable]) -> Tuple[SymbolTable, List[Unit]]:
+        """
+        Scans, parses, analyses and generates a span of the program made up of whole units.
+        :param source: the source text of the program
+        :param start: the start of the span
+        :param end: the end of the span
+        :param symbol_table: the symbol table to analyse statements against, or None if the
+                             span starts with the declarations (which are then entered into a
+                             new symbol table)
+        :return: the symbol table and the compiled units of the span
+        """
+        self.statistics["rescanned_characters"] += end - start
+        spans = list(scan_token_spans(source, start, end))
+        units = list()
+
+        position = 0
+        if symbol_table is None:
+            while position < len(spans) and spans[position][0].type in DECLARATION_SET:
+                position += 2
+            declarations = [token for token, _, _ in spans[:position]]
+            symbol_table = declare(declarations)
+            unit_end = spans[position][1] if position < len(spans) else end
+            units.append(Unit(start, unit_end, [], set()))
+
+        for tokens, unit_start, unit_end in IncrementalCompiler.statements(spans, position, end):
+            generated, names = IncrementalCompiler.compile_statement(tokens, symbol_table)
+            units.append(Unit(unit_start, unit_end, generated, names))
+            self.statistics["regenerated_statements"] += 1
+        return symbol_table, units
+
+    @staticmethod
+    def statements(spans: List[Tuple[Token, int, int]], position: int,
+                   end: int) -> Iterator[Tuple[List[Token], int, int]]:
+        """
+        Splits scanned tokens into statements, each starting at a PRINT or at an ID followed by
+        an ASSIGN.
+        :return: an iterator over the tokens, start and end of each statement
+        """
+        starts = [index for index in range(position, len(spans))
+                  if spans[index][0].type == Tokens.PRINT
+                  or (spans[index][0].type == Tokens.ID and index + 1 < len(spans)
+                      and spans[index + 1][0].type == Tokens.ASSIGN)]
+        if starts and starts[0] != position or not starts and position < len(spans):
+            starts.insert(0, position)
+        for number, index in enumerate(starts):
+            following = starts[number + 1] if number + 1 < len(starts) else len(spans)
+            unit_end = spans[following][1] if following < len(spans) else end
+            yield [token for token, _, _ in spans[index:following]], spans[index][1], unit_end
+
+    @staticmethod
+    def compile_statement(tokens: List[Token],
+                          symbol_table: SymbolTable) -> Tuple[List[str], Set[str]]:
+        """
+        Parses, analyses and generates dc code for a single statement.
+        :param tokens: the tokens of the statement
+        :param symbol_table: the symbol table holding the declarations of the program
+        :return: the generated dc code and the names referenced by the statement
+        """
+        parser = IterativeParser(iter(tokens + [Token(Tokens.END)]))
+        parser.ast = AST()
+        statement = parser.parse_statement(parser.ast.root)
+        parser.expect(Tokens.END)
+        analyser = SemanticAnalyser(parser.ast)
+        analyser.symbol_table = symbol_table
+        analyser.analyse_single_pass()
+
+        names = {token.value for token in tokens if token.type == Tokens.ID}
+        if statement.type == Tokens.PRINT:
+            names.add(statement.value)
+        return IterativeCodeGenerator(parser.ast).generate(), names
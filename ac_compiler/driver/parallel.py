@@ -0,0 +1,180 @@
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from os import cpu_count
+from typing import List, Optional, Tuple, Union
+from ..generator import IterativeCodeGenerator, PeepholeOptimiser, render_script
+from ..parser import AST, IterativeParser
+from ..parser.iterative_parser import DECLARATION_SET, STATEMENT_SET
+from ..scanner import Tokens, iter_tokens
+from ..scanner.regex_scanner import scan_token_spans
+from ..semantic import SemanticAnalyser, SymbolTable
+from ..util.error import Error
+from .pipeline import WHOLE_PROGRAM_LEVEL, compile_source, declare, optimise
+
+# Programs shorter than this (in characters) are compiled serially
+MIN_PARALLEL_LENGTH = 64 * 1024
+
+
+def free_threaded() -> bool:
+    """
+    :return: whether Python is running without the global interpreter lock
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def split_declarations(source: str) -> Tuple[SymbolTable, int]:
+    """
+    Scans and analyses the declaration block at the start of a program.
+    :param source: the source text of the program
+    :return: the (frozen) symbol table of the declarations, and the index of the source at
+             which the statements start
+    """
+    tokens = list()
+    spans = scan_token_spans(source)
+    for token, start, _ in spans:
+        if token.type not in DECLARATION_SET:
+            return declare(tokens).freeze(), start
+        tokens.append(token)
+        # The identifier of a declaration may not be a declaration keyword itself
+        identifier = next(spans, None)
+        if identifier is not None:
+            tokens.append(identifier[0])
+    return declare(tokens).freeze(), len(source)
+
+
+def statement_start(source: str, position: int) -> int:
+    """
+    Finds the start of the first statement at or after a position in the statements of a
+    program. The position may fall inside a numeral, but numerals never start statements.
+    :param source: the source text of the program
+    :param position: the position to search from
+    :return: the index of the start of the statement, or the length of the source if there is
+             none
+    """
+    previous, previous_start = None, 0
+    for token, start, _ in scan_token_spans(source, position):
+        if token.type == Tokens.PRINT:
+            return start
+        if token.type == Tokens.ASSIGN and previous is Tokens.ID:
+            return previous_start
+        previous, previous_start = token.type, start
+    return len(source)
+
+
+def compile_statements(source: str, symbol_table: SymbolTable,
+                       level: int = 0) -> Union[str, List[str]]:
+    """
+    Compiles a run of whole statements of a program against the symbol table of its
+    declarations. Used by the workers of ParallelCompiler.
+    :param source: the source text of the statements
+    :param symbol_table: the frozen symbol table of the declarations of the program
+    :param level: the optimisation level
+    :return: the dc program text of the statements (without a newline) if unoptimised, or
+             the list of dc code for the peephole optimiser (which works across statements)
+    """
+    parser = IterativeParser(iter_tokens(source))
+    parser.ast = AST()
+    while parser.peek().type in STATEMENT_SET:
+        parser.parse_statement(parser.ast.root)
+    parser.expect(Tokens.END)
+    analyser = SemanticAnalyser(parser.ast)
+    analyser.symbol_table = symbol_table
+    analyser.analyse_single_pass()
+    generated = IterativeCodeGenerator(optimise(parser.ast, level)).generate()
+    return render_script(generated)[:-1] if level == 0 else generated
+
+
+class ParallelCompiler:
+    """
+    Compiles single large programs in parallel. After the declarations, ac statements are
+    independent, so the statements are split into chunks at statement boundaries (found by
+    scanning only a few tokens around each split point), and each chunk is scanned, parsed,
+    analysed against the frozen symbol table of the declarations and generated by a worker.
+    The code of the chunks is concatenated in order, giving the same dc program as
+    compile_source. Workers are processes, or threads on free-threaded builds of Python.
+    Optimisation passes over the whole program cannot be split, so programs are compiled
+    serially at those levels.
+    """
+    def __init__(self, workers: Optional[int] = None, chunks_per_worker: int = 4,
+                 level: int = 0, threads: Optional[bool] = None,
+                 min_length: int = MIN_PARALLEL_LENGTH):
+        """
+        :param workers: the number of workers (default: one per CPU)
+        :param chunks_per_worker: the number of chunks to split the statements into per
+                                  worker, to balance the load
+        :param level: the optimisation level
+        :param threads: whether to use threads rather than processes (default: only when
+                        free-threaded)
+        :param min_length: the length of source below which programs are compiled serially
+        """
+        self.workers = workers or cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.level = level
+        self.threads = free_threaded() if threads is None else threads
+        self.min_length = min_length
+        self.executor: Optional[Executor] = None
+
+    def __enter__(self) -> "ParallelCompiler":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def pool(self) -> Executor:
+        """
+        :return: the pool of workers, started on first use and kept for later programs
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers) if self.threads \
+                else ProcessPoolExecutor(self.workers)
+        return self.executor
+
+    def split(self, source: str, start: int) -> List[Tuple[int, int]]:
+        """
+        Splits the statements of a program into chunks of roughly equal length.
+        :param source: the source text of the program
+        :param start: the index at which the statements start
+        :return: the start and end of each chunk
+        """
+        count = self.workers * self.chunks_per_worker
+        step = max((len(source) - start) // count, 1)
+        boundaries = [start]
+        for position in range(start + step, len(source), step):
+            boundary = statement_start(source, max(position, boundaries[-1] + 1))
+            if boundary >= len(source):
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+        boundaries.append(len(source))
+        return list(zip(boundaries, boundaries[1:]))
+
+    def compile(self, source: str) -> str:
+        """
+        Compiles a program to dc.
+        :param source: the source text of the program
+        :return: the text of the dc program
+        """
+        if len(source) < self.min_length or self.workers == 1 \
+                or self.level >= WHOLE_PROGRAM_LEVEL:
+            return compile_source(source, self.level)
+        try:
+            symbol_table, start = split_declarations(source)
+            chunks = self.split(source, start)
+            futures = [self.pool().submit(compile_statements, source[begin:end], symbol_table,
+                                          self.level)
+                       for begin, end in chunks]
+            results = [future.result() for future in futures]
+        except Error:
+            # Report the error exactly as the serial compiler would
+            return compile_source(source, self.level)
+
+        if self.level == 0:
+            return " ".join(result for result in results if result) + "\n"
+        generated = [code for result in results for code in result]
+        return render_script(PeepholeOptimiser(generated, self.level).optimise())
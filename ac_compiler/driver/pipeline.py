@@ -0,0 +1,162 @@
+from typing import Iterable, List, Union
+from ..generator import IterativeCodeGenerator, PeepholeOptimiser, render_script
+from ..generator.stack_generator import StackSchedulingGenerator
+from ..generator.streaming_generator import DEFAULT_BUFFER_SIZE, Sink, StreamingCodeGenerator
+from ..optimiser import ConstantFolder, DeadStoreEliminator, ValueNumbering
+from ..parser import AST, IterativeParser
+from ..parser.iterative_parser import DECLARATION_SET, STATEMENT_SET
+from ..scanner import Token, Tokens, iter_tokens
+from ..scanner.stream import Source
+from ..semantic import SemanticAnalyser, SymbolTable
+from ..trace.tracer import NULL_TRACER, Tracer
+
+
+# The optimisation level from which passes analyse the program as a whole
+WHOLE_PROGRAM_LEVEL = 3
+
+
+def count_nodes(ast: AST) -> int:
+    count, stack = 0, list(ast.children)
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+def analyse(source: Source, tracer: Tracer = NULL_TRACER) -> AST:
+    """
+    Scans, parses and analyses a program.
+    :param source: anything accepted by iter_tokens (source text, bytes, a stream or a path)
+    :param tracer: the tracer measuring each phase; when enabled the source is scanned in
+                   full before parsing, so that the two phases can be measured separately
+    :return: the analysed AST
+    """
+    tokens = iter_tokens(source)
+    if tracer.enabled:
+        with tracer.phase("scan") as phase:
+            tokens = list(tokens)
+            phase.count("tokens", len(tokens))
+
+    with tracer.phase("parse") as phase:
+        parser = IterativeParser(tokens)
+        parser.parse()
+        if tracer.enabled:
+            phase.count("nodes", lambda: count_nodes(parser.ast))
+
+    with tracer.phase("analyse") as phase:
+        analyser = SemanticAnalyser(parser.ast)
+        analyser.analyse_single_pass()
+        phase.count("lookups", analyser.symbol_table.lookups)
+    return analyser.ast
+
+
+def declare(tokens: Iterable[Token]) -> SymbolTable:
+    """
+    Parses and analyses a declaration block on its own.
+    :param tokens: the tokens of the declarations (without an END token)
+    :return: the symbol table of the declarations
+    """
+    parser = IterativeParser(list(tokens) + [Token(Tokens.END)])
+    parser.ast = AST()
+    while parser.peek().type in DECLARATION_SET:
+        parser.parse_declaration(parser.ast.root)
+    parser.expect(Tokens.END)
+    return SemanticAnalyser(parser.ast).analyse_single_pass()
+
+
+def optimise(ast: AST, level: int, tracer: Tracer = NULL_TRACER) -> AST:
+    """
+    Runs the AST optimisation passes enabled at the given level.
+    :param ast: the analysed AST
+    :param level: the optimisation level (0 disables optimisation, and 3 enables the passes
+                  over the whole program)
+    :param tracer: the tracer measuring each pass
+    :return: the optimised AST
+    """
+    if level >= 1:
+        with tracer.phase("fold") as phase:
+            folder = ConstantFolder(ast)
+            ast = folder.fold()
+            phase.count("removed_nodes", folder.removed)
+    if level >= WHOLE_PROGRAM_LEVEL:
+        with tracer.phase("dead_stores") as phase:
+            eliminator = DeadStoreEliminator(ast)
+            ast = eliminator.eliminate()
+            phase.count("removed_statements", eliminator.removed_statements)
+            phase.count("removed_declarations", eliminator.removed_declarations)
+            phase.count("removed_instructions", eliminator.removed_instructions)
+        with tracer.phase("value_numbering") as phase:
+            numbering = ValueNumbering(ast)
+            ast = numbering.number()
+            phase.count("reused", numbering.reused)
+            phase.count("temporaries", numbering.temporaries)
+    return ast
+
+
+def generate(ast: AST, level: int = 0, tracer: Tracer = NULL_TRACER) -> List[str]:
+    """
+    Generates dc code for an analysed AST, optimised at the given level.
+    :param ast: the analysed AST
+    :param level: the optimisation level (0 disables optimisation)
+    :param tracer: the tracer measuring each phase
+    :return: the list of generated dc instructions
+    """
+    ast = optimise(ast, level, tracer)
+    with tracer.phase("generate") as phase:
+        scheduling = level >= WHOLE_PROGRAM_LEVEL
+        generator = (StackSchedulingGenerator if scheduling else IterativeCodeGenerator)(ast)
+        generated = generator.generate()
+        phase.count("instructions", len(generated))
+        if scheduling:
+            phase.count("removed_loads", generator.removed_loads)
+            phase.count("removed_stores", generator.removed_stores)
+    with tracer.phase("peephole") as phase:
+        peephole = PeepholeOptimiser(generated, level)
+        generated = peephole.optimise()
+        phase.count("removed_instructions", peephole.removed)
+    return generated
+
+
+def compile_source(source: Source, level: int = 0, tracer: Tracer = NULL_TRACER) -> str:
+    """
+    Compiles an ac program to a dc program.
+    :param source: anything accepted by iter_tokens (source text, bytes, a stream or a path)
+    :param level: the optimisation level (0 disables optimisation)
+    :param tracer: the tracer measuring each phase (by default, none)
+    :return: the text of the dc program
+    """
+    with tracer.phase("compile"):
+        return render_script(generate(analyse(source, tracer), level, tracer))
+
+
+def compile_stream(source: Source, sink: Union[Sink, object],
+                   buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """
+    Compiles an ac program to a dc program written to a sink, in memory bounded independently
+    of the length of the program: the source is scanned in chunks, and each statement is
+    parsed, analysed and generated on its own and discarded once its code is written. The
+    output is the same as that of compile_source (without optimisation). If the program has
+    an error, the code of the statements before it will already have been written.
+    :param source: anything accepted by iter_tokens (source text, bytes, a stream or a path)
+    :param sink: a text or binary stream, or a socket, to write the dc program to
+    :param buffer_size: the number of characters to buffer before writing to the sink
+    :return: the number of characters written
+    """
+    parser = IterativeParser(iter_tokens(source))
+    parser.ast = AST()
+    root = parser.ast.root
+    parser.parse_declarations()
+    analyser = SemanticAnalyser(parser.ast)
+    analyser.analyse_single_pass()
+    root.children.clear()
+
+    generator = StreamingCodeGenerator(parser.ast, sink, buffer_size)
+    while parser.peek().type in STATEMENT_SET:
+        statement = parser.parse_statement(root)
+        analyser.analyse_single_pass()
+        generator.generate_statement(statement)
+        root.children.clear()
+    parser.expect(Tokens.END)
+    generator.close()
+    return generator.writer.written
@@ -0,0 +1 @@
+from .evaluator import Evaluator
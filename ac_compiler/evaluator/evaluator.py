@@ -0,0 +1,85 @@
+import sys
+from decimal import Decimal
+from typing import Dict, List, TextIO
+from ..parser.ast import AST, Node
+from ..scanner.tokens import Tokens
+from ..util import add, format_dc, subtract
+from ..util.numeric import Number
+
+
+class Evaluator:
+    """
+    Runs an analysed AST of the ac language in-process, printing exactly what dc prints for
+    the code generated from it. Arithmetic is exact: integers are Python ints and floats are
+    Decimals, and sums and differences keep the larger scale of their operands, as in dc.
+    """
+    def __init__(self, ast: AST, output: TextIO = None):
+        self.ast = ast
+        self.output = output if output is not None else sys.stdout
+        self.registers: Dict[str, Number] = dict()
+        self.constants: Dict[float, Number] = dict()
+
+    def load(self, name: str) -> Number:
+        """
+        Gets the value currently held by a variable, which is 0 until it is assigned, as dc
+        loads 0 from a register which was never stored to.
+        :param name: the name of the variable
+        :return: the value of the variable
+        """
+        return self.registers.get(name, 0)
+
+    def constant(self, node: Node) -> Number:
+        """
+        Gets the exact value of a constant node, converting (and caching, by value, as nodes
+        of a CompactAST are transient views) float values as Decimals.
+        :param node: the constant node
+        :return: the value of the constant
+        """
+        value = node.value
+        if isinstance(value, float):
+            value = self.constants.get(node.value)
+            if value is None:
+                value = self.constants[node.value] = Decimal(repr(node.value))
+        return value
+
+    def evaluate(self, node: Node) -> Number:
+        """
+        Evaluates an expression by visiting its nodes in post-order with an explicit stack.
+        :param node: the root node of the expression
+        :return: the value of the expression
+        """
+        # Children are pushed left to right, so the reversed pre-order is the post-order
+        preorder = list()
+        stack = [node]
+        while stack:
+            top = stack.pop()
+            preorder.append(top)
+            stack.extend(top.get_children())
+
+        values: List[Number] = list()
+        for top in reversed(preorder):
+            type_ = top.type
+            if type_ == Tokens.ID:
+                values.append(self.load(top.value))
+            elif type_ == Tokens.PLUS:
+                right = values.pop()
+                values.append(add(values.pop(), right))
+            elif type_ == Tokens.MINUS:
+                right = values.pop()
+                values.append(subtract(values.pop(), right))
+            elif type_ == Tokens.INUM or type_ == Tokens.FNUM:
+                values.append(self.constant(top))
+        return values.pop()
+
+    def run(self) -> Dict[str, Number]:
+        """
+        Runs every statement of the program in order.
+        :return: the final values of the program's variables
+        """
+        write = self.output.write
+        for statement in self.ast.root.get_children():
+            if statement.type == Tokens.ASSIGN:
+                self.registers[statement.left().value] = self.evaluate(statement.right())
+            elif statement.type == Tokens.PRINT:
+                write(format_dc(self.load(statement.value)) + "\n")
+        return self.registers
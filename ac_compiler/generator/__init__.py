@@ -1 +1,18 @@
-from .generator import CodeGenerator
+from ..util.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "CodeGenerator": ".generator",
+    "CGenerator": ".c_generator",
+    "IterativeCodeGenerator": ".iterative_generator",
+    "PeepholeOptimiser": ".peephole",
+    "PythonGenerator": ".python_generator",
+    "PythonProgram": ".python_generator",
+    "StackSchedulingGenerator": ".stack_generator",
+    "compile_python": ".python_generator",
+    "DcWriter": ".streaming_generator",
+    "StreamingCodeGenerator": ".streaming_generator",
+    "render_script": ".script",
+    "run_dc": ".script",
+    "CToolchain": ".toolchain",
+    "compare_with_legacy": ".verify",
+})
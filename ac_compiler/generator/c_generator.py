@@ -0,0 +1,162 @@
+from typing import Dict, List, Set, Tuple
+from ..parser.ast import AST, Node
+from ..scanner.tokens import Tokens
+from ..semantic.symbol_table import DataType
+from ..util import scale, to_decimal
+from ..util.numeric import DC_LINE_LENGTH, Number
+
+
+RUNTIME = r"""#include <stdio.h>
+#include <string.h>
+
+/* Prints a value the way dc does: no leading zero before the decimal point, zero printed
+ * as 0 whatever its scale, and long numbers wrapped with a backslash. */
+static void ac_print_text(const char *text) {
+    size_t length = strlen(text), column = 0, index;
+    for (index = 0; index < length; index++) {
+        if (++column >= DC_LINE_LENGTH) {
+            fputs("\\\n", stdout);
+            column = 1;
+        }
+        putchar(text[index]);
+    }
+    putchar('\n');
+}
+
+static void ac_print_long(long value) {
+    char buffer[32];
+    snprintf(buffer, sizeof buffer, "%ld", value);
+    ac_print_text(buffer);
+}
+
+static void ac_print_double(double value, int scale) {
+    char buffer[512];
+    char *text = buffer, *digit;
+    int zero = 1;
+    snprintf(buffer, sizeof buffer, "%.*f", scale, value);
+    for (digit = buffer; *digit; digit++) {
+        if (*digit >= '1' && *digit <= '9') {
+            zero = 0;
+        }
+    }
+    if (zero) {
+        ac_print_text("0");
+        return;
+    }
+    if (text[0] == '-') {
+        text++;
+    }
+    if (text[0] == '0' && text[1] == '.') {
+        text++;
+    }
+    if (buffer[0] == '-') {
+        *--text = '-';
+    }
+    ac_print_text(text);
+}
+"""
+
+
+class CGenerator:
+    """
+    Generates a self-contained C program from an analysed AST of the ac language. INT values
+    are longs and FLOAT values are doubles. ac has no control flow, so the dc scale of every
+    value is known statically and floats are printed with exactly the digits dc would print.
+    Unlike dc, longs overflow beyond 64 bits, doubles round beyond 15-17 significant digits,
+    and unassigned variables read as zero.
+    """
+    def __init__(self, ast: AST):
+        self.ast = ast
+        self.lines: List[str] = list()
+        self.types: Dict[str, DataType] = dict()
+        self.scales: Dict[str, int] = dict()
+        self.temporaries: Set[str] = set()
+
+    @staticmethod
+    def variable(name: str) -> str:
+        return f"v_{name}"
+
+    @staticmethod
+    def constant(value: Number, datatype: DataType) -> str:
+        """
+        Formats a constant as a C literal of the given type.
+        :param value: the value of the constant
+        :param datatype: the datatype of the constant
+        :return: the C literal
+        """
+        if datatype == DataType.INT:
+            text = f"{value}L"
+        else:
+            text = format(to_decimal(value), "f")
+            text = text if "." in text else text + ".0"
+        return f"({text})" if text.startswith("-") else text
+
+    def emit(self, line: str) -> None:
+        """
+        Appends a statement to the body of main.
+        :param line: the line of C code
+        """
+        self.lines.append(f"    {line}")
+
+    def visit_expression(self, node: Node) -> Tuple[str, int]:
+        """
+        Generates the code for an expression by visiting its nodes in post-order, flattening
+        operations into assignments to temporaries.
+        :param node: the root node of the expression
+        :return: the C expression holding the value of the ac expression, and its scale
+        """
+        # Children are pushed left to right, so the reversed pre-order is the post-order
+        preorder = list()
+        stack = [node]
+        while stack:
+            top = stack.pop()
+            preorder.append(top)
+            stack.extend(top.get_children())
+
+        operands = list()
+        for top in reversed(preorder):
+            if top.type == Tokens.ID:
+                operands.append((CGenerator.variable(top.value), self.scales.get(top.value, 0)))
+            elif top.type in (Tokens.INUM, Tokens.FNUM):
+                datatype = DataType.INT if isinstance(top.value, int) else DataType.FLOAT
+                operands.append((CGenerator.constant(top.value, datatype), scale(top.value)))
+            elif top.type in (Tokens.PLUS, Tokens.MINUS):
+                (right, right_scale), (left, left_scale) = operands.pop(), operands.pop()
+                prefix = "_n" if top.datatype == DataType.INT else "_d"
+                target = f"{prefix}{len(operands)}"
+                self.temporaries.add(target)
+                operator = "+" if top.type == Tokens.PLUS else "-"
+                self.emit(f"{target} = {left} {operator} {right};")
+                operands.append((target, max(left_scale, right_scale)))
+        return operands.pop()
+
+    def generate(self) -> str:
+        """
+        Generates the C source of the program.
+        :return: the source of a complete C program
+        """
+        for statement in self.ast.root.get_children():
+            if statement.type in (Tokens.FLOATDCL, Tokens.INTDCL):
+                name = statement.value.value
+                self.types[name] = (DataType.FLOAT if statement.type == Tokens.FLOATDCL
+                                    else DataType.INT)
+            elif statement.type == Tokens.ASSIGN:
+                target = statement.left()
+                self.types.setdefault(target.value, target.datatype)
+                value, value_scale = self.visit_expression(statement.right())
+                self.emit(f"{CGenerator.variable(target.value)} = {value};")
+                self.scales[target.value] = value_scale
+            elif statement.type == Tokens.PRINT:
+                name = CGenerator.variable(statement.value)
+                if self.types.get(statement.value) == DataType.FLOAT:
+                    self.emit(f"ac_print_double({name}, {self.scales.get(statement.value, 0)});")
+                else:
+                    self.emit(f"ac_print_long({name});")
+
+        declarations = [f"    {'double' if type_ == DataType.FLOAT else 'long'} "
+                        f"{CGenerator.variable(name)} = 0;" for name, type_ in self.types.items()]
+        declarations.extend([f"    {'long' if name.startswith('_n') else 'double'} {name};"
+                             for name in sorted(self.temporaries)])
+        return "\n".join([f"#define DC_LINE_LENGTH {DC_LINE_LENGTH}", RUNTIME,
+                          "int main(void) {"] + declarations + self.lines
+                         + ["    return 0;", "}", ""])
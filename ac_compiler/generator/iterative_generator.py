@@ -0,0 +1,127 @@
+from typing import Callable, Dict, List
+from ..parser.ast import AST, Node
+from ..scanner.tokens import Tokens
+from ..util import dc_literal
+
+
+class IterativeCodeGenerator:
+    """
+    Generates code for the dc language from an analysed AST of the ac language.
+    Every node is visited exactly once: statements are dispatched through a table keyed by
+    Tokens, and expressions are emitted in post-order from an explicit stack, so the size and
+    cost of generation are linear in the size of the AST.
+    Register commands are emitted together with their register (e.g. "sa" rather than "s",
+    "a"), so the generated list joined with spaces is a valid dc program.
+    """
+    STATEMENT_VISITORS = {
+        Tokens.ASSIGN: "visit_assignment",
+        Tokens.PRINT: "visit_print",
+        Tokens.FLOATDCL: "visit_declaration",
+        Tokens.INTDCL: "visit_declaration",
+    }
+    EXPRESSION_VISITORS = {
+        Tokens.PLUS: "visit_computation",
+        Tokens.MINUS: "visit_computation",
+        Tokens.ID: "visit_reference",
+        Tokens.INUM: "visit_constant",
+        Tokens.FNUM: "visit_constant",
+        Tokens.CONVERT: "visit_convert",
+    }
+
+    def __init__(self, ast: AST):
+        self.ast = ast
+        self.generated = list()
+        self.statement_dispatch: Dict[Tokens, Callable[[Node], None]] = {
+            type_: getattr(self, name) for type_, name in self.STATEMENT_VISITORS.items()}
+        self.expression_dispatch: Dict[Tokens, Callable[[Node], None]] = {
+            type_: getattr(self, name) for type_, name in self.EXPRESSION_VISITORS.items()}
+
+    def visit_declaration(self, node: Node) -> None:
+        """
+        Visits a declaration node, which needs no dc code.
+        :param node: the declaration node to visit
+        """
+
+    def visit_assignment(self, node: Node) -> None:
+        """
+        Visits an assignment node and emits dc code for that assignment
+        :param node: the assignment node to visit and emit dc code for
+        """
+        self.visit_expression(node.right())
+        self.emit(f"s{node.left().value}")
+        self.emit("0 k")
+
+    def visit_print(self, node: Node) -> None:
+        """
+        Visits a print node and emits the value of the symbol referenced in that node
+        :param node: the print node to visit and emit dc code for
+        """
+        self.emit(f"l{node.value}")
+        self.emit("p")
+        self.emit("si")
+
+    def visit_expression(self, node: Node) -> None:
+        """
+        Emits dc code for an expression by visiting its nodes in post-order.
+        :param node: the root node of the expression
+        """
+        # Children are pushed left to right, so the reversed pre-order is the post-order
+        preorder = list()
+        stack = [node]
+        while stack:
+            top = stack.pop()
+            preorder.append(top)
+            stack.extend(top.get_children())
+
+        dispatch = self.expression_dispatch
+        for top in reversed(preorder):
+            visitor = dispatch.get(top.type)
+            if visitor:
+                visitor(top)
+
+    def visit_computation(self, node: Node) -> None:
+        """
+        Visits a computation node (whose operands have already been emitted) and emits its
+        operator
+        :param node: the computation node to visit and emit dc code for
+        """
+        self.emit("+" if node.type == Tokens.PLUS else "-")
+
+    def visit_reference(self, node: Node) -> None:
+        """
+        Visits a reference node and emits a load of the referenced register
+        :param node: the reference node to visit and emit dc code for
+        """
+        self.emit(f"l{node.value}")
+
+    def visit_convert(self, node: Node) -> None:
+        """
+        Visits a convert node (whose child has already been emitted) and emits dc code to
+        change the precision level to five decimal places.
+        :param node: the convert node to visit and emit dc code for
+        """
+        self.emit("5 k")
+
+    def visit_constant(self, node: Node) -> None:
+        """
+        Visits a constant node and emits its value as a dc numeral.
+        :param node: the constant node to visit and emit dc code for
+        """
+        self.emit(dc_literal(node.value))
+
+    def emit(self, code: str) -> None:
+        """
+        Append generated code to the list of produced code.
+        :param code: the code string to append to the list of generated code
+        """
+        self.generated.append(code)
+
+    def generate(self) -> List[str]:
+        """
+        Generate dc code from the AST produced by the parser
+        :return: the list of generated dc code statements
+        """
+        dispatch = self.statement_dispatch
+        for statement in self.ast.root.get_children():
+            dispatch[statement.type](statement)
+        return self.generated
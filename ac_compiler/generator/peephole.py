@@ -0,0 +1,61 @@
+from re import compile as compile_pattern
+from typing import Iterable, List, Union
+from .script import normalise
+
+
+PRECISION = compile_pattern(r"([0-9]+) k")
+INITIAL_PRECISION = 0
+
+
+class PeepholeOptimiser:
+    """
+    Removes redundant instructions from generated dc code, looking at a small window of
+    instructions while tracking the precision (k) register and the effect of each
+    instruction on the stack.
+
+    Level 1 removes:
+      - precision changes to the precision already in effect,
+      - loads immediately stored back to the same register (lx sx),
+    and replaces a store immediately reloaded from the same register (sx lx) with a
+    duplicate and store (d sx).
+    Level 2 additionally assumes the code is stack-balanced per statement, as generated
+    code is, and removes:
+      - every precision change, as ac only adds and subtracts, which ignore precision,
+      - the discarding store following a print (p si), leaving the printed value on the
+        stack where no later instruction will reach it.
+    """
+    def __init__(self, generated: Iterable[Union[str, int, float]], level: int = 1):
+        self.generated = normalise(generated)
+        self.level = level
+        self.removed = 0
+
+    def optimise(self) -> List[str]:
+        """
+        Optimises the generated code at the configured level.
+        :return: the optimised list of instructions
+        """
+        if self.level < 1:
+            return self.generated
+
+        aggressive = self.level >= 2
+        precision = INITIAL_PRECISION
+        optimised = list()
+        for code in self.generated:
+            previous = optimised[-1] if optimised else ""
+            match = PRECISION.fullmatch(code)
+            if match:
+                if aggressive or int(match.group(1)) == precision:
+                    continue
+                precision = int(match.group(1))
+            elif len(code) == 2 and code[0] == "s" and previous == f"l{code[1]}":
+                optimised.pop()
+                continue
+            elif len(code) == 2 and code[0] == "l" and previous == f"s{code[1]}":
+                optimised[-1] = "d"
+                code = previous
+            elif aggressive and code == "si" and previous == "p":
+                continue
+            optimised.append(code)
+
+        self.removed = len(self.generated) - len(optimised)
+        return optimised
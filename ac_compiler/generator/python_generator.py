@@ -0,0 +1,164 @@
+import sys
+from collections import OrderedDict
+from hashlib import sha256
+from types import CodeType
+from typing import Dict, List, TextIO
+from ..parser import IterativeParser
+from ..parser.ast import AST, Node
+from ..scanner import Tokens, iter_tokens
+from ..semantic import SemanticAnalyser
+from ..semantic.symbol_table import DataType
+from ..util import format_dc, to_decimal
+from ..util.numeric import EXACT, Number
+
+
+class PythonGenerator:
+    """
+    Generates Python source from an analysed AST of the ac language. The program becomes a
+    single function in which ac variables are local variables, integer arithmetic uses
+    Python's operators and float arithmetic uses exact Decimal operations, so the printed
+    output matches dc's. Expressions are flattened into assignments to stack temporaries,
+    so arbitrarily long chains compile without deep nesting. Declared variables start as 0,
+    as dc loads 0 from a register which was never stored to.
+    """
+    FUNCTION = "program"
+
+    def __init__(self, ast: AST):
+        self.ast = ast
+        self.lines: List[str] = list()
+        self.constants: List[Number] = list()
+        self.constant_names: Dict[Number, str] = dict()
+        self.declared: List[str] = list()
+
+    @staticmethod
+    def variable(name: str) -> str:
+        return f"v_{name}"
+
+    def constant(self, value: Number) -> str:
+        """
+        Finds the Python expression for a constant. Integers are written as literals, and
+        Decimals are hoisted into locals unpacked from the constants argument.
+        :param value: the value of the constant
+        :return: the Python expression for the constant
+        """
+        if isinstance(value, int):
+            return f"({value})" if value < 0 else str(value)
+        value = to_decimal(value)
+        name = self.constant_names.get(value)
+        if name is None:
+            name = self.constant_names[value] = f"_c{len(self.constants)}"
+            self.constants.append(value)
+        return name
+
+    def emit(self, line: str) -> None:
+        """
+        Appends a line to the body of the generated function.
+        :param line: the line of Python code
+        """
+        self.lines.append(f"    {line}")
+
+    def visit_expression(self, node: Node) -> str:
+        """
+        Generates the code for an expression by visiting its nodes in post-order.
+        :param node: the root node of the expression
+        :return: the Python expression holding the value of the ac expression
+        """
+        # Children are pushed left to right, so the reversed pre-order is the post-order
+        preorder = list()
+        stack = [node]
+        while stack:
+            top = stack.pop()
+            preorder.append(top)
+            stack.extend(top.get_children())
+
+        operands: List[str] = list()
+        for top in reversed(preorder):
+            if top.type == Tokens.ID:
+                operands.append(PythonGenerator.variable(top.value))
+            elif top.type in (Tokens.INUM, Tokens.FNUM):
+                operands.append(self.constant(top.value))
+            elif top.type in (Tokens.PLUS, Tokens.MINUS):
+                right, left = operands.pop(), operands.pop()
+                target = f"_s{len(operands)}"
+                if top.datatype == DataType.INT:
+                    operator = "+" if top.type == Tokens.PLUS else "-"
+                    self.emit(f"{target} = {left} {operator} {right}")
+                else:
+                    function = "_add" if top.type == Tokens.PLUS else "_subtract"
+                    self.emit(f"{target} = {function}({left}, {right})")
+                operands.append(target)
+        return operands.pop()
+
+    def generate(self) -> str:
+        """
+        Generates the Python source of the program.
+        :return: the source of a module defining the program function
+        """
+        for statement in self.ast.root.get_children():
+            if statement.type in (Tokens.FLOATDCL, Tokens.INTDCL):
+                self.declared.append(PythonGenerator.variable(statement.value.value))
+            elif statement.type == Tokens.ASSIGN:
+                value = self.visit_expression(statement.right())
+                self.emit(f"{PythonGenerator.variable(statement.left().value)} = {value}")
+            elif statement.type == Tokens.PRINT:
+                self.emit(f"_print({PythonGenerator.variable(statement.value)})")
+
+        header = [f"def {self.FUNCTION}(_add, _subtract, _print, _constants):"]
+        if self.constants:
+            header.append(f"    {', '.join(self.constant_names.values())}, = _constants")
+        if self.declared:
+            header.append(f"    {' = '.join(self.declared)} = 0")
+        return "\n".join(header + self.lines + ["    return None", ""])
+
+
+class PythonProgram:
+    """
+    An ac program compiled to a Python code object, along with its constant pool.
+    """
+    def __init__(self, code: CodeType, constants: List[Number]):
+        self.code = code
+        self.constants = tuple(constants)
+
+    def run(self, output: TextIO = None) -> None:
+        """
+        Runs the program, printing to output (stdout by default) exactly what dc prints.
+        :param output: the stream to print to
+        """
+        write = (output if output is not None else sys.stdout).write
+        namespace = dict()
+        exec(self.code, namespace)
+        namespace[PythonGenerator.FUNCTION](EXACT.add, EXACT.subtract,
+                                            lambda value: write(format_dc(value) + "\n"),
+                                            self.constants)
+
+
+# The number of compiled programs kept for reuse, as a long-running process (e.g. the compile
+# server) may compile any number of distinct sources
+PROGRAM_CACHE_SIZE = 256
+# Compiled programs by the hash of their source, least recently used first
+PROGRAM_CACHE: OrderedDict = OrderedDict()
+
+
+def compile_python(source: str) -> PythonProgram:
+    """
+    Compiles ac source to a Python code object, reusing the compiled program when a source
+    with the same hash has been compiled recently (the last PROGRAM_CACHE_SIZE are kept).
+    :param source: the ac source text
+    :return: the compiled program
+    """
+    key = sha256(source.encode()).hexdigest()
+    program = PROGRAM_CACHE.get(key)
+    if program is not None:
+        PROGRAM_CACHE.move_to_end(key)
+        return program
+
+    parser = IterativeParser(iter_tokens(source))
+    parser.parse()
+    analyser = SemanticAnalyser(parser.ast)
+    analyser.analyse_single_pass()
+    generator = PythonGenerator(analyser.ast)
+    code = compile(generator.generate(), f"<ac {key[:12]}>", "exec")
+    program = PROGRAM_CACHE[key] = PythonProgram(code, generator.constants)
+    while len(PROGRAM_CACHE) > PROGRAM_CACHE_SIZE:
+        PROGRAM_CACHE.popitem(last=False)
+    return program
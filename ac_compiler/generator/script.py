@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import Iterable, List, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from subprocess import CompletedProcess
+
+
+REGISTER_COMMANDS = {"l", "s"}
+
+
+def normalise(generated: Iterable[Union[str, int, float]]) -> List[str]:
+    """
+    Converts generated code to one instruction per string, joining a bare register command
+    ("l" or "s", as emitted by CodeGenerator) to the register name which follows it.
+    :param generated: the generated dc code
+    :return: the list of instructions
+    """
+    instructions = list()
+    pending = ""
+    for code in generated:
+        code = str(code)
+        if code in REGISTER_COMMANDS and not pending:
+            pending = code
+            continue
+        instructions.append(pending + code)
+        pending = ""
+    if pending:
+        instructions.append(pending)
+    return instructions
+
+
+def render_script(generated: Iterable[Union[str, int, float]]) -> str:
+    """
+    Joins a list of generated dc code into a single dc program, with the instructions (see
+    normalise) separated by spaces.
+    :param generated: the generated dc code
+    :return: the dc program text
+    """
+    return " ".join(normalise(generated)) + "\n"
+
+
+def run_dc(script: str, executable: str = "dc") -> CompletedProcess:
+    """
+    Runs a dc program with the dc binary, capturing its output.
+    :param script: the dc program text
+    :param executable: the dc binary to run
+    :return: the completed process, with text stdout and stderr
+    """
+    from subprocess import run  # Deferred, as only running dc needs the (slow) import
+    return run([executable], input=script, capture_output=True, text=True, check=False)
@@ -0,0 +1,138 @@
+from typing import List, Optional
+from ..optimiser.dead_store import Liveness
+from ..parser.ast import AST, Node
+from ..scanner.tokens import Tokens
+from .iterative_generator import IterativeCodeGenerator
+
+
+class StackSchedulingGenerator(IterativeCodeGenerator):
+    """
+    Generates dc code like IterativeCodeGenerator, but leaves the value of an assignment on
+    the stack when the next statement reads the assigned variable, so that statement takes
+    it from the stack rather than loading it. The value is read where the first load would
+    have been: as the first operand, by not loading it, or as the right operand of an
+    operator on the left spine of the expression (where the value sits directly below the
+    accumulated left operand), by adding it, or swapping (r) then subtracting it.
+    Liveness decides whether the variable must still be stored: not if the next statement
+    is its only reader, otherwise it is duplicated (d) and stored.
+    """
+    def __init__(self, ast: AST):
+        super().__init__(ast)
+        self.liveness: Optional[Liveness] = None
+        self.index = 0
+        # The reference (or print) of the next statement which reads the value on the stack
+        self.pending: Optional[Node] = None
+        self.removed_loads = 0
+        self.removed_stores = 0
+
+    @staticmethod
+    def stack_read(statement: Node, name: str) -> Optional[Node]:
+        """
+        Finds the node of a statement which can take the value of a variable from the top of
+        the stack at the start of the statement.
+        :param statement: the statement
+        :param name: the variable
+        :return: the print or reference node reading the variable first, if it can take the
+                 value from the stack
+        """
+        if statement.type == Tokens.PRINT:
+            return statement if statement.value == name else None
+        if statement.type != Tokens.ASSIGN:
+            return None
+
+        # The first reference in post-order is the first load emitted
+        preorder = list()
+        stack = [statement.right()]
+        while stack:
+            node = stack.pop()
+            preorder.append(node)
+            stack.extend(node.children)
+        first = next((node for node in reversed(preorder)
+                      if node.type == Tokens.ID and node.value == name), None)
+        if first is None:
+            return None
+
+        # Nothing may be pending below the operands of the operator reading the value
+        node = first if first.parent is statement or first.parent.left() is first \
+            else first.parent
+        while node.parent is not statement:
+            if node.parent.left() is not node:
+                return None
+            node = node.parent
+        return first
+
+    @staticmethod
+    def reads(statement: Node, name: str) -> int:
+        """
+        :param statement: a statement
+        :param name: a variable
+        :return: the number of times the statement loads the variable
+        """
+        return sum(1 for used in Liveness.uses(statement) if used == name)
+
+    def visit_assignment(self, node: Node) -> None:
+        """
+        Visits an assignment node and emits dc code for that assignment, leaving its value on
+        the stack for the next statement if that reads it.
+        :param node: the assignment node to visit and emit dc code for
+        """
+        self.visit_expression(node.right())
+        name = node.left().value
+        index = self.index
+        statements = self.ast.root.children
+        following = statements[index + 1] if index + 1 < len(statements) else None
+        read = StackSchedulingGenerator.stack_read(following, name) if following else None
+        if read is None:
+            self.emit(f"s{name}")
+        else:
+            self.pending = read
+            self.removed_loads += 1
+            # The variable is still needed if read again, or (unless reassigned) later
+            if StackSchedulingGenerator.reads(following, name) > 1 or (
+                    self.liveness.live_after(index + 1, name)
+                    and Liveness.target(following) != name):
+                self.emit("d")
+                self.emit(f"s{name}")
+            else:
+                self.removed_stores += 1
+        self.emit("0 k")
+
+    def visit_print(self, node: Node) -> None:
+        """
+        Visits a print node and emits the value of the symbol referenced in that node, from
+        the stack if the previous statement left it there.
+        :param node: the print node to visit and emit dc code for
+        """
+        if self.pending is node:
+            self.pending = None
+        else:
+            self.emit(f"l{node.value}")
+        self.emit("p")
+        self.emit("si")
+
+    def visit_reference(self, node: Node) -> None:
+        """
+        Visits a reference node and emits a load of the referenced register, or takes the
+        value from the stack if the previous statement left it there.
+        :param node: the reference node to visit and emit dc code for
+        """
+        if self.pending is not node:
+            self.emit(f"l{node.value}")
+            return
+        self.pending = None
+        parent = node.parent
+        if parent.type == Tokens.MINUS and parent.right() is node:
+            self.emit("r")
+
+    def generate(self) -> List[str]:
+        """
+        Generate dc code from the AST produced by the parser
+        :return: the list of generated dc code statements
+        """
+        statements = self.ast.root.get_children()
+        self.liveness = Liveness(statements)
+        dispatch = self.statement_dispatch
+        for index, statement in enumerate(statements):
+            self.index = index
+            dispatch[statement.type](statement)
+        return self.generated
@@ -0,0 +1,108 @@
+from io import TextIOBase
+from typing import BinaryIO, List, TextIO, Union
+from ..parser.ast import AST, Node
+from .iterative_generator import IterativeCodeGenerator
+
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+Sink = Union[TextIO, BinaryIO]
+
+
+class DcWriter:
+    """
+    Buffered writer of dc code to a text stream, a binary stream (a file, the stdin of a dc
+    subprocess, ...) or a socket. Code is collected until buffer_size characters are pending
+    and then written to the sink in one call. Text written is always ASCII, so the number of
+    characters and bytes buffered is the same.
+    """
+    def __init__(self, sink: Union[Sink, object], buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        :param sink: a text or binary stream, or a socket
+        :param buffer_size: the number of characters to buffer before writing to the sink (0
+                            writes through immediately)
+        """
+        self.sink = sink
+        self.buffer_size = buffer_size
+        self.binary = not (isinstance(sink, TextIOBase) or hasattr(sink, "encoding"))
+        self.send = sink.sendall if hasattr(sink, "sendall") else sink.write
+        self.pending: List[str] = list()
+        self.size = 0
+        self.written = 0
+
+    def write(self, code: str) -> None:
+        self.pending.append(code)
+        self.size += len(code)
+        if self.size >= self.buffer_size:
+            self.flush_buffer()
+
+    def flush_buffer(self) -> None:
+        """
+        Writes the buffered code to the sink (without flushing the sink itself).
+        """
+        if not self.pending:
+            return
+        text = "".join(self.pending)
+        self.send(text.encode("ascii") if self.binary else text)
+        self.written += len(text)
+        self.pending.clear()
+        self.size = 0
+
+    def flush(self) -> None:
+        """
+        Writes the buffered code to the sink and flushes the sink.
+        """
+        self.flush_buffer()
+        if hasattr(self.sink, "flush"):
+            self.sink.flush()
+
+
+class StreamingCodeGenerator(IterativeCodeGenerator):
+    """
+    Generates dc code like IterativeCodeGenerator, but writes it to a sink statement by
+    statement instead of accumulating a list: only the code of the current statement is held
+    before it is handed to a buffered DcWriter. The text written is the same as
+    render_script applied to the list IterativeCodeGenerator generates.
+    Statements can also be fed one at a time with generate_statement (followed by close),
+    so that a program need never be held in memory as a whole.
+    """
+    def __init__(self, ast: AST, sink: Union[Sink, object],
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        :param ast: the analysed AST
+        :param sink: a text or binary stream, or a socket, to write the dc program to
+        :param buffer_size: the number of characters to buffer before writing to the sink
+        """
+        super().__init__(ast)
+        self.writer = DcWriter(sink, buffer_size)
+        self.started = False
+
+    def generate_statement(self, statement: Node) -> None:
+        """
+        Generates the dc code of a statement, and passes it to the writer.
+        :param statement: the (analysed) statement node
+        """
+        self.statement_dispatch[statement.type](statement)
+        if self.generated:
+            if self.started:
+                self.writer.write(" ")
+            self.writer.write(" ".join(self.generated))
+            self.generated.clear()
+            self.started = True
+
+    def close(self) -> None:
+        """
+        Terminates the dc program and flushes it to the sink.
+        """
+        self.writer.write("\n")
+        self.writer.flush()
+
+    def generate(self) -> List[str]:
+        """
+        Writes the dc code of the whole AST to the sink.
+        :return: an empty list, as no code is kept
+        """
+        for statement in self.ast.root.get_children():
+            self.generate_statement(statement)
+        self.close()
+        return self.generated
@@ -0,0 +1,91 @@
+import os
+import stat
+from hashlib import sha256
+from os import close, path, remove, replace
+from subprocess import CompletedProcess, run
+from tempfile import mkstemp
+from typing import Optional, Sequence
+from ..util import BuildError
+from ..util.directories import private_directory, user_cache_directory
+
+
+DEFAULT_CACHE_DIRECTORY = user_cache_directory("binaries")
+
+
+class CToolchain:
+    """
+    Builds C programs with the local system C compiler, caching the built binaries in a
+    directory keyed by the hash of the source, compiler and flags. As cached binaries are
+    run, the directory must be private to the current user.
+    """
+    def __init__(self, cache_directory: Optional[str] = None, compiler: str = "cc",
+                 flags: Sequence[str] = ("-O2",)):
+        self.cache_directory = cache_directory or DEFAULT_CACHE_DIRECTORY
+        self.compiler = compiler
+        self.flags = list(flags)
+        private_directory(self.cache_directory)
+
+    def key(self, source: str) -> str:
+        """
+        Computes the cache key of a C program.
+        :param source: the C source
+        :return: the hex digest identifying the binary built from source
+        """
+        digest = sha256()
+        for part in [self.compiler] + self.flags + [source]:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def build(self, source: str) -> str:
+        """
+        Builds a C program, or finds the binary already built from it.
+        :param source: the C source
+        :return: the path of the built binary
+        """
+        binary = path.join(self.cache_directory, self.key(source))
+        if path.lexists(binary):
+            CToolchain.check(binary)
+            return binary
+
+        descriptor, source_path = mkstemp(suffix=".c", dir=self.cache_directory)
+        close(descriptor)
+        temporary_binary = source_path[:-2]
+        try:
+            with open(source_path, "w") as file:
+                file.write(source)
+            result = run([self.compiler] + self.flags + ["-o", temporary_binary, source_path],
+                         capture_output=True, text=True, check=False)
+            if result.returncode != 0:
+                raise BuildError(f"{self.compiler} failed: {result.stderr.strip()}")
+            # Binaries appear in the cache atomically, so concurrent builds are safe
+            replace(temporary_binary, binary)
+        finally:
+            for leftover in (source_path, temporary_binary):
+                if path.exists(leftover):
+                    remove(leftover)
+        return binary
+
+    @staticmethod
+    def check(binary: str) -> None:
+        """
+        Checks that a cached binary is safe to run: a regular file (not a link) owned by the
+        current user and writable by no one else.
+        :param binary: the path of the binary
+        """
+        status = os.lstat(binary)
+        if not stat.S_ISREG(status.st_mode):
+            raise BuildError(f"Cached binary {binary} is not a regular file")
+        if hasattr(os, "getuid") and status.st_uid != os.getuid():
+            raise BuildError(f"Cached binary {binary} is not owned by the current user")
+        if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise BuildError(f"Cached binary {binary} is writable by other users")
+
+    @staticmethod
+    def run(binary: str) -> CompletedProcess:
+        """
+        Runs a built binary, capturing its output.
+        :param binary: the path of the binary
+        :return: the completed process, with text stdout and stderr
+        """
+        return run([binary], capture_output=True, text=True, check=False)
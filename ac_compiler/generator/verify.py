@@ -0,0 +1,21 @@
+from typing import Optional
+from ..parser.ast import AST
+from .generator import CodeGenerator
+from .iterative_generator import IterativeCodeGenerator
+from .script import render_script, run_dc
+
+
+def compare_with_legacy(ast: AST, executable: str = "dc") -> Optional[bool]:
+    """
+    Checks that the dc code emitted by IterativeCodeGenerator for an analysed AST prints the
+    same results as the code emitted by CodeGenerator, by running both through dc.
+    :param ast: the analysed AST to generate code for
+    :param executable: the dc binary to run
+    :return: whether the printed results match, or None if the legacy output is not correct
+             (i.e. dc reports errors running it) and so cannot be compared against
+    """
+    legacy = run_dc(render_script(CodeGenerator(ast).generate()), executable)
+    if legacy.returncode != 0 or legacy.stderr:
+        return None
+    iterative = run_dc(render_script(IterativeCodeGenerator(ast).generate()), executable)
+    return iterative.returncode == 0 and iterative.stdout == legacy.stdout
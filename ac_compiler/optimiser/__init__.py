@@ -0,0 +1,3 @@
+from .constant_folder import ConstantFolder
+from .dead_store import DeadStoreEliminator, Liveness
+from .value_numbering import ValueNumbering
@@ -0,0 +1,128 @@
+from typing import List, Optional, Tuple
+from ..parser.ast import AST, Node
+from ..scanner.tokens import Tokens
+from ..semantic import COMPUTATION_NODES, CONSTANT_NODES, SemanticAnalyser
+from ..semantic.symbol_table import DataType
+from ..util import add, scale, subtract
+from ..util.numeric import Number
+
+
+class ConstantFolder:
+    """
+    Optimisation pass over an analysed AST, run between SemanticAnalyser.analyse and code
+    generation. Every +/- chain is flattened into its signed operands, the constant operands
+    are folded into a single constant (exactly, as dc would compute them) and the chain is
+    rebuilt with the variable operands first and the folded constant last. Adding or
+    subtracting an integer zero is dropped altogether.
+    """
+    def __init__(self, ast: AST):
+        self.ast = ast
+        self.removed = 0
+
+    def fold(self) -> AST:
+        """
+        Folds the expression of every assignment in the AST.
+        :return: the (destructively) optimised AST
+        """
+        for statement in self.ast.root.get_children():
+            if statement.type == Tokens.ASSIGN and statement.right().type in COMPUTATION_NODES:
+                expression = statement.right()
+                before = ConstantFolder.count(expression)
+                folded = self.fold_expression(expression)
+                statement.replace_child(expression, folded)
+                self.removed += before - ConstantFolder.count(folded)
+        return self.ast
+
+    @staticmethod
+    def count(node: Node) -> int:
+        """
+        Counts the nodes of an expression.
+        :param node: the root of the expression
+        :return: the number of nodes in the expression
+        """
+        count, stack = 0, [node]
+        while stack:
+            count += 1
+            stack.extend(stack.pop().children)
+        return count
+
+    @staticmethod
+    def flatten(expression: Node) -> Tuple[List[Tuple[bool, Node]], Optional[Number]]:
+        """
+        Flattens a tree of PLUS and MINUS nodes into its operands.
+        :param expression: the root of the tree
+        :return: the non-constant operands in order, each paired with whether it is
+                 subtracted, and the sum of the constant operands (None if there are none)
+        """
+        variables = list()
+        constant = None
+        stack = [(expression, False)]
+        while stack:
+            node, negative = stack.pop()
+            if node.type in COMPUTATION_NODES:
+                stack.append((node.right(), negative != (node.type == Tokens.MINUS)))
+                stack.append((node.left(), negative))
+            elif node.type in CONSTANT_NODES:
+                constant = (subtract if negative else add)(0 if constant is None else constant,
+                                                               node.value)
+            else:
+                variables.append((negative, node))
+        return variables, constant
+
+    def fold_expression(self, expression: Node) -> Node:
+        """
+        Folds and rebuilds a single +/- chain.
+        :param expression: the root of the chain
+        :return: the root of the rebuilt chain
+        """
+        datatype = expression.datatype
+        variables, constant = ConstantFolder.flatten(expression)
+
+        start = next((index for index, (negative, _) in enumerate(variables) if not negative),
+                     None)
+        if start is None:
+            # Nothing to subtract from, so the chain has to start with the constant
+            result = ConstantFolder.constant(0 if constant is None else constant, datatype)
+            constant = None
+        else:
+            result = variables.pop(start)[1]
+
+        for negative, node in variables:
+            result = ConstantFolder.operation(Tokens.MINUS if negative else Tokens.PLUS,
+                                              result, node)
+
+        if constant is not None and (constant != 0 or scale(constant) > 0):
+            negative = constant < 0
+            result = ConstantFolder.operation(
+                Tokens.MINUS if negative else Tokens.PLUS, result,
+                ConstantFolder.constant(subtract(0, constant) if negative else constant,
+                                        datatype))
+        result.datatype = datatype
+        return result
+
+    @staticmethod
+    def constant(value: Number, datatype: DataType) -> Node:
+        """
+        Constructs a constant node for a folded value.
+        :param value: the value of the constant
+        :param datatype: the datatype of the expression the constant belongs to
+        :return: the new constant node
+        """
+        node = Node(None, Tokens.FNUM if datatype == DataType.FLOAT else Tokens.INUM, value)
+        node.datatype = datatype
+        return node
+
+    @staticmethod
+    def operation(type_: Tokens, left: Node, right: Node) -> Node:
+        """
+        Constructs a computation node over two operands.
+        :param type_: PLUS or MINUS
+        :param left: the left operand
+        :param right: the right operand
+        :return: the new computation node
+        """
+        node = Node(None, type_)
+        node.add_child_node(left)
+        node.add_child_node(right)
+        node.datatype = SemanticAnalyser.generalise(left.datatype, right.datatype)
+        return node
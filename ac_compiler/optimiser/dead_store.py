@@ -0,0 +1,160 @@
+from typing import Iterator, List, Optional, Sequence
+from ..parser.ast import AST, Node
+from ..scanner.tokens import Tokens
+from ..semantic.semantic_analyser import DECLARATION_NODES
+from ..semantic.symbol_table import SymbolTable
+from .constant_folder import ConstantFolder
+
+
+def bit(name: str) -> int:
+    """
+    :param name: the name of a variable (a lowercase letter) or a temporary (an uppercase
+                 letter)
+    :return: the bit representing the variable in a set of variables
+    """
+    return 1 << (ord(name) - ord("A"))
+
+
+def names(variables: int) -> Iterator[str]:
+    """
+    :param variables: a set of variables (see bit)
+    :return: the names of the variables in the set
+    """
+    while variables:
+        lowest = variables & -variables
+        yield chr(ord("A") + lowest.bit_length() - 1)
+        variables ^= lowest
+
+
+class Liveness:
+    """
+    Live variable analysis of the statements of an analysed AST. A variable is live after a
+    statement if its value may be read (by an expression or a print) before it is next
+    assigned. ac programs are straight-line code, so a single backward pass over the
+    statements is exact. Sets of variables are kept as bitmasks (see bit), one per
+    statement.
+    """
+    def __init__(self, statements: Sequence[Node]):
+        """
+        :param statements: the statements (and declarations, which are ignored) of a program
+        """
+        self.statements = statements
+        self.live_out: List[int] = [0] * len(statements)
+        live = 0
+        for index in range(len(statements) - 1, -1, -1):
+            self.live_out[index] = live
+            live = Liveness.transfer(statements[index], live)
+        self.live_in = live
+
+    @staticmethod
+    def uses(statement: Node) -> Iterator[str]:
+        """
+        :param statement: a statement
+        :return: the variables read by the statement, in the order they are loaded
+        """
+        if statement.type == Tokens.PRINT:
+            yield statement.value
+        elif statement.type == Tokens.ASSIGN:
+            stack = [statement.right()]
+            while stack:
+                node = stack.pop()
+                if node.type == Tokens.ID:
+                    yield node.value
+                stack.extend(reversed(node.children))
+
+    @staticmethod
+    def target(statement: Node) -> Optional[str]:
+        """
+        :param statement: a statement
+        :return: the variable assigned by the statement, if it is an assignment
+        """
+        return statement.left().value if statement.type == Tokens.ASSIGN else None
+
+    @staticmethod
+    def transfer(statement: Node, live: int) -> int:
+        """
+        Computes the variables live before a statement.
+        :param statement: the statement
+        :param live: the variables live after the statement
+        :return: the variables live before the statement
+        """
+        target = Liveness.target(statement)
+        if target is not None:
+            if not live & bit(target):
+                return live  # A dead assignment reads nothing which is observed
+            live &= ~bit(target)
+        for name in Liveness.uses(statement):
+            live |= bit(name)
+        return live
+
+    def live_after(self, index: int, name: str) -> bool:
+        """
+        :param index: the index of a statement
+        :param name: the name of a variable
+        :return: whether the variable is live after the statement
+        """
+        return bool(self.live_out[index] & bit(name))
+
+    def dead(self, index: int) -> bool:
+        """
+        :param index: the index of a statement
+        :return: whether the statement is an assignment whose value is never observed
+        """
+        target = Liveness.target(self.statements[index])
+        return target is not None and not self.live_after(index, target)
+
+
+class DeadStoreEliminator:
+    """
+    Optimisation pass over an analysed AST, removing every assignment whose value is never
+    observed (the variable is assigned again, or the program ends, before it is read), then
+    the declarations of variables no remaining statement refers to. Each removed assignment
+    saves the dc code of its expression, its store and its precision reset.
+    """
+    def __init__(self, ast: AST, symbol_table: Optional[SymbolTable] = None):
+        """
+        :param ast: the analysed AST
+        :param symbol_table: the symbol table of the program, from which the removed
+                             declarations are also removed
+        """
+        self.ast = ast
+        self.symbol_table = symbol_table
+        self.removed_statements = 0
+        self.removed_declarations = 0
+        self.removed_instructions = 0
+
+    def eliminate(self) -> AST:
+        """
+        Removes the dead assignments and unused declarations of the AST.
+        :return: the (destructively) optimised AST
+        """
+        root = self.ast.root
+        liveness = Liveness(root.children)
+        statements = list()
+        referenced = 0
+        for index, statement in enumerate(root.children):
+            if statement.type in DECLARATION_NODES:
+                continue
+            if liveness.dead(index):
+                self.removed_statements += 1
+                # The expression, the store and the precision reset
+                self.removed_instructions += ConstantFolder.count(statement.right()) + 2
+                continue
+            statements.append(statement)
+            # Every remaining assignment is live, so its variable is also read later
+            for name in Liveness.uses(statement):
+                referenced |= bit(name)
+
+        declarations = list()
+        for declaration in root.children:
+            if declaration.type not in DECLARATION_NODES:
+                continue
+            name = declaration.value.value
+            if referenced & bit(name):
+                declarations.append(declaration)
+            else:
+                self.removed_declarations += 1
+                if self.symbol_table is not None:
+                    self.symbol_table.remove(name)
+        root.children = declarations + statements
+        return self.ast
@@ -0,0 +1,217 @@
+from string import ascii_uppercase
+from typing import Dict, List, Optional, Tuple
+from ..parser.ast import AST, Node
+from ..scanner.tokens import Tokens
+from ..semantic import COMPUTATION_NODES, CONSTANT_NODES
+from ..util import dc_literal
+from .dead_store import bit, names
+
+# dc registers which ac programs cannot name, as ac variables are lowercase letters
+TEMPORARIES = ascii_uppercase
+
+
+class Value:
+    """
+    A computation available for reuse: its first occurrence, and where its value is held.
+    """
+    __slots__ = ("node", "index", "holder", "temporary")
+
+    def __init__(self, node: Node, index: int):
+        """
+        :param node: the first occurrence of the computation
+        :param index: the index of the statement of the first occurrence
+        """
+        self.node = node
+        self.index = index
+        # The variable assigned the value of the computation, while it still holds it
+        self.holder: Optional[str] = None
+        self.temporary: Optional[str] = None
+
+
+class ValueNumbering:
+    """
+    Optimisation pass over an analysed AST eliminating common subexpressions across
+    statements. Computations are numbered by their structure (operators, constants and the
+    variables they read); a computation is available from its first occurrence until one of
+    the variables it reads is assigned. When an available computation occurs again it is
+    replaced by a load: of the variable it was assigned to, if that variable still holds it,
+    or else of a temporary register (an uppercase letter), which is assigned the value of the
+    first occurrence in a statement inserted before it. The peephole optimiser then turns
+    that store and the load following it into a duplicate and store (d sA).
+    """
+    def __init__(self, ast: AST):
+        self.ast = ast
+        self.values: Dict[tuple, Value] = dict()
+        # The keys of the values reading each variable (possibly including stale keys)
+        self.readers: Dict[str, List[tuple]] = dict()
+        # The key of the value each variable holds
+        self.holders: Dict[str, tuple] = dict()
+        # The free temporaries, and the index of the statement each one was last read in
+        self.free = list(reversed(TEMPORARIES))
+        self.last_read: Dict[str, int] = dict()
+        # Statements assigning temporaries, by the id of the statement they precede
+        self.before: Dict[int, List[Node]] = dict()
+        self.reused = 0
+        self.temporaries = 0
+
+    @staticmethod
+    def keys(expression: Node) -> Dict[int, Tuple[tuple, int]]:
+        """
+        Numbers the nodes of an expression by their structure.
+        :param expression: the root of the expression
+        :return: the key and the variables read (see bit) of each node, by the id of the node
+        """
+        preorder = list()
+        stack = [expression]
+        while stack:
+            node = stack.pop()
+            preorder.append(node)
+            stack.extend(node.children)
+
+        keys = dict()
+        for node in reversed(preorder):
+            if node.type in COMPUTATION_NODES:
+                left, left_variables = keys[id(node.left())]
+                right, right_variables = keys[id(node.right())]
+                keys[id(node)] = (node.type, left, right), left_variables | right_variables
+            elif node.type in CONSTANT_NODES:
+                # Numerals are distinguished by their text, as their scale matters to dc
+                keys[id(node)] = (node.type, dc_literal(node.value)), 0
+            else:
+                keys[id(node)] = (node.type, node.value), bit(node.value)
+        return keys
+
+    @staticmethod
+    def reference(name: str, node: Node) -> Node:
+        """
+        Constructs a reference to a register holding the value of a node.
+        :param name: the register
+        :param node: the node whose value the register holds
+        :return: the new reference node
+        """
+        reference = Node(None, Tokens.ID, name)
+        reference.datatype = node.datatype
+        return reference
+
+    def statement(self, node: Node) -> Node:
+        """
+        :param node: a node in the AST
+        :return: the statement (possibly an inserted one) the node belongs to
+        """
+        while node.parent is not self.ast.root:
+            node = node.parent
+        return node
+
+    def allocate(self, value: Value) -> Optional[str]:
+        """
+        Allocates a temporary to hold a value, and moves its first occurrence into a new
+        statement assigning the temporary.
+        :param value: the value
+        :return: the temporary, or None if none is free
+        """
+        # The new statement precedes the first occurrence, so the temporary must not be
+        # read after that
+        temporary = next((temporary for temporary in reversed(self.free)
+                          if self.last_read.get(temporary, -1) < value.index), None)
+        if temporary is None:
+            return None
+        self.free.remove(temporary)
+        self.temporaries += 1
+
+        node = value.node
+        anchor = self.statement(node)
+        node.parent.replace_child(node, ValueNumbering.reference(temporary, node))
+        assignment = Node(self.ast.root, Tokens.ASSIGN)
+        assignment.add_child(Tokens.ID, temporary).datatype = node.datatype
+        assignment.add_child_node(node)
+        assignment.datatype = node.datatype
+        self.before.setdefault(id(anchor), list()).append(assignment)
+        value.temporary = temporary
+        return temporary
+
+    def reuse(self, node: Node, value: Value, index: int) -> bool:
+        """
+        Replaces a computation with a load of the register holding its value.
+        :param node: the computation
+        :param value: the available value of the computation
+        :param index: the index of the statement of the computation
+        :return: whether the computation was replaced
+        """
+        register = value.temporary or value.holder or self.allocate(value)
+        if register is None:
+            return False
+        if register == value.temporary:
+            self.last_read[register] = index
+        node.parent.replace_child(node, ValueNumbering.reference(register, node))
+        self.reused += 1
+        return True
+
+    def invalidate(self, name: str) -> None:
+        """
+        Makes the values reading a variable, or held by it, unavailable, as it is assigned.
+        :param name: the variable
+        """
+        for key in self.readers.pop(name, ()):
+            value = self.values.pop(key, None)
+            if value is not None and value.temporary is not None:
+                self.free.append(value.temporary)
+        held = self.values.get(self.holders.pop(name, None))
+        if held is not None and held.holder == name:
+            held.holder = None
+
+    def number_assignment(self, statement: Node, index: int) -> None:
+        """
+        Replaces the available computations of an assignment, and makes its new ones
+        available.
+        :param statement: the assignment
+        :param index: the index of the assignment
+        """
+        expression = statement.right()
+        keys = ValueNumbering.keys(expression)
+        # Outermost first, so the largest available computation is reused
+        stack = [expression]
+        while stack:
+            node = stack.pop()
+            if node.type not in COMPUTATION_NODES:
+                continue
+            key, variables = keys[id(node)]
+            value = self.values.get(key)
+            if value is not None and self.reuse(node, value, index):
+                continue
+            if value is None:
+                self.values[key] = Value(node, index)
+                for name in names(variables):
+                    self.readers.setdefault(name, list()).append(key)
+            stack.extend(node.children)
+
+        target = statement.left().value
+        self.invalidate(target)
+        key, variables = keys[id(expression)]
+        value = self.values.get(key)
+        if value is not None and value.node is expression and not variables & bit(target):
+            value.holder = target
+            self.holders[target] = key
+
+    def number(self) -> AST:
+        """
+        Eliminates the common subexpressions of the AST.
+        :return: the (destructively) optimised AST
+        """
+        root = self.ast.root
+        for index, statement in enumerate(root.children):
+            if statement.type == Tokens.ASSIGN:
+                self.number_assignment(statement, index)
+
+        statements = list()
+        for statement in root.children:
+            stack = [(statement, False)]
+            while stack:
+                node, expanded = stack.pop()
+                inserted = self.before.get(id(node))
+                if expanded or not inserted:
+                    statements.append(node)
+                    continue
+                stack.append((node, True))
+                stack.extend((assignment, False) for assignment in reversed(inserted))
+        root.children = statements
+        return self.ast
@@ -1,2 +1,10 @@
-from .parser import Parser
-from .ast import AST, Node
+from ..util.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AST": ".ast",
+    "Node": ".ast",
+    "CompactAST": ".compact_ast",
+    "NodeView": ".compact_ast",
+    "Parser": ".parser",
+    "IterativeParser": ".iterative_parser",
+})
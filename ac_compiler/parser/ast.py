@@ -39,6 +39,15 @@ class Node:
         node.parent = self
         self.children.append(node)
 
+    def replace_child(self, old: Node, new: Node) -> None:
+        """
+        Replaces one of the children of the node with another node, in the same position.
+        :param old: the child node to replace
+        :param new: the node to put in its place
+        """
+        self.children[self.children.index(old)] = new
+        new.parent = self
+
     def get_children(self) -> List[Node]:
         """
         Convenience function for accessing the top-level children of the node.
@@ -112,6 +121,17 @@ class AST:
         self.root = Node(None)
         self.children = self.root.children
 
+    @staticmethod
+    def new_node(type_: Optional[Tokens] = None,
+                 value: Optional[Union[str, float, int]] = None) -> Node:
+        """
+        Constructs a new detached node for the tree.
+        :param type_: the Tokens type of the new Node
+        :param value: the value of the new Node
+        :return: the newly constructed node
+        """
+        return Node(None, type_, value)
+
     def children(self) -> List[Node]:
         """
         Convenience function for accessing the top-level children of the node.
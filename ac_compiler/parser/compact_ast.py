@@ -0,0 +1,236 @@
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from ..scanner import Tokens
+from ..semantic.symbol_table import DataType
+
+
+TOKEN_TYPES: List[Optional[Tokens]] = [None] + list(Tokens)
+TOKEN_CODES: Dict[Optional[Tokens], int] = {type_: code for code, type_ in enumerate(TOKEN_TYPES)}
+DATATYPES: List[Optional[DataType]] = [None, DataType.INT, DataType.FLOAT]
+DATATYPE_CODES: Dict[Optional[DataType], int] = {type_: code
+                                                 for code, type_ in enumerate(DATATYPES)}
+NO_NODE = -1
+
+
+class CompactAST:
+    """
+    An Abstract Syntax Tree stored as parallel typed arrays (type codes, value pool indices,
+    first-child/next-sibling links and datatype codes) with an interned pool of values.
+    Nodes are accessed through lightweight NodeView objects which provide the Node API, so
+    the tree can be used in place of an AST. Nodes hold no parent pointers.
+    """
+    def __init__(self):
+        self.types = array("B")
+        self.values = array("I")
+        self.datatypes = array("B")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.last_child = array("i")
+        self.pool: List[Any] = [None]
+        self.interned: Dict[Tuple[type, Any], int] = {(type(None), None): 0}
+        self.root = self.new_node()
+
+    def intern(self, value: Any) -> int:
+        """
+        Finds (or adds) a value in the value pool.
+        :param value: the value to intern
+        :return: the index of the value in the pool
+        """
+        key = (type(value), value)
+        index = self.interned.get(key)
+        if index is None:
+            index = len(self.pool)
+            self.pool.append(value)
+            self.interned[key] = index
+        return index
+
+    def new_node(self,
+                 type_: Optional[Tokens] = None,
+                 value: Optional[Union[str, float, int]] = None) -> NodeView:
+        """
+        Allocates a new detached node in the store.
+        :param type_: the Tokens type of the new node
+        :param value: the value of the new node
+        :return: a view of the newly allocated node
+        """
+        index = len(self.types)
+        self.types.append(TOKEN_CODES[type_])
+        self.values.append(self.intern(value))
+        self.datatypes.append(0)
+        self.first_child.append(NO_NODE)
+        self.next_sibling.append(NO_NODE)
+        self.last_child.append(NO_NODE)
+        return NodeView(self, index)
+
+    def link(self, parent: int, child: int) -> None:
+        """
+        Appends the node at index child to the children of the node at index parent.
+        :param parent: the index of the parent node
+        :param child: the index of the new last child
+        """
+        last = self.last_child[parent]
+        if last == NO_NODE:
+            self.first_child[parent] = child
+        else:
+            self.next_sibling[last] = child
+        self.last_child[parent] = child
+
+    def child_indices(self, index: int) -> Iterator[int]:
+        """
+        Iterates over the indices of the children of a node.
+        :param index: the index of the parent node
+        :return: an iterator over the child indices, in order
+        """
+        child = self.first_child[index]
+        next_sibling = self.next_sibling
+        while child != NO_NODE:
+            yield child
+            child = next_sibling[child]
+
+    @property
+    def children(self) -> List[NodeView]:
+        """
+        Convenience property for accessing the top-level children of the tree.
+        :return: the list of children of the root node
+        """
+        return self.root.children
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+
+class NodeView:
+    """
+    A view of a single node in a CompactAST, exposing the same interface as Node.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: CompactAST, index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def type(self) -> Optional[Tokens]:
+        return TOKEN_TYPES[self.store.types[self.index]]
+
+    @type.setter
+    def type(self, type_: Optional[Tokens]) -> None:
+        self.store.types[self.index] = TOKEN_CODES[type_]
+
+    @property
+    def value(self) -> Optional[Union[str, float, int]]:
+        return self.store.pool[self.store.values[self.index]]
+
+    @value.setter
+    def value(self, value: Optional[Union[str, float, int]]) -> None:
+        self.store.values[self.index] = self.store.intern(value)
+
+    @property
+    def datatype(self) -> Optional[DataType]:
+        return DATATYPES[self.store.datatypes[self.index]]
+
+    @datatype.setter
+    def datatype(self, datatype: Optional[DataType]) -> None:
+        self.store.datatypes[self.index] = DATATYPE_CODES[datatype]
+
+    @property
+    def children(self) -> List[NodeView]:
+        store = self.store
+        return [NodeView(store, child) for child in store.child_indices(self.index)]
+
+    def add_child(self,
+                  type_: Optional[Tokens] = None,
+                  value: Optional[Union[str, float, int]] = None) -> NodeView:
+        """
+        Allocates a new node with the given type and value and adds it to the children of
+        the current node.
+        :param type_: the Tokens type of the new node
+        :param value: the value of the new node
+        :return: the newly added child node
+        """
+        child = self.store.new_node(type_, value)
+        self.store.link(self.index, child.index)
+        return child
+
+    def add_child_node(self, node: NodeView) -> None:
+        """
+        Adds a detached node of the same store as a child of the current node.
+        :param node: the node to add to the children of self
+        """
+        self.store.link(self.index, node.index)
+
+    def get_children(self) -> List[NodeView]:
+        """
+        Convenience function for accessing the top-level children of the node.
+        :return: the list of children of self
+        """
+        return self.children
+
+    def get(self, index: int) -> NodeView:
+        """
+        Gets the child node indicated by index
+        :param index: the index of the child node to get
+        :return: the child node view at the specified index
+        """
+        children = self.children
+        if index < len(children):
+            return children[index]
+        else:
+            raise IndexError(f"Index {index} not available in {len(children)} children")
+
+    def left(self) -> NodeView:
+        """
+        Returns the left (first) child of a node with two children.
+        N.B. Will error if the given node does not have two children exactly.
+        :return: the left child node
+        """
+        children = self.children
+        if len(children) == 2:
+            return children[0]
+        else:
+            raise IndexError(f"Could not get left with {len(children)} children")
+
+    def right(self) -> NodeView:
+        """
+        Returns the right (second) child of a node with two children.
+        N.B. Will error if the given node does not have two children exactly.
+        :return: the right child node
+        """
+        children = self.children
+        if len(children) == 2:
+            return children[1]
+        else:
+            raise IndexError(f"Could not get right with {len(children)} children")
+
+    def child(self) -> NodeView:
+        """
+        Returns the only child of a node with one child.
+        N.B. Will error if the given node does not have one child exactly.
+        :return: the only child node
+        """
+        children = self.children
+        if len(children) == 1:
+            return children[0]
+        else:
+            raise IndexError(f"Could not get child with {len(children)} children")
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, NodeView) and other.store is self.store
+                and other.index == self.index)
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.index))
+
+    def __repr__(self) -> str:
+        children = self.children
+        if children:
+            children = " - " + ", ".join([str(child.type) for child in children])
+        else:
+            children = ""
+
+        type_ = self.type if self.type else Tokens.NONE
+        return f"<NodeView {type_}{children}>"
+
+    def __str__(self) -> str:
+        return str(self.__repr__())
@@ -0,0 +1,171 @@
+from __future__ import annotations
+from typing import Callable, Iterable, TYPE_CHECKING, Union
+from ..scanner import Token, Tokens
+from ..util import SyntaxParsingError
+from .ast import AST, Node
+
+if TYPE_CHECKING:
+    from .compact_ast import CompactAST
+
+
+# Ordered lists are kept for error messages, frozensets for membership checks
+DECLARATIONS = [Tokens.FLOATDCL, Tokens.INTDCL]
+STATEMENTS = [Tokens.ID, Tokens.PRINT]
+VALUES = [Tokens.ID, Tokens.FNUM, Tokens.INUM]
+OPERATORS = [Tokens.PLUS, Tokens.MINUS]
+STATEMENT_FOLLOW = STATEMENTS + [Tokens.END]
+PROGRAM_START = DECLARATIONS + STATEMENT_FOLLOW
+EXPRESSION_FOLLOW = OPERATORS + STATEMENT_FOLLOW
+
+DECLARATION_SET = frozenset(DECLARATIONS)
+STATEMENT_SET = frozenset(STATEMENTS)
+VALUE_SET = frozenset(VALUES)
+OPERATOR_SET = frozenset(OPERATORS)
+STATEMENT_FOLLOW_SET = frozenset(STATEMENT_FOLLOW)
+PROGRAM_START_SET = frozenset(PROGRAM_START)
+
+
+class IterativeParser:
+    """
+    Parser for the ac language which pulls tokens from any iterator with a single token of
+    lookahead. Repetition in the grammar is parsed with loops rather than recursion, so stack
+    depth is constant regardless of the number of declarations, statements or operands.
+    Operator chains are built left-associatively (a + b - c parses as (a + b) - c).
+    The tree is built with ast_class, which may be AST or CompactAST.
+    """
+
+    def __init__(self, tokens: Iterable[Token],
+                 ast_class: Callable[[], Union[AST, CompactAST]] = AST):
+        self.tokens = iter(tokens)
+        self.current = next(self.tokens, None)
+        self.ast_class = ast_class
+        self.ast = None
+
+    def peek(self) -> Token:
+        """
+        Non-destructively return the next token.
+        :return: the next instance of Token in the stream
+        """
+        if self.current is None:
+            raise SyntaxParsingError(message="Unexpected end of token stream")
+        return self.current
+
+    def advance(self) -> Token:
+        """
+        Destructively return the next token, pulling the following one from the stream.
+        :return: the next instance of Token in the stream
+        """
+        token = self.peek()
+        self.current = next(self.tokens, None)
+        return token
+
+    def expect(self, expected: Tokens) -> Token:
+        """
+        Advances the token stream, checking that the removed token
+        matches that which was expected.
+        :param expected: the token which should appear next in the stream
+        """
+        token = self.advance()
+        if token.type == expected:
+            return token
+        else:
+            raise SyntaxParsingError(expected, token)
+
+    def parse(self):
+        """
+        Parses the whole stream of tokens into self.ast.
+        """
+        self.parse_program()
+
+    def parse_program(self):
+        """
+        Triggers syntax parsing of a whole program according to ac grammar.
+        """
+        self.ast = self.ast_class()
+
+        if self.peek().type not in PROGRAM_START_SET:
+            raise SyntaxParsingError(PROGRAM_START, self.peek())
+        self.parse_declarations()
+        self.parse_statements()
+        self.expect(Tokens.END)
+
+    def parse_declarations(self):
+        """
+        Parse declarations of ac variables until the first statement (or END).
+        """
+        while self.peek().type in DECLARATION_SET:
+            self.parse_declaration(self.ast.root)
+
+        if self.peek().type not in STATEMENT_FOLLOW_SET:
+            raise SyntaxParsingError(PROGRAM_START, self.peek())
+
+    def parse_declaration(self, parent: Node) -> Node:
+        """
+        Parse a single declaration of an ac variable (float or int).
+        :param parent: the node to add the declaration to
+        :return: the declaration node
+        """
+        declaration = self.advance()
+        if declaration.type not in DECLARATION_SET:
+            raise SyntaxParsingError(DECLARATIONS, declaration)
+        id_ = self.expect(Tokens.ID)
+        return parent.add_child(declaration.type, id_)
+
+    def parse_statements(self):
+        """
+        Parse ac language statements until END.
+        """
+        while self.peek().type in STATEMENT_SET:
+            self.parse_statement(self.ast.root)
+
+        if self.peek().type != Tokens.END:
+            raise SyntaxParsingError(STATEMENT_FOLLOW, self.peek())
+
+    def parse_statement(self, parent: Node) -> Node:
+        """
+        Parse a single statement in the ac programming language.
+        :param parent: the node to add the statement to
+        :return: the statement node
+        """
+        if self.peek().type == Tokens.ID:
+            id_ = self.expect(Tokens.ID)
+            assign = self.expect(Tokens.ASSIGN)
+            statement = parent.add_child(assign.type)
+            statement.add_child(id_.type, id_.value)
+            statement.add_child_node(self.parse_expression())
+            return statement
+        elif self.peek().type == Tokens.PRINT:
+            print_ = self.expect(Tokens.PRINT)
+            id_ = self.expect(Tokens.ID)
+            return parent.add_child(print_.type, id_.value)
+        else:
+            raise SyntaxParsingError(STATEMENTS, self.peek())
+
+    def parse_value(self) -> Token:
+        """
+        Parses a single value, whether a raw FNUM, INUM, or referenced
+        by an ID.
+        """
+        value = self.advance()
+        if value.type not in VALUE_SET:
+            raise SyntaxParsingError(VALUES, value)
+        return value
+
+    def parse_expression(self) -> Node:
+        """
+        Parses a value followed by any number of PLUS or MINUS operations.
+        :return: the (detached) root node of the expression
+        """
+        value = self.parse_value()
+        expression = self.ast.new_node(value.type, value.value)
+
+        while self.peek().type in OPERATOR_SET:
+            operation = self.ast.new_node(self.advance().type)
+            operation.add_child_node(expression)
+            value = self.parse_value()
+            operation.add_child(value.type, value.value)
+            expression = operation
+
+        if self.peek().type not in STATEMENT_FOLLOW_SET:
+            raise SyntaxParsingError(EXPRESSION_FOLLOW, self.peek())
+        return expression
@@ -1,2 +1,10 @@
-from .scanner import Scanner
-from .tokens import Token, Tokens
+from ..util.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Scanner": ".scanner",
+    "RegexScanner": ".regex_scanner",
+    "iter_tokens": ".stream",
+    "TokenBuffer": ".token_buffer",
+    "Token": ".tokens",
+    "Tokens": ".tokens",
+})
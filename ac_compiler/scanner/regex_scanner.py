@@ -0,0 +1,101 @@
+from re import DOTALL, compile as compile_pattern
+from typing import Iterator, List, Match, Optional, Pattern, Tuple
+from .scanner import Scanner
+from .tokens import Token, Tokens
+
+
+# Single-character tokens in the order the legacy scanner tries them. INUM/FNUM are handled
+# by the NUMERAL group, BLANK is skipped and NONE (which matches anything) becomes the
+# catch-all at the very end of the master pattern.
+SINGLE_CHARACTER_TOKENS = [Tokens.FLOATDCL, Tokens.INTDCL, Tokens.PRINT, Tokens.ID,
+                           Tokens.ASSIGN, Tokens.PLUS, Tokens.MINUS, Tokens.END]
+NUMERAL = r"[0-9]+(?:\.[0-9]*)?"
+
+
+def build_master_pattern() -> Tuple[Pattern, List[Tokens]]:
+    """
+    Builds a single regular expression matching every token of the ac language, with one
+    capturing group per token type.
+    :return: the compiled pattern and the token type matched by each group (indexed by
+             match.lastindex)
+    """
+    groups = [f"({Tokens.BLANK.value})", f"({NUMERAL})"]
+    group_types = [None, Tokens.BLANK, Tokens.INUM]
+    for token in SINGLE_CHARACTER_TOKENS:
+        groups.append(f"({token.value})")
+        group_types.append(token)
+    groups.append("(.)")
+    group_types.append(Tokens.NONE)
+    return compile_pattern("|".join(groups), DOTALL), group_types
+
+
+MASTER_PATTERN, GROUP_TYPES = build_master_pattern()
+# The interned token produced by each group matching a token without a value (None for the
+# groups whose tokens depend on the matched text)
+GROUP_TOKENS = [None if type_ in (None, Tokens.BLANK, Tokens.INUM, Tokens.ID) else Token(type_)
+                for type_ in GROUP_TYPES]
+
+
+def match_token(match: Match) -> Optional[Token]:
+    """
+    Turns a match of the master pattern into the token it scanned.
+    :param match: the match
+    :return: the token, or None if the match is a blank
+    """
+    index = match.lastindex
+    token = GROUP_TOKENS[index]
+    if token is not None:
+        return token
+    type_ = GROUP_TYPES[index]
+    if type_ is Tokens.BLANK:
+        return None
+    text = match.group()
+    if type_ is Tokens.INUM:
+        return Token(Tokens.FNUM, float(text)) if "." in text else Token(Tokens.INUM, int(text))
+    return Token.interned.get((Tokens.ID, text)) or Token(Tokens.ID, text)
+
+
+def scan_tokens(content: str, end: Optional[int] = None) -> Iterator[Token]:
+    """
+    Lazily tokenises content[:end] using the master pattern. No END token is produced.
+    :param content: the ac source text to tokenise
+    :param end: the index to stop scanning at (defaults to the end of content)
+    :return: an iterator over the tokens found in the content
+    """
+    matches = MASTER_PATTERN.finditer(content, 0, len(content) if end is None else end)
+    # Tokens are always true, so filtering drops just the blanks
+    return filter(None, map(match_token, matches))
+
+
+def scan_token_spans(content: str, start: int = 0,
+                     end: Optional[int] = None) -> Iterator[Tuple[Token, int, int]]:
+    """
+    Lazily tokenises content[start:end] using the master pattern, along with the position of
+    each token in content. No END token is produced.
+    :param content: the ac source text to tokenise
+    :param start: the index to start scanning from
+    :param end: the index to stop scanning at (defaults to the end of content)
+    :return: an iterator over (token, start index, end index) tuples
+    """
+    for match in MASTER_PATTERN.finditer(content, start, len(content) if end is None else end):
+        token = match_token(match)
+        if token is not None:
+            yield token, match.start(), match.end()
+
+
+class RegexScanner(Scanner):
+    """
+    Scanner for the adding calculator programming language which tokenises the whole file
+    in a single pass of a precompiled master pattern.
+    Produces the same token stream as Scanner for programs whose numerals are followed by a
+    blank (the legacy scanner silently drops the character following a numeral).
+    """
+    def scan(self) -> List[Token]:
+        """
+        Scans the contents of the given file to produce a list of tokens.
+        :return: list of tokens corresponding to file contents
+        """
+        self.tokens = list(scan_tokens(self.content))
+        self.tokens.append(Token(Tokens.END))
+        self.index = self.length
+        return self.tokens
@@ -28,7 +28,8 @@ class Scanner:
 
         while self.index < self.length:
             token, self.index = self.match_token()
-            self.tokens.append(token)
+            if token is not None:
+                self.tokens.append(token)
             self.index += 1
 
         self.tokens.append(Token(Tokens.END))
@@ -39,17 +40,18 @@ class Scanner:
         """
         Matches a single token from the content of the file, incrementing the index
         as the content is processed.
-        :return: the matched token and the new index as a tuple (Token, index)
+        :return: the matched token and the new index as a tuple (Token, index), or None
+                 rather than a token if only blanks were left
         """
-        while match(Tokens.BLANK.value, self.content[self.index]):
+        while self.index < self.length and match(Tokens.BLANK.value, self.content[self.index]):
             self.index += 1
 
+        if self.index == self.length:
+            return None, self.index
+
         if match(r"[0-9]", self.content[self.index]):
             return self.scan_digits()
 
-        if self.index == self.length:
-            return Token(Tokens.End), self.index
-
         for token in Tokens:
             if match(token.value, self.content[self.index]):
                 if token == Tokens.ID:
@@ -0,0 +1,72 @@
+from codecs import getincrementaldecoder
+from mmap import mmap
+from os import PathLike
+from typing import BinaryIO, Iterator, TextIO, Union
+from .regex_scanner import scan_tokens
+from .tokens import Token, Tokens
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+NUMERAL_CHARACTERS = "0123456789."
+
+Source = Union[str, bytes, bytearray, memoryview, mmap, TextIO, BinaryIO, PathLike]
+
+
+def iter_chunks(source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Splits a source of ac code into text chunks of at most chunk_size characters (or bytes
+    for binary sources), decoding binary sources as UTF-8 incrementally.
+    :param source: source text, a bytes-like object or mmap, a text or binary stream, or the
+                   path of a file to read
+    :param chunk_size: the maximum amount of the source to hold at once
+    :return: an iterator over the chunks of source text
+    """
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+
+    if isinstance(source, PathLike):
+        with open(source, "rb") as file:
+            yield from iter_chunks(file, chunk_size)
+        return
+
+    decoder = getincrementaldecoder("utf-8")()
+    if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+        view = memoryview(source)
+        try:
+            for start in range(0, len(view), chunk_size):
+                yield decoder.decode(view[start:start + chunk_size])
+        finally:
+            view.release()
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk if isinstance(chunk, str) else decoder.decode(chunk)
+    else:
+        raise TypeError(f"Cannot scan source of type {type(source).__name__}")
+    yield decoder.decode(b"", final=True)
+
+
+def iter_tokens(source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Token]:
+    """
+    Lazily scans a source of ac code, reading it in bounded chunks and yielding tokens as
+    soon as they are complete. Numerals crossing a chunk boundary are carried over into the
+    next chunk. The stream is terminated by an END token, as with Scanner.tokens.
+    :param source: source text, a bytes-like object or mmap, a text or binary stream, or the
+                   path of a file to read
+    :param chunk_size: the maximum amount of the source to read at once
+    :return: an iterator over the tokens of the source
+    """
+    carry = ""
+    for chunk in iter_chunks(source, chunk_size):
+        buffer = carry + chunk
+        # A trailing run of numeral characters may continue in the next chunk
+        cut = len(buffer.rstrip(NUMERAL_CHARACTERS))
+        yield from scan_tokens(buffer, cut)
+        carry = buffer[cut:]
+
+    yield from scan_tokens(carry)
+    yield Token(Tokens.END)
@@ -0,0 +1,100 @@
+from array import array
+from typing import Iterable, Iterator, List, Union
+from .stream import Source, iter_tokens
+from .tokens import Token, Tokens
+
+
+TYPES = list(Tokens)
+TYPE_CODES = {type_: code for code, type_ in enumerate(TYPES)}
+# Flags an INUM operand indexing the list of integers too large for a signed 64-bit array
+LARGE = 1 << 31
+
+
+class TokenBuffer:
+    """
+    Compact, struct-of-arrays storage for a token stream. Each token takes one byte for its
+    type code and four for its operand: the character code of an ID, or the index of the
+    value of an INUM or FNUM in a side table (a 64-bit array of integers, or of floats).
+    Tokens are rebuilt on access, so a buffer can be consumed like a list of tokens, by
+    indexing (as by Parser) or iterating (as by IterativeParser).
+    """
+    def __init__(self, tokens: Iterable[Token] = ()):
+        self.types = array("B")
+        self.operands = array("I")
+        self.integers = array("q")
+        self.floats = array("d")
+        self.large: List[int] = list()
+        self.extend(tokens)
+
+    @classmethod
+    def scan(cls, source: Source) -> "TokenBuffer":
+        """
+        Scans a source of ac code into a buffer (terminated by an END token).
+        :param source: anything accepted by iter_tokens
+        :return: the buffer of the tokens of the source
+        """
+        return cls(iter_tokens(source))
+
+    def append(self, token: Token) -> None:
+        type_ = token.type
+        self.types.append(TYPE_CODES[type_])
+        if type_ is Tokens.ID:
+            self.operands.append(ord(token.value))
+        elif type_ is Tokens.FNUM:
+            self.operands.append(len(self.floats))
+            self.floats.append(token.value)
+        elif type_ is Tokens.INUM:
+            try:
+                self.integers.append(token.value)
+                self.operands.append(len(self.integers) - 1)
+            except OverflowError:
+                self.operands.append(LARGE | len(self.large))
+                self.large.append(token.value)
+        else:
+            self.operands.append(0)
+
+    def extend(self, tokens: Iterable[Token]) -> None:
+        for token in tokens:
+            self.append(token)
+
+    def token(self, index: int) -> Token:
+        """
+        Rebuilds the token at an index of the buffer.
+        :param index: the (non-negative) index of the token
+        :return: the token
+        """
+        type_ = TYPES[self.types[index]]
+        if type_ is Tokens.ID:
+            return Token(type_, chr(self.operands[index]))
+        elif type_ is Tokens.FNUM:
+            return Token(type_, self.floats[self.operands[index]])
+        elif type_ is Tokens.INUM:
+            operand = self.operands[index]
+            if operand & LARGE:
+                return Token(type_, self.large[operand ^ LARGE])
+            return Token(type_, self.integers[operand])
+        return Token(type_)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Token, List[Token]]:
+        if isinstance(index, slice):
+            return [self.token(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError("TokenBuffer index out of range")
+        return self.token(index)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __iter__(self) -> Iterator[Token]:
+        token = self.token
+        for index in range(len(self.types)):
+            yield token(index)
+
+    def nbytes(self) -> int:
+        """
+        :return: the number of bytes held in the arrays of the buffer
+        """
+        return sum(values.itemsize * len(values)
+                   for values in (self.types, self.operands, self.integers, self.floats))
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 
 class Tokens(Enum):
@@ -16,7 +16,7 @@ class Tokens(Enum):
     MINUS = "-"
     INUM = "[0-9]+"
     FNUM = r"[0-9]+\.[0-9]+"
-    BLANK = r" +"
+    BLANK = r"\s+"
     END = r"\$"
     NONE = ""
     CONVERT = "CV"
@@ -26,10 +26,27 @@ class Token:
     """
     A common token for the ac language, consisting of a type (see Tokens) and a value
     where appropriate (e.g. integer value for an INUM token).
+    Tokens without a value, and ID tokens, are interned: there is a single instance of each,
+    shared by every occurrence in every token stream, so tokens must never be modified.
     """
-    def __init__(self, type_: Tokens, value: Optional[Union[int, float, str]] = None):
-        self.type = type_
-        self.value = value
+    __slots__ = ("type", "value")
+    interned: Dict[Tuple[Tokens, Optional[str]], "Token"] = dict()
+
+    def __new__(cls, type_: Tokens, value: Optional[Union[int, float, str]] = None) -> "Token":
+        interned = value is None or type_ is Tokens.ID
+        if interned:
+            token = cls.interned.get((type_, value))
+            if token is not None:
+                return token
+        token = object.__new__(cls)
+        token.type = type_
+        token.value = value
+        if interned:
+            cls.interned[(type_, value)] = token
+        return token
+
+    def __reduce__(self):
+        return Token, (self.type, self.value)
 
     def __str__(self) -> str:
         return f"<{self.type.name}: {self.value}>"
@@ -1,3 +1,4 @@
+from collections import deque
 from string import ascii_lowercase
 from ..scanner import Tokens
 from ..parser import AST, Node
@@ -7,6 +8,7 @@ from .symbol_table import SymbolTable, DataType
 
 COMPUTATION_NODES = [Tokens.PLUS, Tokens.MINUS]
 CONSTANT_NODES = [Tokens.INUM, Tokens.FNUM]
+DECLARATION_NODES = [Tokens.FLOATDCL, Tokens.INTDCL]
 
 
 class SemanticAnalyser:
@@ -25,23 +27,32 @@ class SemanticAnalyser:
         :return: the populated symbol table
         """
         symbol_table = self.symbol_table
-        stack = list()
-        stack.append(self.ast.root)
-        while stack:
-            top = stack.pop(0)
-            stack.extend(top.children)
-            if top.type in [Tokens.FLOATDCL, Tokens.INTDCL]:
-                if len(top.value.value) != 1 or top.value.value not in ascii_lowercase:
-                    raise SymbolError(f"{top.value} is an invalid identifier.")
-                if top.type == Tokens.FLOATDCL:
-                    symbol_table.enter(top.value.value, DataType.FLOAT)
-                if top.type == Tokens.INTDCL:
-                    symbol_table.enter(top.value.value, DataType.INT)
+        queue = deque()
+        queue.append(self.ast.root)
+        while queue:
+            top = queue.popleft()
+            queue.extend(top.children)
+            if top.type in DECLARATION_NODES:
+                SemanticAnalyser.visit_declaration(symbol_table, top)
             elif top.type == Tokens.ID:
                 _ = symbol_table.lookup(top.value)  # Value unused here (more checks to come)
 
         return symbol_table
 
+    @staticmethod
+    def visit_declaration(symbol_table: SymbolTable, node: Node) -> None:
+        """
+        Visits a declaration node and enters the declared symbol into the symbol table.
+        :param symbol_table: the table to enter the symbol into
+        :param node: the declaration node to visit
+        """
+        if len(node.value.value) != 1 or node.value.value not in ascii_lowercase:
+            raise SymbolError(f"{node.value} is an invalid identifier.")
+        if node.type == Tokens.FLOATDCL:
+            symbol_table.enter(node.value.value, DataType.FLOAT)
+        if node.type == Tokens.INTDCL:
+            symbol_table.enter(node.value.value, DataType.INT)
+
     @staticmethod
     def consistent(node1: Node, node2: Node) -> DataType:
         """
@@ -74,14 +85,16 @@ class SemanticAnalyser:
     @staticmethod
     def convert(node: Node, type_: DataType) -> DataType:
         """
-        Converts a single node to the given DataType.
+        Converts a single node to the given DataType. Integer constants become FNUM constants,
+        while references and computations keep their type so they can still be generated.
         :param node: the node to convert
         :param type_: the type to convert the node to
         """
         if node.datatype == DataType.FLOAT and type_ == DataType.INT:
             raise SemanticError("Illegal type conversion")
         elif node.datatype == DataType.INT and type_ == DataType.FLOAT:
-            node.type = Tokens.FNUM
+            if node.type == Tokens.INUM:
+                node.type = Tokens.FNUM
             node.datatype = type_
             # node.value = float(node.value)
             return type_
@@ -151,3 +164,35 @@ class SemanticAnalyser:
             SemanticAnalyser.visit_constant(node)
         elif node.type == Tokens.ID:
             SemanticAnalyser.visit_reference(self.symbol_table, node)
+
+    def analyse_single_pass(self) -> SymbolTable:
+        """
+        Populates the symbol table and analyses the whole tree in a single iterative
+        post-order traversal, with the same results as calling populate_symbol_table followed
+        by analyse. Declarations precede all statements, so every symbol is entered before it
+        is referenced.
+        :return: the populated symbol table
+        """
+        symbol_table = self.symbol_table
+        # Children are pushed left to right, so the reversed pre-order is the post-order
+        preorder = list()
+        stack = [self.ast.root]
+        while stack:
+            node = stack.pop()
+            preorder.append(node)
+            stack.extend(node.get_children())
+
+        for node in reversed(preorder):
+            type_ = node.type
+            if type_ in COMPUTATION_NODES:
+                SemanticAnalyser.visit_computation(node)
+            elif type_ == Tokens.ASSIGN:
+                SemanticAnalyser.visit_assignment(node)
+            elif type_ in CONSTANT_NODES:
+                SemanticAnalyser.visit_constant(node)
+            elif type_ == Tokens.ID:
+                SemanticAnalyser.visit_reference(symbol_table, node)
+            elif type_ in DECLARATION_NODES:
+                SemanticAnalyser.visit_declaration(symbol_table, node)
+
+        return symbol_table
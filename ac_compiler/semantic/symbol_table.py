@@ -18,6 +18,8 @@ class SymbolTable:
     """
     def __init__(self):
         self.symbols: Dict[str, DataType] = dict()
+        self.lookups = 0
+        self.frozen = False
 
     def lookup(self, name: str) -> DataType:
         """
@@ -25,6 +27,7 @@ class SymbolTable:
         :param name: the symbol to lookup
         :return: the DataType associated with that symbol
         """
+        self.lookups += 1
         value = self.symbols.get(name, None)
         if value:
             return value
@@ -39,11 +42,33 @@ class SymbolTable:
         :param type_: the DataType to assign
         :return:
         """
+        if self.frozen:
+            raise SymbolError(f"Cannot declare symbol {name} after the declarations")
         if self.symbols.get(name, None) is None:
             self.symbols[name] = type_
         else:
             raise SymbolError(f"Duplicate declaration of symbol {name}")
 
+    def remove(self, name: str) -> None:
+        """
+        Remove a symbol from the symbol table (e.g. once an optimisation has removed every
+        reference to it).
+        :param name: the symbol to remove
+        """
+        if self.frozen:
+            raise SymbolError(f"Cannot remove symbol {name} from a frozen symbol table")
+        if self.symbols.pop(name, None) is None:
+            raise SymbolError(f"No symbol found matching {name}")
+
+    def freeze(self) -> "SymbolTable":
+        """
+        Prevents any further symbols from being entered, so that the table can be shared by
+        the analysis of independent parts of a program.
+        :return: the (now frozen) symbol table
+        """
+        self.frozen = True
+        return self
+
     def __repr__(self):
         return f"<Symbol Table: {len(self.symbols.keys())} entries>"
 
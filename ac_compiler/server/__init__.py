@@ -0,0 +1,3 @@
+from .protocol import handle
+from .server import CompileServer
+from .client import CompileClient, Connection
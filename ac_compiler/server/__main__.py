@@ -0,0 +1,4 @@
+import sys
+from .server import main
+
+sys.exit(main())
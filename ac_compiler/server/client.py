@@ -0,0 +1,160 @@
+import asyncio
+from itertools import count
+from typing import Any, Dict, List, Optional
+from ..util.error import RemoteError
+from .protocol import MAX_LINE_LENGTH, decode, encode
+from .server import DEFAULT_PORT
+
+
+class Connection:
+    """
+    A single connection to a compile server, over which requests are pipelined: each request
+    is written immediately and awaits the response bearing its id.
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.waiting: Dict[int, asyncio.Future] = dict()
+        self.ids = count()
+        self.receiver = asyncio.create_task(self.receive())
+
+    @property
+    def closed(self) -> bool:
+        return self.receiver.done()
+
+    async def receive(self) -> None:
+        """
+        Dispatches responses to the requests waiting for them, until the connection closes.
+        """
+        error: Exception = ConnectionError("Connection closed by the server")
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                response = decode(line)
+                future = self.waiting.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (ConnectionError, ValueError) as exception:
+            error = exception
+        finally:
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.waiting.clear()
+
+    async def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sends a request and waits for its response.
+        :param message: the request, without an id
+        :return: the response
+        """
+        if self.closed:
+            raise ConnectionError("Connection closed")
+        identifier = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[identifier] = future
+        self.writer.write(encode({"id": identifier, **message}))
+        await self.writer.drain()
+        return await future
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self.receiver
+
+
+class CompileClient:
+    """
+    Client of a compile server, pooling up to max_connections connections. Connections are
+    opened as needed and reused, each request going to the connection with the fewest
+    requests in flight, so that many concurrent requests share a few pipelined connections.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 path: Optional[str] = None, max_connections: int = 4):
+        """
+        :param host: the address of the server over TCP
+        :param port: the port of the server over TCP
+        :param path: the path of the server's Unix socket, to connect to instead of TCP
+        :param max_connections: the maximum number of connections to keep open
+        """
+        self.host = host
+        self.port = port
+        self.path = path
+        self.max_connections = max_connections
+        self.connections: List[Connection] = list()
+        self.opening: Optional[asyncio.Lock] = None
+
+    async def open(self) -> Connection:
+        if self.path is not None:
+            reader, writer = await asyncio.open_unix_connection(self.path,
+                                                                limit=MAX_LINE_LENGTH)
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port,
+                                                           limit=MAX_LINE_LENGTH)
+        return Connection(reader, writer)
+
+    async def connection(self) -> Connection:
+        """
+        Picks the connection to send a request over, opening a new one if every open
+        connection is busy and the pool is not full.
+        :return: the connection
+        """
+        self.connections[:] = [connection for connection in self.connections
+                               if not connection.closed]
+        idle = min(self.connections, key=lambda connection: len(connection.waiting),
+                   default=None)
+        if idle is not None and (not idle.waiting
+                                 or len(self.connections) >= self.max_connections):
+            return idle
+        if self.opening is None:
+            self.opening = asyncio.Lock()
+        async with self.opening:
+            if len(self.connections) < self.max_connections:
+                self.connections.append(await self.open())
+        return min(self.connections, key=lambda connection: len(connection.waiting))
+
+    async def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sends a request to the server and waits for its response.
+        :param message: the request
+        :return: the response
+        :raises RemoteError: if the server reports an error
+        """
+        connection = await self.connection()
+        response = await connection.request(message)
+        if "error" in response:
+            raise RemoteError(response["error"], response.get("error_type"))
+        return response
+
+    async def compile(self, source: str, level: int = 0) -> str:
+        """
+        Compiles a program to dc on the server.
+        :param source: the source text of the program
+        :param level: the optimisation level
+        :return: the text of the dc program
+        """
+        return (await self.request({"op": "compile", "source": source, "level": level}))["dc"]
+
+    async def run(self, source: str) -> str:
+        """
+        Runs a program on the server.
+        :param source: the source text of the program
+        :return: what the program prints
+        """
+        return (await self.request({"op": "run", "source": source}))["output"]
+
+    async def close(self) -> None:
+        connections, self.connections = self.connections, list()
+        for connection in connections:
+            await connection.close()
+
+    async def __aenter__(self) -> "CompileClient":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
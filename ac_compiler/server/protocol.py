@@ -0,0 +1,58 @@
+import json
+from io import StringIO
+from typing import Any, Dict
+from ..driver.pipeline import analyse, compile_source
+from ..evaluator import Evaluator
+from ..util.error import Error
+
+OPERATIONS = ("compile", "run")
+MAX_LINE_LENGTH = 16 * 1024 * 1024
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """
+    Frames a message as a line of newline-delimited JSON.
+    :param message: the message to send
+    :return: the bytes of the frame
+    """
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    """
+    Parses a line of newline-delimited JSON.
+    :param line: the bytes of the frame
+    :return: the message
+    """
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Expected a JSON object")
+    return message
+
+
+def handle(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Serves a single request, compiling its source to dc ("compile") or evaluating it and
+    capturing what it prints ("run"). Errors in the program are reported in the response.
+    :param request: the request, with its "id", "op", "source" and optional "level"
+    :return: the response, with the request's "id" and either "dc", "output" or "error" and
+             "error_type"
+    """
+    response: Dict[str, Any] = {"id": request.get("id")}
+    try:
+        operation = request.get("op", "compile")
+        source = request["source"]
+        if not isinstance(source, str):
+            raise ValueError("Expected the source as a string")
+        if operation == "compile":
+            response["dc"] = compile_source(source, int(request.get("level", 0)))
+        elif operation == "run":
+            output = StringIO()
+            Evaluator(analyse(source), output).run()
+            response["output"] = output.getvalue()
+        else:
+            raise ValueError(f"Unknown operation {operation}, expected one of {OPERATIONS}")
+    except (Error, KeyError, TypeError, ValueError, RecursionError) as error:
+        response["error"] = str(error)
+        response["error_type"] = type(error).__name__
+    return response
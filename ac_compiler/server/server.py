@@ -0,0 +1,184 @@
+import asyncio
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from os import cpu_count
+from typing import Any, Dict, Optional, Sequence, Set
+from .protocol import MAX_LINE_LENGTH, decode, encode, handle
+
+DEFAULT_PORT = 7433
+
+
+class CompileServer:
+    """
+    Long-running asyncio server compiling (or running) ac programs on behalf of clients, over
+    a Unix socket or TCP, so each compilation avoids the cost of starting Python and importing
+    the compiler.
+    Requests and responses are newline-delimited JSON objects matched by their "id". A
+    connection may pipeline any number of requests; they are served concurrently over a pool
+    of worker processes, and each response is written as soon as it is ready, so responses
+    may arrive out of order. At most max_pending requests are in progress across all
+    connections: once they are, the server stops reading requests, leaving the rest queued in
+    the socket buffers so that clients are slowed down rather than the server overloaded.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 path: Optional[str] = None, workers: Optional[int] = None,
+                 max_pending: int = 64):
+        """
+        :param host: the address to listen on over TCP
+        :param port: the port to listen on over TCP (0 picks a free port)
+        :param path: the path of a Unix socket to listen on instead of TCP
+        :param workers: the number of worker processes (default: one per CPU), or 0 to
+                        serve requests in the event loop itself
+        :param max_pending: the maximum number of requests in progress at once
+        """
+        self.host = host
+        self.port = port
+        self.path = path
+        self.workers = (cpu_count() or 1) if workers is None else workers
+        self.max_pending = max_pending
+        self.executor: Optional[Executor] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.pending: Optional[asyncio.Semaphore] = None
+        # The requests submitted to the worker pool and not yet finished
+        self.futures: Set[Future] = set()
+        self.statistics: Dict[str, int] = {"connections": 0, "requests": 0, "errors": 0}
+
+    async def start(self) -> None:
+        """
+        Starts the worker pool and begins listening for connections.
+        """
+        if self.workers:
+            # Start the workers before listening, so that they neither inherit the sockets of
+            # the server nor delay its first requests
+            self.executor = ProcessPoolExecutor(self.workers)
+            await asyncio.get_running_loop().run_in_executor(self.executor, handle, {"source": ""})
+        self.pending = asyncio.Semaphore(self.max_pending)
+        if self.path is not None:
+            self.server = await asyncio.start_unix_server(self.connection, self.path,
+                                                          limit=MAX_LINE_LENGTH)
+        else:
+            self.server = await asyncio.start_server(self.connection, self.host, self.port,
+                                                     limit=MAX_LINE_LENGTH)
+            self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            # Executor.shutdown only cancels queued requests itself from Python 3.9
+            for future in list(self.futures):
+                future.cancel()
+            self.executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "CompileServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    async def serve(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serves a request on the worker pool (or in the event loop if there is none).
+        :param request: the decoded request
+        :return: the response
+        """
+        if self.executor is None:
+            return handle(request)
+        future = self.executor.submit(handle, request)
+        self.futures.add(future)
+        future.add_done_callback(self.futures.discard)
+        return await asyncio.wrap_future(future)
+
+    async def respond(self, request: Dict[str, Any], writer: asyncio.StreamWriter,
+                      lock: asyncio.Lock) -> None:
+        """
+        Serves a request and writes its response, releasing its place among the pending
+        requests.
+        """
+        try:
+            response = await self.serve(request)
+        except Exception as error:  # A worker crashed, or the pool was shut down
+            response = {"id": request.get("id"), "error": str(error),
+                        "error_type": type(error).__name__}
+        finally:
+            self.pending.release()
+        if "error" in response:
+            self.statistics["errors"] += 1
+        async with lock:
+            writer.write(encode(response))
+            await writer.drain()
+
+    async def connection(self, reader: asyncio.StreamReader,
+                         writer: asyncio.StreamWriter) -> None:
+        """
+        Reads the requests pipelined over a connection until it closes, serving each
+        concurrently.
+        """
+        self.statistics["connections"] += 1
+        lock = asyncio.Lock()
+        tasks: Set[asyncio.Task] = set()
+        try:
+            while True:
+                await self.pending.acquire()
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):  # Line over the limit, or reset
+                    self.pending.release()
+                    break
+                if not line:
+                    self.pending.release()
+                    break
+                if not line.strip():
+                    self.pending.release()
+                    continue
+                self.statistics["requests"] += 1
+                try:
+                    request = decode(line)
+                except ValueError as error:
+                    self.pending.release()
+                    self.statistics["errors"] += 1
+                    async with lock:
+                        writer.write(encode({"id": None, "error": str(error),
+                                             "error_type": type(error).__name__}))
+                    continue
+                task = asyncio.create_task(self.respond(request, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    arguments = ArgumentParser(description="Serve ac compilations over a socket.")
+    arguments.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    arguments.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    arguments.add_argument("--unix", dest="path", help="listen on this Unix socket instead")
+    arguments.add_argument("-j", "--workers", type=int, default=None,
+                           help="number of worker processes (default: one per CPU)")
+    arguments.add_argument("--max-pending", type=int, default=64,
+                           help="maximum number of requests in progress at once")
+    options = arguments.parse_args(argv)
+
+    server = CompileServer(options.host, options.port, options.path, options.workers,
+                           options.max_pending)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("Stopped", file=sys.stderr)
+    return 0
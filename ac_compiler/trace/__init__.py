@@ -0,0 +1,2 @@
+from .tracer import NULL_TRACER, NullTracer, Span, Tracer
+from .sinks import ChromeTraceSink, JsonLinesSink, MemorySink
@@ -0,0 +1,80 @@
+import json
+from typing import Any, Dict, List, TextIO, Union
+from .tracer import Span
+
+
+class MemorySink:
+    """
+    Sink keeping every span in memory, in the order the phases finished.
+    """
+    def __init__(self):
+        self.spans: List[Span] = list()
+
+    def emit(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def totals(self) -> Dict[str, Dict[str, int]]:
+        """
+        Sums the measurements of the spans of each phase.
+        :return: the total wall time, CPU time, allocated memory and counts of each phase
+        """
+        totals: Dict[str, Dict[str, int]] = dict()
+        for span in self.spans:
+            total = totals.setdefault(span.name, {"calls": 0, "wall": 0, "cpu": 0,
+                                                  "allocated": 0})
+            total["calls"] += 1
+            total["wall"] += span.wall
+            total["cpu"] += span.cpu
+            total["allocated"] += span.allocated
+            for name, value in span.counts.items():
+                total[name] = total.get(name, 0) + value
+        return totals
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink:
+    """
+    Base of the sinks writing to a file (given as a path, which the sink then owns, or an
+    open text stream, which the caller closes).
+    """
+    def __init__(self, file: Union[str, TextIO]):
+        self.owned = isinstance(file, str)
+        self.file: TextIO = open(file, "w") if self.owned else file
+
+    def close(self) -> None:
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+class JsonLinesSink(FileSink):
+    """
+    Sink writing each span as a line of JSON as soon as its phase finishes.
+    """
+    def emit(self, span: Span) -> None:
+        self.file.write(json.dumps(span._asdict(), separators=(",", ":")) + "\n")
+
+
+class ChromeTraceSink(FileSink):
+    """
+    Sink writing spans as complete events in the Chrome trace-event format, viewable in
+    chrome://tracing or Perfetto. Events are written when the sink is closed.
+    """
+    def __init__(self, file: Union[str, TextIO]):
+        super().__init__(file)
+        self.events: List[Dict[str, Any]] = list()
+
+    def emit(self, span: Span) -> None:
+        arguments = dict(span.counts, cpu_us=span.cpu / 1000)
+        if span.allocated:
+            arguments["allocated_bytes"] = span.allocated
+        self.events.append({"name": span.name, "cat": "ac_compiler", "ph": "X",
+                            "ts": span.start / 1000, "dur": span.wall / 1000,
+                            "pid": span.process, "tid": span.thread, "args": arguments})
+
+    def close(self) -> None:
+        json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, self.file)
+        super().close()
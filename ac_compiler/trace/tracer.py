@@ -0,0 +1,137 @@
+import tracemalloc
+from os import getpid
+from threading import get_ident
+from time import perf_counter_ns, process_time_ns
+from typing import Callable, Dict, NamedTuple, Union
+
+
+class Span(NamedTuple):
+    """
+    The measurements of one traced phase. Times are in nanoseconds, start on the
+    perf_counter clock; allocated is the net change in traced memory (0 unless the tracer
+    measures memory).
+    """
+    name: str
+    start: int
+    wall: int
+    cpu: int
+    allocated: int
+    counts: Dict[str, int]
+    process: int
+    thread: int
+
+
+class Phase:
+    """
+    Context manager measuring one phase for a Tracer. Counts describing the work done by the
+    phase (tokens produced, nodes created, ...) are attached with count; a count may be given
+    as a callable, evaluated after the phase has been timed, when computing it is costly.
+    """
+    __slots__ = ("tracer", "name", "counts", "start", "cpu", "memory")
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+        self.counts: Dict[str, Union[int, Callable[[], int]]] = dict()
+
+    def count(self, name: str, value: Union[int, Callable[[], int]]) -> None:
+        self.counts[name] = value
+
+    def __enter__(self) -> "Phase":
+        self.memory = tracemalloc.get_traced_memory()[0] if self.tracer.memory else 0
+        self.cpu = process_time_ns()
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *_) -> None:
+        end = perf_counter_ns()
+        cpu = process_time_ns() - self.cpu
+        allocated = tracemalloc.get_traced_memory()[0] - self.memory if self.tracer.memory else 0
+        counts = {name: value() if callable(value) else value
+                  for name, value in self.counts.items()}
+        self.tracer.sink.emit(Span(self.name, self.start, end - self.start, cpu, allocated,
+                                   counts, getpid(), get_ident()))
+
+
+class NullPhase:
+    """
+    Phase of the NullTracer, which measures nothing.
+    """
+    __slots__ = ()
+
+    def count(self, name: str, value: Union[int, Callable[[], int]]) -> None:
+        pass
+
+    def __enter__(self) -> "NullPhase":
+        return self
+
+    def __exit__(self, *_) -> None:
+        pass
+
+
+NULL_PHASE = NullPhase()
+
+
+class Tracer:
+    """
+    Records the wall time, CPU time and (optionally) net memory allocated by each phase of a
+    compilation, along with counts reported by the phase, sending a Span per phase to a sink.
+    Phases may nest. Measuring memory starts tracemalloc, which slows Python down
+    considerably, so it is off by default.
+    """
+    enabled = True
+
+    def __init__(self, sink, memory: bool = False):
+        """
+        :param sink: the sink receiving spans (anything with emit and close methods)
+        :param memory: whether to measure the memory allocated by each phase
+        """
+        self.sink = sink
+        self.memory = memory
+        self.started_tracemalloc = False
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+
+    def phase(self, name: str) -> Phase:
+        """
+        Measures a phase: use as "with tracer.phase(name) as phase: ..."
+        :param name: the name of the phase
+        :return: the context manager measuring the phase
+        """
+        return Phase(self, name)
+
+    def close(self) -> None:
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+        self.sink.close()
+
+    def __enter__(self) -> "Tracer":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class NullTracer(Tracer):
+    """
+    Tracer which records nothing, for when tracing is disabled: each phase costs a method
+    call, and callers may check enabled to skip computing counts.
+    """
+    enabled = False
+
+    def __init__(self, sink=None, memory: bool = False):
+        self.sink = sink
+        self.memory = False
+        self.started_tracemalloc = False
+
+    def phase(self, name: str) -> NullPhase:
+        return NULL_PHASE
+
+    def close(self) -> None:
+        pass
+
+
+NULL_TRACER = NullTracer()
+
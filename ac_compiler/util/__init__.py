@@ -1 +1,3 @@
-from .error import LexicalError, SyntaxParsingError, SymbolError, SemanticError
\ No newline at end of file
+from .error import LexicalError, SyntaxParsingError, SymbolError, SemanticError, ExecutionError, \
+    BuildError, RemoteError
+from .numeric import add, dc_literal, format_dc, scale, subtract, to_decimal
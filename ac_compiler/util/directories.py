@@ -0,0 +1,32 @@
+import os
+import stat
+from os import path
+
+
+def user_cache_directory(name: str) -> str:
+    """
+    Finds the default location of a cache private to the current user: a directory under
+    $XDG_CACHE_HOME (or ~/.cache).
+    :param name: the name of the cache
+    :return: the path of the cache directory
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or path.join(path.expanduser("~"), ".cache")
+    return path.join(base, "ac_compiler", name)
+
+
+def private_directory(directory: str) -> str:
+    """
+    Creates a directory (and its parents) only the current user can access, or checks that an
+    existing one is owned by the current user and not writable by anyone else, since what is
+    cached in it is later unpickled or executed.
+    :param directory: the path of the directory
+    :return: the path of the directory
+    :raise PermissionError: if the directory could have been written by another user
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    status = os.stat(directory)
+    if hasattr(os, "getuid") and status.st_uid != os.getuid():
+        raise PermissionError(f"Cache directory {directory} is not owned by the current user")
+    if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"Cache directory {directory} is writable by other users")
+    return directory
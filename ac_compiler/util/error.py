@@ -1,5 +1,8 @@
-from typing import List, Union
-from ..scanner.tokens import Token, Tokens
+from __future__ import annotations
+from typing import List, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:  # Only for annotations, as the scanner itself raises these errors
+    from ..scanner.tokens import Token, Tokens
 
 
 class Error(Exception):
@@ -39,3 +42,22 @@ class SymbolError(Error):
 class SemanticError(Error):
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class ExecutionError(Error):
+    """Error raised when running an ac program fails"""
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class BuildError(Error):
+    """Error raised when building a generated program with a native toolchain fails"""
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class RemoteError(Error):
+    """Error reported by a compile server while serving a request"""
+    def __init__(self, message: str, error_type: str = None):
+        super().__init__(f"{error_type}: {message}" if error_type else message)
+        self.error_type = error_type
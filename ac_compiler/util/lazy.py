@@ -0,0 +1,27 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) \
+        -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the module-level __getattr__ and __dir__ of a package whose exports are only
+    imported from their submodules when first used, so that importing the package (or one of
+    its submodules) does not import every other submodule along with their dependencies.
+    :param package: the name of the package
+    :param exports: the name of each export, mapped to the relative name of its submodule
+    :return: the __getattr__ and __dir__ functions of the package
+    """
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(submodule, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,98 @@
+from decimal import Context, Decimal, MAX_EMAX, MAX_PREC, MIN_EMIN
+from typing import Union
+
+
+Number = Union[int, float, Decimal]
+
+
+def to_decimal(value: Number) -> Decimal:
+    """
+    Converts a numeric token or node value to an exact Decimal. Floats are converted via
+    their shortest repr, so 3.2 becomes Decimal("3.2") rather than its binary expansion.
+    :param value: the value to convert
+    :return: the equivalent Decimal
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    return Decimal(value)
+
+
+def dc_literal(value: Number) -> str:
+    """
+    Formats a numeric value as a dc numeral, which has no exponent and uses an underscore
+    rather than a hyphen as its negative sign.
+    :param value: the value to format
+    :return: the dc numeral for value
+    """
+    if isinstance(value, int):
+        text = str(value)
+    else:
+        text = format(to_decimal(value), "f")
+    return "_" + text[1:] if text.startswith("-") else text
+
+
+# Addition and subtraction in dc are exact, so arithmetic on Decimals is carried out with
+# enough precision that it never rounds.
+EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+def add(left: Number, right: Number) -> Number:
+    """
+    Adds two values exactly, as dc would. Integers stay integers.
+    :return: the exact sum
+    """
+    if isinstance(left, int) and isinstance(right, int):
+        return left + right
+    return EXACT.add(to_decimal(left), to_decimal(right))
+
+
+def subtract(left: Number, right: Number) -> Number:
+    """
+    Subtracts two values exactly, as dc would. Integers stay integers.
+    :return: the exact difference
+    """
+    if isinstance(left, int) and isinstance(right, int):
+        return left - right
+    return EXACT.subtract(to_decimal(left), to_decimal(right))
+
+
+def scale(value: Number) -> int:
+    """
+    Finds the dc scale (number of fractional digits) of a value.
+    :param value: the value to find the scale of
+    :return: the number of digits after the decimal point
+    """
+    if isinstance(value, int):
+        return 0
+    return max(0, -to_decimal(value).as_tuple().exponent)
+
+
+DC_LINE_LENGTH = 70
+
+
+def format_dc(value: Number) -> str:
+    """
+    Formats a value the way dc prints it: without a leading zero before the decimal point,
+    with all the digits of its scale, and wrapped with a backslash every DC_LINE_LENGTH - 1
+    characters.
+    :param value: the value to format
+    :return: the text dc prints for value (without the trailing newline)
+    """
+    if isinstance(value, int):
+        text = str(value)
+    else:
+        value = to_decimal(value)
+        if value.is_zero():
+            return "0"
+        text = format(value.copy_abs(), "f")
+        if text.startswith("0."):
+            text = text[1:]
+        if value.is_signed():
+            text = "-" + text
+
+    width = DC_LINE_LENGTH - 1
+    if len(text) <= width:
+        return text
+    return "\\\n".join([text[start:start + width] for start in range(0, len(text), width)])
@@ -0,0 +1,74 @@
+"""
+Compares the memory footprint and traversal speed of the object-per-node AST against the
+array-backed CompactAST.
+
+Usage: python -m benchmarks.ast_memory [statements ...]
+"""
+import sys
+import tracemalloc
+from time import perf_counter
+from ac_compiler.parser import AST, CompactAST, IterativeParser
+from ac_compiler.scanner import iter_tokens
+from .workload import generate_program
+
+
+def build(tokens, ast_class):
+    """
+    Parses the given tokens into a tree of the given class, measuring the memory it holds.
+    :return: the tree and the number of bytes allocated for it
+    """
+    tracemalloc.start()
+    parser = IterativeParser(iter(tokens), ast_class)
+    parser.parse()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return parser.ast, size
+
+
+def traverse(ast) -> float:
+    """
+    Visits every node of the tree through the Node interface.
+    :return: the time taken in seconds
+    """
+    start = perf_counter()
+    stack = [ast.root]
+    while stack:
+        node = stack.pop()
+        _ = node.type, node.value, node.datatype
+        stack.extend(node.children)
+    return perf_counter() - start
+
+
+def traverse_store(ast: CompactAST) -> float:
+    """
+    Visits every node of the tree directly through the arrays of the store.
+    :return: the time taken in seconds
+    """
+    start = perf_counter()
+    types, values, first_child, next_sibling = (ast.types, ast.values, ast.first_child,
+                                                ast.next_sibling)
+    stack = [0]
+    while stack:
+        index = stack.pop()
+        _ = types[index], values[index]
+        child = first_child[index]
+        while child != -1:
+            stack.append(child)
+            child = next_sibling[child]
+    return perf_counter() - start
+
+
+def main(sizes) -> None:
+    print(f"{'statements':>10} {'nodes':>9} {'AST MiB':>9} {'Compact MiB':>12} "
+          f"{'AST walk s':>11} {'views walk s':>13} {'arrays walk s':>14}")
+    for statements in sizes:
+        tokens = list(iter_tokens(generate_program(statements)))
+        ast, ast_size = build(tokens, AST)
+        compact, compact_size = build(tokens, CompactAST)
+        print(f"{statements:>10} {len(compact):>9} {ast_size / 2 ** 20:>9.2f} "
+              f"{compact_size / 2 ** 20:>12.2f} {traverse(ast):>11.3f} "
+              f"{traverse(compact):>13.3f} {traverse_store(compact):>14.3f}")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,49 @@
+"""
+Compares running generated programs with the in-process Evaluator against generating dc
+code and piping it into the dc binary.
+
+Usage: python -m benchmarks.evaluator_vs_dc [statements ...]
+"""
+import sys
+from io import StringIO
+from shutil import which
+from time import perf_counter
+from ac_compiler.evaluator import Evaluator
+from ac_compiler.generator import IterativeCodeGenerator, render_script, run_dc
+from ac_compiler.parser import IterativeParser
+from ac_compiler.scanner import iter_tokens
+from ac_compiler.semantic import SemanticAnalyser
+from .workload import generate_program
+
+
+def analyse(source: str):
+    parser = IterativeParser(iter_tokens(source))
+    parser.parse()
+    analyser = SemanticAnalyser(parser.ast)
+    analyser.analyse_single_pass()
+    return analyser.ast
+
+
+def main(sizes) -> None:
+    dc = which("dc")
+    print(f"{'statements':>10} {'Evaluator s':>12} {'dc s':>8} {'speedup':>8} {'same output':>12}")
+    for statements in sizes:
+        ast = analyse(generate_program(statements))
+
+        start = perf_counter()
+        output = StringIO()
+        Evaluator(ast, output).run()
+        evaluated = perf_counter() - start
+
+        if dc is None:
+            print(f"{statements:>10} {evaluated:>12.3f} {'(dc not installed)':>30}")
+            continue
+        start = perf_counter()
+        result = run_dc(render_script(IterativeCodeGenerator(ast).generate()), dc)
+        piped = perf_counter() - start
+        print(f"{statements:>10} {evaluated:>12.3f} {piped:>8.3f} {piped / evaluated:>7.1f}x "
+              f"{str(result.stdout == output.getvalue()):>12}")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,85 @@
+"""
+Compares the dc code generated for generated programs at each optimisation level: the
+number of instructions, of register loads and stores among them, the time taken to compile,
+and (if dc is installed) the time dc takes to run the code, checking that it prints the
+same as the unoptimised code. At the whole-program level, the statements and instructions
+removed by each pass are also shown (as recorded by the tracer).
+
+Usage: python -m benchmarks.optimisation_levels [--statements N] [--declarations N] [...]
+"""
+from argparse import ArgumentParser
+from shutil import which
+from time import perf_counter
+from typing import List, Optional
+from ac_compiler.driver import analyse, compile_source, generate
+from ac_compiler.generator import run_dc
+from ac_compiler.trace import MemorySink, Tracer
+from .workload import generate_program
+
+LEVELS = [0, 1, 2, 3]
+
+
+def register_traffic(generated: List[str]) -> int:
+    """
+    :param generated: the generated dc instructions
+    :return: the number of register loads and stores among them
+    """
+    return sum(1 for code in generated if len(code) == 2 and code[0] in "ls")
+
+
+def run(script: str, repeat: int = 3) -> Optional[tuple]:
+    """
+    Runs a dc program (keeping the best time of repeat runs).
+    :return: the best time and what the program printed, or None if dc is not installed
+    """
+    if which("dc") is None:
+        return None
+    times = list()
+    for _ in range(repeat):
+        start = perf_counter()
+        stdout = run_dc(script).stdout
+        times.append(perf_counter() - start)
+    return min(times), stdout
+
+
+def main() -> None:
+    arguments = ArgumentParser(description="Compare the code of each optimisation level.")
+    arguments.add_argument("--statements", type=int, default=20_000)
+    arguments.add_argument("--seed", type=int, default=0)
+    arguments.add_argument("--declarations", type=int, default=None)
+    arguments.add_argument("--chain-length", type=int, default=3)
+    arguments.add_argument("--repeat-ratio", type=float, default=0.0,
+                           help="fraction of assignments repeating a recent expression")
+    options = arguments.parse_args()
+
+    source = generate_program(options.statements, options.seed, options.declarations,
+                              options.chain_length, repeat_ratio=options.repeat_ratio)
+    print(f"{'level':>5} {'instructions':>12} {'change':>8} {'loads/stores':>12} "
+          f"{'compile s':>9} {'dc s':>8}")
+    baseline, expected = None, None
+    for level in LEVELS:
+        start = perf_counter()
+        script = compile_source(source, level)
+        elapsed = perf_counter() - start
+        generated = generate(analyse(source), level)
+        baseline = baseline or len(generated)
+        line = (f"{level:>5} {len(generated):>12,} {len(generated) / baseline - 1:>+8.1%} "
+                f"{register_traffic(generated):>12,} {elapsed:>9.3f}")
+        result = run(script)
+        if result is None:
+            line += f" {'(no dc)':>8}"
+        else:
+            expected = expected or result[1]
+            line += f" {result[0]:>8.3f}" + ("" if result[1] == expected else " (differs!)")
+        print(line)
+
+    sink = MemorySink()
+    compile_source(source, LEVELS[-1], Tracer(sink))
+    for span in sink.spans:
+        if span.name not in ("scan", "parse", "analyse", "compile"):
+            counts = ", ".join(f"{name} {value:,}" for name, value in span.counts.items())
+            print(f"{span.name:>15}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
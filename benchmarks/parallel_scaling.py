@@ -0,0 +1,46 @@
+"""
+Measures how compiling a single generated program with ParallelCompiler scales with the
+number of workers, against serial compile_source. Process workers pay for pickling the
+chunks and their code, so gains need several cores; thread workers only scale on
+free-threaded builds of Python.
+
+Usage: python -m benchmarks.parallel_scaling [--statements N] [--threads] [workers ...]
+"""
+from argparse import ArgumentParser
+from os import cpu_count
+from time import perf_counter
+from ac_compiler.driver import ParallelCompiler, compile_source
+from .workload import generate_program
+
+
+def best(compile_, source: str, repeat: int = 3) -> float:
+    times = list()
+    for _ in range(repeat):
+        start = perf_counter()
+        compile_(source)
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    arguments = ArgumentParser(description="Measure the scaling of parallel compilation.")
+    arguments.add_argument("workers", type=int, nargs="*")
+    arguments.add_argument("--statements", type=int, default=200_000)
+    arguments.add_argument("--chain-length", type=int, default=3)
+    arguments.add_argument("--level", type=int, default=0)
+    arguments.add_argument("--threads", action="store_true", help="use thread workers")
+    options = arguments.parse_args()
+
+    source = generate_program(options.statements, chain_length=options.chain_length)
+    serial = best(lambda text: compile_source(text, options.level), source)
+    print(f"{'workers':>7} {'seconds':>8} {'speedup':>8}")
+    print(f"{'serial':>7} {serial:>8.3f} {1:>8.2f}")
+    for workers in options.workers or sorted({1, 2, 4, cpu_count() or 1}):
+        with ParallelCompiler(workers, level=options.level, threads=options.threads) as compiler:
+            compiler.compile(source)  # Start the workers
+            elapsed = best(compiler.compile, source)
+        print(f"{workers:>7} {elapsed:>8.3f} {serial / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares the throughput (tokens/sec) of the legacy character-at-a-time Scanner against the
+single-pass RegexScanner.
+
+Usage: python -m benchmarks.scanner_throughput [statements ...]
+"""
+import sys
+from os import remove
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+from ac_compiler.scanner import RegexScanner, Scanner
+from .workload import generate_program
+
+
+def measure(scanner_class, path: str) -> float:
+    """
+    Scans the given file with the given scanner class and returns the throughput.
+    :param scanner_class: the Scanner (sub)class to benchmark
+    :param path: the path of the ac file to scan
+    :return: tokens scanned per second
+    """
+    start = perf_counter()
+    scanner = scanner_class(path)
+    elapsed = perf_counter() - start
+    return len(scanner.tokens) / elapsed
+
+
+def main(sizes) -> None:
+    print(f"{'statements':>12} {'Scanner tok/s':>16} {'RegexScanner tok/s':>20} {'speedup':>8}")
+    for statements in sizes:
+        with NamedTemporaryFile("w", suffix=".ac", delete=False) as file:
+            file.write(generate_program(statements))
+        try:
+            legacy = measure(Scanner, file.name)
+            regex = measure(RegexScanner, file.name)
+        finally:
+            remove(file.name)
+        print(f"{statements:>12} {legacy:>16,.0f} {regex:>20,.0f} {regex / legacy:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1_000, 10_000, 100_000])
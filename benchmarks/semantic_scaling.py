@@ -0,0 +1,58 @@
+"""
+Measures how SemanticAnalyser.analyse_single_pass scales with the number of AST nodes,
+alongside the two-pass populate_symbol_table + analyse.
+
+Usage: python -m benchmarks.semantic_scaling [nodes ...]
+"""
+import sys
+from time import perf_counter
+from ac_compiler.parser import IterativeParser
+from ac_compiler.scanner import iter_tokens
+from ac_compiler.semantic import SemanticAnalyser
+from .workload import generate_program
+
+NODES_PER_STATEMENT = 4  # Roughly, for the default workload
+
+
+def parse(nodes: int):
+    parser = IterativeParser(iter_tokens(generate_program(nodes // NODES_PER_STATEMENT)))
+    parser.parse()
+    return parser.ast
+
+
+def count_nodes(ast) -> int:
+    count, stack = 0, [ast.root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+def time_single_pass(ast) -> float:
+    start = perf_counter()
+    SemanticAnalyser(ast).analyse_single_pass()
+    return perf_counter() - start
+
+
+def time_two_pass(ast) -> float:
+    start = perf_counter()
+    analyser = SemanticAnalyser(ast)
+    analyser.populate_symbol_table()
+    analyser.analyse()
+    return perf_counter() - start
+
+
+def main(sizes) -> None:
+    print(f"{'nodes':>9} {'single pass s':>14} {'ns/node':>8} {'two pass s':>11} {'ns/node':>8}")
+    for size in sizes:
+        ast = parse(size)
+        nodes = count_nodes(ast)
+        single = time_single_pass(ast)
+        two = time_two_pass(parse(size))
+        print(f"{nodes:>9} {single:>14.3f} {single / nodes * 1e9:>8.0f} "
+              f"{two:>11.3f} {two / nodes * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000])
@@ -0,0 +1,46 @@
+"""
+Compares the latency of compiling small programs by starting a fresh interpreter per
+compilation against sending them to a warm compile server over a Unix socket.
+
+Usage: python -m benchmarks.server_latency [requests ...]
+"""
+import asyncio
+import subprocess
+import sys
+from os import path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from ac_compiler.server import CompileClient, CompileServer
+from .workload import generate_program
+
+COMMAND = "import sys; from ac_compiler.driver import compile_source; " \
+          "sys.stdout.write(compile_source(sys.stdin.read()))"
+
+
+async def served(sources, socket_path: str) -> float:
+    async with CompileServer(path=socket_path, workers=1):
+        async with CompileClient(path=socket_path) as client:
+            start = perf_counter()
+            await asyncio.gather(*(client.compile(source) for source in sources))
+            return perf_counter() - start
+
+
+def main(sizes) -> None:
+    print(f"{'requests':>8} {'fresh ms/req':>13} {'server ms/req':>14} {'speedup':>8}")
+    for requests in sizes:
+        sources = [generate_program(10, seed=seed) for seed in range(requests)]
+
+        start = perf_counter()
+        for source in sources:
+            subprocess.run([sys.executable, "-c", COMMAND], input=source, text=True,
+                           check=True, capture_output=True)
+        fresh = (perf_counter() - start) / requests
+
+        with TemporaryDirectory() as directory:
+            server = asyncio.run(served(sources, path.join(directory, "ac.sock"))) / requests
+        print(f"{requests:>8} {fresh * 1000:>13.2f} {server * 1000:>14.3f} "
+              f"{fresh / server:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [10, 100])
@@ -0,0 +1,51 @@
+"""
+Measures the cold-start time of compiling and running a trivial program from the command
+line, against starting a bare interpreter and (when installed) piping the equivalent dc
+program into dc.
+
+Usage: python -m benchmarks.startup [repetitions]
+"""
+import subprocess
+import sys
+from os import path
+from shutil import which
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import List
+
+SOURCE = "i a a = 1 p a\n"
+SCRIPT = "1 sa la p\n"
+
+
+def measure(command: List[str], repetitions: int, input_: str = None) -> float:
+    times = list()
+    for _ in range(repetitions):
+        start = perf_counter()
+        subprocess.run(command, input=input_, text=True, check=True, capture_output=True)
+        times.append(perf_counter() - start)
+    return median(times)
+
+
+def main(repetitions: int) -> None:
+    with TemporaryDirectory() as directory:
+        program = path.join(directory, "trivial.ac")
+        with open(program, "w") as file:
+            file.write(SOURCE)
+        commands = {
+            "python -c pass": [sys.executable, "-c", "pass"],
+            "ac dc": [sys.executable, "-m", "ac_compiler", "dc", program],
+            "ac run": [sys.executable, "-m", "ac_compiler", "run", program],
+        }
+        print(f"{'command':>16} {'median ms':>10}")
+        for name, command in commands.items():
+            print(f"{name:>16} {measure(command, repetitions) * 1000:>10.1f}")
+        dc = which("dc")
+        if dc is None:
+            print(f"{'dc':>16} {'(not installed)':>10}")
+        else:
+            print(f"{'dc':>16} {measure([dc], repetitions, SCRIPT) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
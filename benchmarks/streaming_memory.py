@@ -0,0 +1,48 @@
+"""
+Compares the peak memory and time of compiling generated programs from a file with
+compile_source, which holds the AST and the generated code as a whole, against
+compile_stream, which holds one statement at a time.
+
+Usage: python -m benchmarks.streaming_memory [statements ...]
+"""
+import sys
+import tracemalloc
+from os import devnull, remove
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+from ac_compiler.driver import compile_source, compile_stream
+from .workload import generate_program
+
+
+def measure(compile_) -> tuple:
+    tracemalloc.start()
+    try:
+        start = perf_counter()
+        compile_()
+        elapsed = perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(sizes) -> None:
+    print(f"{'statements':>10} {'source s':>9} {'source MiB':>11} {'stream s':>9} "
+          f"{'stream MiB':>11}")
+    for statements in sizes:
+        with NamedTemporaryFile("w", suffix=".ac", delete=False) as file:
+            file.write(generate_program(statements))
+        path = Path(file.name)
+        try:
+            with open(devnull, "w") as sink:
+                whole = measure(lambda: sink.write(compile_source(path)))
+                streamed = measure(lambda: compile_stream(path, sink))
+        finally:
+            remove(file.name)
+        print(f"{statements:>10} {whole[0]:>9.2f} {whole[1] / 2 ** 20:>11.2f} "
+              f"{streamed[0]:>9.2f} {streamed[1] / 2 ** 20:>11.2f}")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [10_000, 100_000])
@@ -0,0 +1,230 @@
+"""
+Per-phase benchmark suite: times scanning, parsing, semantic analysis and code generation
+separately and end-to-end, for both the original (recursive, list-based) phases and the
+streaming/iterative ones, on a generated workload. Records the best time, throughput and
+peak traced memory of each phase as JSON, and compares against a baseline run, flagging
+phases which slowed down by more than a threshold.
+
+Usage: python -m benchmarks.suite [--statements N] [--chain-length N] [...]
+                                  [--output results.json] [--baseline baseline.json]
+"""
+import json
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from os import remove
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from ac_compiler import __version__
+from ac_compiler.driver.pipeline import analyse, compile_source
+from ac_compiler.generator import CodeGenerator, IterativeCodeGenerator, render_script
+from ac_compiler.parser import IterativeParser, Parser
+from ac_compiler.scanner import Scanner, iter_tokens
+from ac_compiler.semantic import SemanticAnalyser
+from .workload import generate_program
+
+
+class Workload(NamedTuple):
+    source: str
+    path: str
+
+
+class Phase(NamedTuple):
+    """
+    A benchmarked phase: setup prepares its input (untimed), run is timed on that input.
+    """
+    name: str
+    setup: Callable[[Workload], Any]
+    run: Callable[[Any], Any]
+    legacy: bool = False
+
+
+def legacy_parse(tokens):
+    parser = Parser(tokens)
+    parser.parse()
+    return parser.ast
+
+
+def legacy_analyse(ast):
+    analyser = SemanticAnalyser(ast)
+    analyser.populate_symbol_table()
+    analyser.analyse()
+    return analyser.ast
+
+
+def legacy_compile(workload: Workload):
+    return CodeGenerator(legacy_analyse(legacy_parse(Scanner(workload.path).tokens))).generate()
+
+
+def parse(tokens):
+    parser = IterativeParser(tokens)
+    parser.parse()
+    return parser.ast
+
+
+def analyse_single_pass(ast):
+    SemanticAnalyser(ast).analyse_single_pass()
+    return ast
+
+
+PHASES = [
+    Phase("Scanner", lambda workload: workload.path, Scanner, legacy=True),
+    Phase("Parser", lambda workload: Scanner(workload.path).tokens, legacy_parse, legacy=True),
+    Phase("SemanticAnalyser",
+          lambda workload: legacy_parse(Scanner(workload.path).tokens), legacy_analyse,
+          legacy=True),
+    Phase("CodeGenerator",
+          lambda workload: legacy_analyse(legacy_parse(Scanner(workload.path).tokens)),
+          lambda ast: CodeGenerator(ast).generate(), legacy=True),
+    Phase("end-to-end (legacy)", lambda workload: workload, legacy_compile, legacy=True),
+    Phase("iter_tokens", lambda workload: workload.source,
+          lambda source: list(iter_tokens(source))),
+    Phase("IterativeParser", lambda workload: list(iter_tokens(workload.source)), parse),
+    Phase("analyse_single_pass", lambda workload: parse(iter_tokens(workload.source)),
+          analyse_single_pass),
+    Phase("IterativeCodeGenerator", lambda workload: analyse(workload.source),
+          lambda ast: render_script(IterativeCodeGenerator(ast).generate())),
+    Phase("end-to-end", lambda workload: workload.source, compile_source),
+]
+
+
+def measure(phase: Phase, workload: Workload, repeat: int) -> Dict[str, float]:
+    """
+    Times a phase (keeping the best of repeat runs), then runs it once more under tracemalloc
+    to find the peak memory it allocates beyond its input.
+    :return: the best and mean times in seconds, and the peak allocated bytes
+    """
+    times = list()
+    for _ in range(repeat):
+        argument = phase.setup(workload)
+        start = perf_counter()
+        phase.run(argument)
+        times.append(perf_counter() - start)
+        del argument
+
+    argument = phase.setup(workload)
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        phase.run(argument)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(times), "mean_seconds": sum(times) / len(times), "peak_bytes": peak}
+
+
+def run(statements: int, seed: int = 0, declarations: Optional[int] = None,
+        chain_length: int = 1, float_ratio: float = 0.5, repeat: int = 3,
+        phases: Sequence[Phase] = tuple(PHASES)) -> Dict[str, Any]:
+    """
+    Runs the benchmark suite on a generated workload.
+    :return: the results, with the workload and environment, ready to be saved as JSON
+    """
+    workload_options = {"statements": statements, "seed": seed, "declarations": declarations,
+                        "chain_length": chain_length, "float_ratio": float_ratio}
+    source = generate_program(**workload_options)
+    with NamedTemporaryFile("w", suffix=".ac", delete=False) as file:
+        file.write(source)
+    workload = Workload(source, file.name)
+    results: Dict[str, Dict[str, float]] = dict()
+    try:
+        for phase in phases:
+            # The legacy Parser cannot parse chains of more than two operands
+            if phase.legacy and chain_length > 1:
+                continue
+            # ... and recurses once per statement
+            limit = sys.getrecursionlimit()
+            if phase.legacy:
+                sys.setrecursionlimit(max(limit, 4 * statements + 1000))
+            try:
+                result = measure(phase, workload, repeat)
+            finally:
+                sys.setrecursionlimit(limit)
+            result["statements_per_second"] = statements / result["seconds"]
+            result["characters_per_second"] = len(source) / result["seconds"]
+            results[phase.name] = result
+    finally:
+        remove(file.name)
+    return {"version": __version__, "python": platform.python_version(),
+            "platform": platform.platform(), "workload": workload_options,
+            "characters": len(source), "repeat": repeat, "phases": results}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float = 0.1) -> List[Tuple[str, float, float, float]]:
+    """
+    Compares the best times of each phase against a baseline.
+    :param results: the results of the current run
+    :param baseline: the results of the baseline run
+    :param threshold: the relative slowdown above which a phase counts as a regression
+    :return: the name, baseline seconds, current seconds and relative change of each phase
+             which regressed
+    """
+    regressions = list()
+    for name, result in results["phases"].items():
+        previous = baseline["phases"].get(name)
+        if previous is None:
+            continue
+        change = result["seconds"] / previous["seconds"] - 1
+        if change > threshold:
+            regressions.append((name, previous["seconds"], result["seconds"], change))
+    return regressions
+
+
+def report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    header = f"{'phase':>24} {'best s':>9} {'stmt/s':>12} {'peak MiB':>9}"
+    print(header + (f" {'baseline s':>11} {'change':>8}" if baseline else ""))
+    for name, result in results["phases"].items():
+        line = (f"{name:>24} {result['seconds']:>9.4f} "
+                f"{result['statements_per_second']:>12,.0f} "
+                f"{result['peak_bytes'] / 2 ** 20:>9.2f}")
+        previous = baseline["phases"].get(name) if baseline else None
+        if previous is not None:
+            change = result["seconds"] / previous["seconds"] - 1
+            line += f" {previous['seconds']:>11.4f} {change:>+8.1%}"
+        print(line)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    arguments = ArgumentParser(description="Benchmark each phase of the compiler.")
+    arguments.add_argument("--statements", type=int, default=20_000)
+    arguments.add_argument("--seed", type=int, default=0)
+    arguments.add_argument("--declarations", type=int, default=None,
+                           help="number of declared identifiers (default: all 23)")
+    arguments.add_argument("--chain-length", type=int, default=1,
+                           help="operators per expression (legacy phases need 1)")
+    arguments.add_argument("--float-ratio", type=float, default=0.5,
+                           help="fraction of identifiers declared as floats")
+    arguments.add_argument("--repeat", type=int, default=3, help="timed runs per phase")
+    arguments.add_argument("-o", "--output", help="save the results as JSON here")
+    arguments.add_argument("--baseline", help="compare against results saved earlier")
+    arguments.add_argument("--threshold", type=float, default=0.1,
+                           help="relative slowdown flagged as a regression (default 0.1)")
+    options = arguments.parse_args(argv)
+
+    results = run(options.statements, options.seed, options.declarations,
+                  options.chain_length, options.float_ratio, options.repeat)
+    baseline = None
+    if options.baseline:
+        with open(options.baseline) as file:
+            baseline = json.load(file)
+        if baseline["workload"] != results["workload"]:
+            print("Warning: the baseline was run on a different workload", file=sys.stderr)
+    report(results, baseline)
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, options.threshold)
+        for name, previous, current, change in regressions:
+            print(f"Regression: {name} took {current:.4f}s against {previous:.4f}s "
+                  f"({change:+.1%})", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
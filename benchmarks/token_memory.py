@@ -0,0 +1,55 @@
+"""
+Compares the memory held by the tokens of generated programs stored as a list of
+per-instance-dict tokens (the original Token class), as a list of slotted, interned Tokens,
+and in a TokenBuffer.
+
+Usage: python -m benchmarks.token_memory [statements ...]
+"""
+import sys
+import tracemalloc
+from typing import Callable
+from ac_compiler.scanner import TokenBuffer, iter_tokens
+from .workload import generate_program
+
+
+class DictToken:
+    """
+    The original Token: a plain class with a per-instance __dict__, allocated per token.
+    """
+    def __init__(self, type_, value=None):
+        self.type = type_
+        self.value = value
+
+
+def held(build: Callable[[], object]) -> int:
+    """
+    Measures the memory still allocated by the object which build returns.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def main(sizes) -> None:
+    print(f"{'statements':>10} {'tokens':>9} {'dict MiB':>9} {'slotted MiB':>12} "
+          f"{'buffer MiB':>11} {'reduction':>10}")
+    for statements in sizes:
+        source = generate_program(statements)
+        original = held(lambda: [DictToken(token.type, token.value)
+                                 for token in iter_tokens(source)])
+        slotted = held(lambda: list(iter_tokens(source)))
+        buffer = held(lambda: TokenBuffer.scan(source))
+        count = len(TokenBuffer.scan(source))
+        print(f"{statements:>10} {count:>9} {original / 2 ** 20:>9.2f} "
+              f"{slotted / 2 ** 20:>12.2f} {buffer / 2 ** 20:>11.2f} "
+              f"{original / buffer:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [10_000, 100_000])
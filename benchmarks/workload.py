@@ -0,0 +1,64 @@
+from random import Random
+from string import ascii_lowercase
+from typing import List, Optional, Tuple
+
+
+IDENTIFIERS = [letter for letter in ascii_lowercase if letter not in "fip"]
+
+
+def generate_program(statements: int, seed: int = 0, declarations: Optional[int] = None,
+                     chain_length: int = 1, float_ratio: float = 0.5,
+                     print_ratio: float = 0.2, repeat_ratio: float = 0.0) -> str:
+    """
+    Generates a valid ac program declaring and initialising identifiers, followed by the given
+    number of assignment and print statements. Float variables are assigned from any
+    variable, int variables only from int variables, so the program always type checks.
+    :param statements: the number of statements to generate after the declarations
+    :param seed: the seed for the random number generator, so workloads are reproducible
+    :param declarations: the number of identifiers to declare (at most 23, the default)
+    :param chain_length: the number of operators in each assigned expression (the legacy
+                         Parser only accepts 1)
+    :param float_ratio: the fraction of identifiers declared as floats
+    :param print_ratio: the fraction of statements which are prints
+    :param repeat_ratio: the fraction of assignments which repeat the expression of one of
+                         the last few assignments (when its type allows)
+    :return: the source of the generated program
+    """
+    random = Random(seed)
+    identifiers = IDENTIFIERS[:declarations] if declarations is not None else IDENTIFIERS
+    if not identifiers:
+        raise ValueError("A program needs at least one declaration")
+    floats = set(random.sample(identifiers, int(len(identifiers) * float_ratio)))
+    integers = [name for name in identifiers if name not in floats]
+    parts: List[str] = [f"{'f' if name in floats else 'i'} {name}" for name in identifiers]
+    parts.extend([f"{name} = {random.randint(0, 99)}" for name in identifiers])
+    recent: List[Tuple[str, bool]] = list()
+
+    for _ in range(statements):
+        target = random.choice(identifiers)
+        if random.random() < print_ratio:
+            parts.append(f"p {target}")
+            continue
+        if repeat_ratio and random.random() < repeat_ratio:
+            repeatable = [expression for expression, float_ in recent[-4:]
+                          if target in floats or not float_]
+            if repeatable:
+                parts.append(f"{target} = {random.choice(repeatable)}")
+                continue
+        operands = identifiers if target in floats else integers
+        operand = random.choice(operands)
+        if target in floats:
+            value = f"{random.randint(0, 999)}.{random.randint(0, 99)}"
+        else:
+            value = str(random.randint(0, 9999))
+        operator = random.choice("+-")
+        expression = f"{operand} {operator} {value}"
+        for _ in range(chain_length - 1):
+            operator = random.choice("+-")
+            expression += f" {operator} {random.choice(operands)}"
+        parts.append(f"{target} = {expression}")
+        if repeat_ratio:
+            recent.append((expression, target in floats))
+
+    parts.append(f"p {identifiers[0]}")
+    return " ".join(parts)
@@ -0,0 +1,80 @@
+from decimal import Decimal
+from io import StringIO
+from os import path
+from ac_compiler.evaluator import Evaluator
+from ac_compiler.parser import IterativeParser
+from ac_compiler.parser.ast import AST
+from ac_compiler.scanner import iter_tokens
+from ac_compiler.semantic import SemanticAnalyser
+from ac_compiler.util import add, format_dc, subtract
+
+SAMPLE = path.join(path.dirname(__file__), "sample.ac")
+
+PROGRAM = "f b i a a = 5 b = a + 3.2 p b p a b = b - 8.2 p b b = b - 0.25 p b a = a - 7 p a"
+
+
+def analysed(tokens, parser=IterativeParser, single_pass: bool = True) -> SemanticAnalyser:
+    """
+    Parses and analyses a program.
+    :param tokens: the tokens of the program
+    :param parser: the parser class to parse them with
+    :param single_pass: whether to analyse in a single pass, rather than populating the
+                        symbol table first
+    :return: the semantic analyser, holding the analysed AST and the symbol table
+    """
+    parser = parser(tokens)
+    parser.parse()
+    analyser = SemanticAnalyser(ast=parser.ast)
+    if single_pass:
+        analyser.analyse_single_pass()
+    else:
+        analyser.populate_symbol_table()
+        analyser.analyse()
+    return analyser
+
+
+def analyse(source) -> AST:
+    """
+    Scans, parses and analyses a program.
+    :param source: anything accepted by iter_tokens
+    :return: the analysed AST
+    """
+    return analysed(iter_tokens(source)).ast
+
+
+def evaluate(ast: AST) -> str:
+    """
+    :param ast: an analysed AST
+    :return: what the program prints, according to the Evaluator
+    """
+    output = StringIO()
+    Evaluator(ast, output).run()
+    return output.getvalue()
+
+
+def simulate(script: str) -> str:
+    """
+    Runs the dc instructions the generators emit, returning what dc would print. As in dc,
+    loading a register which was never stored to pushes 0.
+    """
+    stack, registers, printed = list(), dict(), list()
+    for code in script.split():
+        if code == "k":
+            stack.pop()
+        elif code in "+-":
+            right = stack.pop()
+            stack.append((add if code == "+" else subtract)(stack.pop(), right))
+        elif code == "d":
+            stack.append(stack[-1])
+        elif code == "r":
+            stack[-2], stack[-1] = stack[-1], stack[-2]
+        elif code == "p":
+            printed.append(format_dc(stack[-1]) + "\n")
+        elif code[0] == "s":
+            registers[code[1]] = stack.pop()
+        elif code[0] == "l":
+            stack.append(registers.get(code[1], 0))
+        else:
+            numeral = code.replace("_", "-")
+            stack.append(Decimal(numeral) if "." in numeral else int(numeral))
+    return "".join(printed)
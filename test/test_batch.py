@@ -0,0 +1,55 @@
+import pytest
+from ac_compiler.driver import BatchCompiler, compile_source
+from ac_compiler.driver.batch import main
+
+
+def write_programs(directory):
+    paths = list()
+    for index in range(10):
+        path = directory / f"program{index}.ac"
+        path.write_text(f"f b i a\na = {index}\nb = a + 3.2\np b\n")
+        paths.append(str(path))
+    bad = directory / "bad.ac"
+    bad.write_text("i a a = 1.5")
+    paths.insert(3, str(bad))
+    return paths
+
+
+def test_batch_ordered(tmp_path):
+    paths = write_programs(tmp_path)
+    for workers in (1, 2):
+        results = list(BatchCompiler(workers, chunk_size=3).compile(paths))
+        assert [result.path for result in results] == paths
+        assert results[3].error_type == "SemanticError"
+        assert results[0].dc == compile_source("f b i a a = 0 b = a + 3.2 p b")
+
+
+def test_batch_unordered(tmp_path):
+    paths = write_programs(tmp_path)
+    results = list(BatchCompiler(2, chunk_size=2).compile(paths, ordered=False))
+    assert sorted(result.path for result in results) == sorted(paths)
+    assert sum(result.error is not None for result in results) == 1
+
+
+def test_batch_cli(tmp_path, capsys):
+    write_programs(tmp_path)
+    output = tmp_path / "out"
+    assert main([str(tmp_path), "-j", "1", "-o", str(output)]) == 1
+    assert len(list(output.glob("*.dc"))) == 10
+    assert "bad.ac: SemanticError" in capsys.readouterr().err
+
+
+def test_batch_cli_nested(tmp_path, capsys):
+    for directory in ("a", "b"):
+        (tmp_path / "in" / directory).mkdir(parents=True)
+        (tmp_path / "in" / directory / "x.ac").write_text(f"i {directory} {directory} = 1 "
+                                                          f"p {directory}")
+    output = tmp_path / "out"
+    assert main([str(tmp_path / "in"), "-j", "1", "-o", str(output)]) == 0
+    assert (output / "a" / "x.dc").read_text() == compile_source("i a a = 1 p a")
+    assert (output / "b" / "x.dc").read_text() == compile_source("i b b = 1 p b")
+
+    files = [str(tmp_path / "in" / directory / "x.ac") for directory in ("a", "b")]
+    with pytest.raises(SystemExit):
+        main(files + ["-o", str(output)])
+    assert "would both be written" in capsys.readouterr().err
@@ -0,0 +1,24 @@
+from ac_compiler.driver import compile_source
+from benchmarks.suite import compare, run
+from benchmarks.workload import generate_program
+
+
+def test_workload_parameters():
+    for options in ({}, {"declarations": 1}, {"chain_length": 5, "float_ratio": 0.0},
+                    {"declarations": 4, "float_ratio": 1.0, "print_ratio": 0.0},
+                    {"declarations": 3, "chain_length": 3, "repeat_ratio": 0.5}):
+        source = generate_program(100, seed=1, **options)
+        assert source == generate_program(100, seed=1, **options)
+        compile_source(source)
+    assert generate_program(10, chain_length=3).count("+") + \
+        generate_program(10, chain_length=3).count("-") > 10
+
+
+def test_suite_regressions():
+    results = run(50, repeat=1)
+    assert "Parser" in results["phases"] and "end-to-end" in results["phases"]
+    assert compare(results, results) == []
+    slower = {"phases": {name: dict(result, seconds=result["seconds"] * 2)
+                         for name, result in results["phases"].items()}}
+    assert len(compare(slower, results, threshold=0.5)) == len(results["phases"])
+    assert "Parser" not in run(50, chain_length=2, repeat=1)["phases"]
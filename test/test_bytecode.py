@@ -0,0 +1,36 @@
+from io import BytesIO, StringIO
+import pytest
+from ac_compiler.bytecode import Bytecode, BytecodeCompiler, VirtualMachine
+from . import PROGRAM, analyse, evaluate
+
+
+def compile_program(source):
+    ast = analyse(source)
+    return ast, BytecodeCompiler(ast).compile()
+
+
+def test_vm_matches_evaluator():
+    ast, bytecode = compile_program(PROGRAM)
+    executed = StringIO()
+    VirtualMachine(bytecode, executed).run()
+    assert executed.getvalue() == evaluate(ast)
+
+
+def test_bytecode_round_trip():
+    _, bytecode = compile_program(PROGRAM)
+    file = BytesIO()
+    bytecode.dump(file)
+    file.seek(0)
+    loaded = Bytecode.load(file)
+    assert loaded == bytecode
+    assert loaded.slots == ["b", "a"]
+    with pytest.raises(ValueError):
+        Bytecode.from_bytes(b"not bytecode" * 2)
+
+
+def test_vm_uninitialised():
+    # dc loads 0 from a register which was never stored to
+    ast, bytecode = compile_program("i a i b b = a + 1 p b p a")
+    executed = StringIO()
+    assert VirtualMachine(bytecode, executed).run() == {"b": 1, "a": 0}
+    assert executed.getvalue() == evaluate(ast) == "1\n0\n"
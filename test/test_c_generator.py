@@ -0,0 +1,56 @@
+from os import chmod, path
+from shutil import which
+import pytest
+from ac_compiler.generator import (CGenerator, CToolchain, IterativeCodeGenerator,
+                                   render_script, run_dc)
+from ac_compiler.util import BuildError
+from . import PROGRAM, analyse, evaluate
+
+pytestmark = pytest.mark.skipif(which("cc") is None, reason="cc is not installed")
+
+PROGRAMS = [
+    PROGRAM,
+    "f a i b f c b = 12 a = b c = a - 0.125 - 12 p a p c c = c + 1.125 p c",
+]
+
+
+def run_c(source, toolchain):
+    return toolchain.run(toolchain.build(CGenerator(analyse(source)).generate())).stdout
+
+
+def test_c_backend_matches_evaluator(tmp_path):
+    toolchain = CToolchain(str(tmp_path))
+    for source in PROGRAMS:
+        assert run_c(source, toolchain) == evaluate(analyse(source))
+
+
+@pytest.mark.skipif(which("dc") is None, reason="dc is not installed")
+def test_c_backend_matches_dc(tmp_path):
+    toolchain = CToolchain(str(tmp_path))
+    for source in PROGRAMS:
+        script = render_script(IterativeCodeGenerator(analyse(source)).generate())
+        assert run_c(source, toolchain) == run_dc(script).stdout
+
+
+def test_toolchain_cache(tmp_path):
+    toolchain = CToolchain(str(tmp_path))
+    source = CGenerator(analyse(PROGRAMS[0])).generate()
+    binary = toolchain.build(source)
+    assert toolchain.build(source) == binary
+    assert path.dirname(binary) == str(tmp_path)
+    with pytest.raises(BuildError):
+        toolchain.build("int main(void) { return }")
+
+
+def test_toolchain_refuses_tampered_binary(tmp_path):
+    toolchain = CToolchain(str(tmp_path))
+    source = CGenerator(analyse(PROGRAMS[0])).generate()
+    binary = toolchain.build(source)
+    chmod(binary, 0o777)
+    with pytest.raises(BuildError, match="writable"):
+        toolchain.build(source)
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        CToolchain(str(shared))
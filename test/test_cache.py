@@ -0,0 +1,68 @@
+import os
+import stat
+import pytest
+from ac_compiler.driver import CompilationCache, compile_source
+from ac_compiler.driver.cache import compiler_fingerprint
+from ac_compiler.util.directories import private_directory, user_cache_directory
+
+SOURCE = "f b i a a = 5 b = a + 3.2 p b"
+
+
+def test_cache_hits(tmp_path):
+    cache = CompilationCache(str(tmp_path))
+    assert cache.compile(SOURCE) == compile_source(SOURCE)
+    assert cache.compile(SOURCE) == compile_source(SOURCE)
+    assert cache.compile(SOURCE, level=2) == compile_source(SOURCE, 2)
+    assert cache.statistics["misses"] == 2 and cache.statistics["memory_hits"] == 1
+
+    cold = CompilationCache(str(tmp_path))
+    assert cold.compile(SOURCE.encode()) == compile_source(SOURCE)
+    assert cold.statistics["disk_hits"] == 1 and cold.hit_rate() == 1.0
+
+
+def test_cache_artifacts(tmp_path):
+    cache = CompilationCache(str(tmp_path))
+    tokens = cache.tokens(SOURCE)
+    assert [token.value for token in CompilationCache(str(tmp_path)).tokens(SOURCE)] == \
+        [token.value for token in tokens]
+    ast = CompilationCache(str(tmp_path)).ast(SOURCE)
+    assert ast.children[3].right().left().value == "a"
+
+
+def test_cache_eviction(tmp_path):
+    cache = CompilationCache(str(tmp_path), max_bytes=200, memory_entries=1)
+    for value in range(20):
+        cache.compile(f"i a a = {value} p a")
+    assert cache.statistics["evictions"] > 0
+    assert sum(size for _, size, _ in cache.entries()) <= 200
+    cold = CompilationCache(str(tmp_path))
+    assert cold.compile("i a a = 19 p a") == compile_source("i a a = 19 p a")
+    assert cold.statistics["disk_hits"] == 1
+
+
+def test_cache_directory_is_private(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "home"))
+    assert user_cache_directory("cache") == str(tmp_path / "home" / "ac_compiler" / "cache")
+    directory = private_directory(user_cache_directory("cache"))
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        CompilationCache(str(shared))
+    if hasattr(os, "getuid") and os.getuid() == 0:
+        foreign = tmp_path / "foreign"
+        foreign.mkdir(mode=0o700)
+        os.chown(foreign, 1, 1)
+        with pytest.raises(PermissionError, match="not owned"):
+            CompilationCache(str(foreign))
+
+
+def test_cache_overwrite_size(tmp_path):
+    cache = CompilationCache(str(tmp_path))
+    for _ in range(3):
+        cache.put("ab" * 32, b"0123456789")
+    assert cache.size == 10
+    assert CompilationCache.key(b"p a", "dc") != CompilationCache.key(b"p a", "dc", 3)
+    assert len(compiler_fingerprint()) == 64
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from os import path
+from ac_compiler.cli import main
+from ac_compiler.driver import compile_source
+
+SOURCE = "f b i a a = 5 b = a + 3.2 p b"
+
+
+def test_cli_modes(tmp_path, capsys):
+    program = tmp_path / "program.ac"
+    program.write_text(SOURCE)
+    assert main(["dc", str(program)]) == 0
+    assert capsys.readouterr().out == compile_source(SOURCE)
+    assert main(["run", str(program)]) == 0
+    assert capsys.readouterr().out == "8.2\n"
+    assert main(["check", str(program)]) == 0
+    assert capsys.readouterr().out == ""
+    assert main(["scan", str(program)]) == 0
+    assert capsys.readouterr().out.splitlines()[-1] == "<END: None>"
+    assert main(["parse", str(program)]) == 0
+    assert "  PLUS\n    ID a\n    FNUM 3.2\n" in capsys.readouterr().out
+
+    output = tmp_path / "program.dc"
+    assert main(["dc", "-O2", str(program), "-o", str(output)]) == 0
+    assert output.read_text() == compile_source(SOURCE, 2)
+
+
+def test_cli_errors(tmp_path, capsys):
+    program = tmp_path / "program.ac"
+    program.write_text("i a b = 1")
+    assert main(["check", str(program)]) == 1
+    assert capsys.readouterr().err.startswith("SymbolError")
+    assert main(["compile", str(program)]) == 2
+    assert main(["dc", "-O"]) == 2
+    assert main(["dc", str(tmp_path / "missing.ac")]) == 1
+
+
+def test_cli_lazy_imports():
+    modules = subprocess.run(
+        [sys.executable, "-c", "import sys; from ac_compiler.driver.pipeline import analyse; "
+                               "print(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True,
+        cwd=path.dirname(path.dirname(path.abspath(__file__)))).stdout.split()
+    assert "ac_compiler.parser.iterative_parser" in modules
+    for module in ("ac_compiler.driver.batch", "ac_compiler.generator.toolchain",
+                   "ac_compiler.parser.compact_ast", "ac_compiler.server"):
+        assert module not in modules
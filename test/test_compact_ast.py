@@ -0,0 +1,32 @@
+import pytest
+from ac_compiler.generator import CodeGenerator
+from ac_compiler.parser import AST, CompactAST, IterativeParser
+from ac_compiler.scanner import Tokens, iter_tokens
+from ac_compiler.semantic import SemanticAnalyser
+from ac_compiler.semantic.symbol_table import DataType
+from . import SAMPLE
+
+
+def generate(ast_class):
+    with open(SAMPLE) as file:
+        parser = IterativeParser(iter_tokens(file), ast_class)
+        parser.parse()
+    analyser = SemanticAnalyser(ast=parser.ast)
+    analyser.populate_symbol_table()
+    analyser.analyse()
+    return parser.ast, CodeGenerator(ast=analyser.ast).generate()
+
+
+def test_compact_ast_generates_same_code():
+    assert generate(CompactAST)[1] == generate(AST)[1]
+
+
+def test_compact_ast_view():
+    ast, _ = generate(CompactAST)
+    statement = ast.children[3]
+    assert statement.type == Tokens.ASSIGN
+    assert statement.left().value == "b"
+    assert statement.right().datatype == DataType.FLOAT
+    assert [child.datatype for child in statement.right().children] == [DataType.FLOAT] * 2
+    with pytest.raises(IndexError):
+        statement.child()
@@ -0,0 +1,30 @@
+from ac_compiler.generator import IterativeCodeGenerator
+from ac_compiler.optimiser import ConstantFolder
+from . import analyse
+
+
+def fold(source):
+    folder = ConstantFolder(analyse(source))
+    return IterativeCodeGenerator(folder.fold()).generate(), folder.removed
+
+
+def test_fold_constant_chain():
+    assert fold("i a a = 1 + 2 - 10 + 4") == (["_3", "sa", "0 k"], 6)
+
+
+def test_fold_respects_datatypes():
+    assert fold("f a a = 1.25 + 1.75 + 2")[0] == ["5.00", "sa", "0 k"]
+    assert fold("i a i b b = 1 + a + 2 - 3")[0] == ["la", "sb", "0 k"]
+    assert fold("i a f b b = a + 0.0")[0] == ["la", "0.0", "+", "sb", "0 k"]
+
+
+def test_fold_flattens_chains():
+    assert fold("i a i b i c c = 5 - a + 1 - b")[0] == [
+        "6", "la", "-", "lb", "-", "sc", "0 k"]
+    assert fold("i a i b i c c = 2 - a + b - 3")[0] == [
+        "lb", "la", "-", "1", "-", "sc", "0 k"]
+
+
+def test_fold_keeps_scale_of_zero_partial_sum():
+    # 2.0 - 2.0 is a zero with a scale, which must survive adding an integer
+    assert fold("f y y = 2.0 - 2.0 - 2 p y")[0][:2] == ["_2.0", "sy"]
@@ -0,0 +1,48 @@
+import pytest
+from ac_compiler.driver import compile_source
+from ac_compiler.generator import IterativeCodeGenerator
+from ac_compiler.optimiser import DeadStoreEliminator, Liveness
+from ac_compiler.scanner import iter_tokens
+from ac_compiler.util import SymbolError
+from benchmarks.workload import generate_program
+from . import analyse, analysed, evaluate
+
+
+def test_liveness():
+    statements = analyse("i a i b a = 1 b = a a = 2 p b").root.children
+    liveness = Liveness(statements)
+    assert [liveness.dead(index) for index in range(len(statements))] == [
+        False, False, False, False, True, False]
+    assert liveness.live_after(2, "a") and not liveness.live_after(3, "a")
+    assert liveness.live_after(3, "b") and liveness.live_in == 0
+
+
+def test_eliminate_dead_stores():
+    source = "i a i b i c a = 1 c = 7 b = a + 2 a = 3 b = b + c p b c = 1"
+    analyser = analysed(iter_tokens(source))
+    eliminator = DeadStoreEliminator(analyser.ast, analyser.symbol_table)
+    generated = IterativeCodeGenerator(eliminator.eliminate()).generate()
+    assert generated == ["1", "sa", "0 k", "7", "sc", "0 k", "la", "2", "+", "sb", "0 k",
+                         "lb", "lc", "+", "sb", "0 k", "lb", "p", "si"]
+    assert eliminator.removed_statements == 2
+    assert eliminator.removed_instructions == 6
+    assert eliminator.removed_declarations == 0
+
+
+def test_eliminate_unused_declarations():
+    analyser = analysed(iter_tokens("i a f b i c a = 1 b = a + 2.5 p a"))
+    eliminator = DeadStoreEliminator(analyser.ast, analyser.symbol_table)
+    eliminator.eliminate()
+    assert eliminator.removed_declarations == 2
+    assert set(analyser.symbol_table.symbols) == {"a"}
+    with pytest.raises(SymbolError):
+        analyser.symbol_table.lookup("b")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_eliminate_preserves_output(seed):
+    source = generate_program(300, seed=seed, declarations=6, chain_length=3)
+    ast = analyse(source)
+    expected = evaluate(ast)
+    assert evaluate(DeadStoreEliminator(ast).eliminate()) == expected
+    assert len(compile_source(source, 3).split()) < len(compile_source(source, 2).split())
@@ -0,0 +1,32 @@
+from shutil import which
+import pytest
+from ac_compiler.generator import IterativeCodeGenerator, render_script, run_dc
+from ac_compiler.parser import CompactAST, IterativeParser
+from ac_compiler.scanner import iter_tokens
+from . import PROGRAM, SAMPLE, analyse, analysed, evaluate, simulate
+
+
+def test_evaluator():
+    with open(SAMPLE) as file:
+        assert evaluate(analyse(file.read())) == "8.2\n"
+    assert evaluate(analyse(PROGRAM)) == "8.2\n5\n0\n-.25\n-2\n"
+
+
+def test_evaluator_uninitialised():
+    # dc loads 0 from a register which was never stored to
+    for source, printed in (("i a p a", "0\n"), ("i a i b b = a + 1 p b", "1\n")):
+        ast = analyse(source)
+        script = render_script(IterativeCodeGenerator(ast).generate())
+        assert evaluate(ast) == simulate(script) == printed
+
+
+@pytest.mark.skipif(which("dc") is None, reason="dc is not installed")
+def test_evaluator_matches_dc():
+    script = render_script(IterativeCodeGenerator(analyse(PROGRAM)).generate())
+    assert run_dc(script).stdout == evaluate(analyse(PROGRAM))
+
+
+def test_evaluator_compact_ast():
+    source = "f a f b a = 1.5 b = 2.25 p a p b a = 3.75 p a"
+    ast = analysed(iter_tokens(source), lambda tokens: IterativeParser(tokens, CompactAST)).ast
+    assert evaluate(ast) == "1.5\n2.25\n3.75\n" == evaluate(analyse(source))
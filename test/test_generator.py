@@ -2,10 +2,11 @@ from ac_compiler.parser import Parser
 from ac_compiler.scanner import Scanner
 from ac_compiler.semantic import SemanticAnalyser
 from ac_compiler.generator import CodeGenerator
+from . import SAMPLE
 
 
 def test_generator():
-    scanner = Scanner("sample.ac")
+    scanner = Scanner(SAMPLE)
     parser = Parser(scanner.tokens)
     parser.parse()
     analyser = SemanticAnalyser(ast=parser.ast)
@@ -0,0 +1,60 @@
+import random
+import re
+import pytest
+from ac_compiler.driver import IncrementalCompiler, compile_source
+from ac_compiler.util import SymbolError
+from benchmarks.workload import generate_program
+
+SOURCE = "f b i a a = 5 b = a + 3.2 p b"
+
+
+def test_incremental_statement_edit():
+    compiler = IncrementalCompiler()
+    assert compiler.compile(SOURCE) == compile_source(SOURCE)
+    edited = SOURCE.replace("3.2", "4.25")
+    assert compiler.compile(edited) == compile_source(edited)
+    assert compiler.statistics["full"] == 1 and compiler.statistics["incremental"] == 1
+    assert compiler.statistics["regenerated_statements"] == 4
+
+
+def test_incremental_declaration_edit():
+    compiler = IncrementalCompiler()
+    compiler.compile(SOURCE)
+    edited = "f b f a" + SOURCE[7:]
+    assert compiler.compile(edited) == compile_source(edited)
+    assert compiler.statistics["incremental"] == 1
+
+
+def test_incremental_error_recovery():
+    compiler = IncrementalCompiler()
+    compiler.compile(SOURCE)
+    with pytest.raises(SymbolError):
+        compiler.compile(SOURCE + " c = 1")
+    assert compiler.compile(SOURCE + " p a") == compile_source(SOURCE + " p a")
+
+
+def test_incremental_random_edits():
+    source = generate_program(200, seed=3)
+    rng = random.Random(5)
+    compiler = IncrementalCompiler()
+    compiler.compile(source)
+    for _ in range(60):
+        numerals = list(re.finditer(r"[0-9]+(\.[0-9]+)?", source))
+        match = rng.choice(numerals)
+        if rng.random() < 0.5:
+            source = source[:match.start()] + str(rng.randrange(1000)) + source[match.end():]
+        else:
+            source = source[:match.end()] + " p " + rng.choice("ab") + source[match.end():]
+        assert compiler.compile(source) == compile_source(source)
+    assert compiler.statistics["full"] == 1 and compiler.statistics["incremental"] == 60
+    assert compiler.statistics["regenerated_statements"] < 60 * 4 + 300
+
+
+def test_incremental_failed_edit_keeps_state():
+    source = "i a i b i c a = 1 b = 2 c = 3 p a p b p c"
+    compiler = IncrementalCompiler()
+    compiler.compile(source)
+    with pytest.raises(SymbolError):
+        compiler.compile(source.replace("i b ", ""))
+    for edited in (source[:-1] + "a", source[:-5] + "c p c"):
+        assert compiler.compile(edited) == compile_source(edited)
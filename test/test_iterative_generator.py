@@ -0,0 +1,36 @@
+from shutil import which
+import pytest
+from ac_compiler.generator import (CodeGenerator, IterativeCodeGenerator, compare_with_legacy,
+                                   render_script)
+from benchmarks.workload import generate_program
+from . import PROGRAM, SAMPLE, analyse, simulate
+
+
+def test_iterative_generator():
+    with open(SAMPLE) as file:
+        ast = analyse(file)
+    assert IterativeCodeGenerator(ast).generate() == [
+        "5", "sa", "0 k", "la", "3.2", "+", "sb", "0 k", "lb", "p", "si"]
+
+
+def test_iterative_generator_linear_output():
+    operands = 10_000
+    ast = analyse("i a a = " + " - ".join(["1"] * operands))
+    assert len(IterativeCodeGenerator(ast).generate()) == 2 * operands - 1 + 2
+
+
+def test_render_script():
+    assert render_script(["l", "a", 5, "s", "b", "lb", "p"]) == "la 5 sb lb p\n"
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_legacy(seed):
+    for source in ("i a f b a = 5 p a b = 2.5 p b", PROGRAM, generate_program(60, seed=seed)):
+        ast = analyse(source)
+        legacy = simulate(render_script(CodeGenerator(ast).generate()))
+        assert legacy and simulate(render_script(IterativeCodeGenerator(ast).generate())) == legacy
+
+
+@pytest.mark.skipif(which("dc") is None, reason="dc is not installed")
+def test_compare_with_legacy():
+    assert compare_with_legacy(analyse("i a f b a = 5 p a b = 2.5 p b")) is True
@@ -0,0 +1,42 @@
+import pytest
+from ac_compiler.parser import IterativeParser, Parser
+from ac_compiler.scanner import Scanner, Tokens, iter_tokens
+from ac_compiler.util import SyntaxParsingError
+from . import SAMPLE
+
+
+def shape(node):
+    value = node.value.value if node.type in (Tokens.FLOATDCL, Tokens.INTDCL) else node.value
+    return node.type, value, [shape(child) for child in node.children]
+
+
+def test_iterative_parser_matches_legacy():
+    parser = Parser(Scanner(SAMPLE).tokens)
+    parser.parse()
+    iterative = IterativeParser(iter(Scanner(SAMPLE).tokens))
+    iterative.parse()
+    assert shape(iterative.ast.root) == shape(parser.ast.root)
+
+
+def test_iterative_parser_left_associative_chain():
+    parser = IterativeParser(iter_tokens("i a a = 1 + 2 - a"))
+    parser.parse()
+    statement = parser.ast.children[1]
+    assert shape(statement.right()) == (Tokens.MINUS, None, [
+        (Tokens.PLUS, None, [(Tokens.INUM, 1, []), (Tokens.INUM, 2, [])]),
+        (Tokens.ID, "a", [])])
+
+
+def test_iterative_parser_constant_depth():
+    statements = 50_000
+    source = "i a " + " ".join(["a = a + 1"] * statements) + " a = " + " + ".join(["1"] * statements)
+    parser = IterativeParser(iter_tokens(source))
+    parser.parse()
+    assert len(parser.ast.children) == statements + 2
+
+
+def test_iterative_parser_errors():
+    with pytest.raises(SyntaxParsingError):
+        IterativeParser(iter_tokens("i a a = + 1")).parse()
+    with pytest.raises(SyntaxParsingError):
+        IterativeParser(iter_tokens("i a a = 1 = 2")).parse()
@@ -0,0 +1,52 @@
+import pytest
+from ac_compiler.driver import ParallelCompiler, compile_source
+from ac_compiler.driver.parallel import compile_statements, split_declarations, \
+    statement_start
+from ac_compiler.semantic.symbol_table import DataType
+from ac_compiler.util import SymbolError, SyntaxParsingError
+from benchmarks.workload import generate_program
+
+SOURCE = generate_program(500, seed=2, chain_length=3)
+
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+@pytest.mark.parametrize("threads", [False, True])
+def test_parallel_matches_serial(level, threads):
+    with ParallelCompiler(workers=3, level=level, threads=threads, min_length=0) as compiler:
+        assert compiler.compile(SOURCE) == compile_source(SOURCE, level)
+
+
+def test_parallel_small_program_is_serial():
+    compiler = ParallelCompiler(workers=4)
+    assert compiler.compile("f b b = 1.5 p b") == compile_source("f b b = 1.5 p b")
+    assert compiler.executor is None
+
+
+def test_parallel_error_is_canonical():
+    source = generate_program(100, seed=2, declarations=3)
+    with ParallelCompiler(workers=2, threads=True, min_length=0) as compiler:
+        with pytest.raises(SymbolError, match="No symbol found matching z"):
+            compiler.compile(source + " z = 1")
+        with pytest.raises(SyntaxParsingError):
+            compiler.compile(source + " f z")
+
+
+def test_split_declarations():
+    symbol_table, start = split_declarations("f b i a a = 5 p a")
+    assert symbol_table.symbols == {"b": DataType.FLOAT, "a": DataType.INT}
+    assert start == 8
+    with pytest.raises(SymbolError):
+        symbol_table.enter("c", DataType.INT)
+
+
+def test_statement_start():
+    source = "i a a = 12345 + a p a"
+    assert statement_start(source, 3) == 4
+    assert statement_start(source, 9) == 18
+    assert statement_start(source, 19) == len(source)
+
+
+def test_compile_statements_shares_symbol_table():
+    symbol_table, start = split_declarations("i a a = 1")
+    assert compile_statements("a = a + 1 p a", symbol_table) == "la 1 + sa 0 k la p si"
+    assert symbol_table.symbols == {"a": DataType.INT}
@@ -1,9 +1,10 @@
 from ac_compiler.parser import Parser
 from ac_compiler.scanner import Scanner
+from . import SAMPLE
 
 
 def test_parser():
-    scanner = Scanner("sample.ac")
+    scanner = Scanner(SAMPLE)
     parser = Parser(scanner.tokens)
     parser.parse()
     print(parser)
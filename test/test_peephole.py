@@ -0,0 +1,25 @@
+from ac_compiler.generator import PeepholeOptimiser
+
+
+def optimise(generated, level):
+    optimiser = PeepholeOptimiser(generated, level)
+    return optimiser.optimise(), optimiser.removed
+
+
+def test_peephole_level_0():
+    assert optimise(["5", "sa", "0 k"], 0) == (["5", "sa", "0 k"], 0)
+
+
+def test_peephole_precision():
+    generated = ["5", "sa", "0 k", "la", "5 k", "3.2", "+", "sb", "0 k", "5 k", "5 k"]
+    assert optimise(generated, 1) == (["5", "d", "sa", "5 k", "3.2", "+", "sb", "0 k", "5 k"], 2)
+
+
+def test_peephole_register_pairs():
+    assert optimise(["la", "sa", "lb", "p", "si"], 1) == (["lb", "p", "si"], 2)
+    assert optimise(["l", "a", "s", "a", 5], 1) == (["5"], 2)
+
+
+def test_peephole_level_2():
+    generated = ["5", "sa", "0 k", "la", "p", "si", "5 k", "lb", "p", "si"]
+    assert optimise(generated, 2) == (["5", "d", "sa", "p", "lb", "p"], 4)
@@ -0,0 +1,35 @@
+from hashlib import sha256
+from io import StringIO
+from ac_compiler.generator import compile_python
+from ac_compiler.generator.python_generator import PROGRAM_CACHE, PROGRAM_CACHE_SIZE
+from . import PROGRAM, analyse, evaluate
+
+
+def run(source):
+    output = StringIO()
+    compile_python(source).run(output)
+    return output.getvalue()
+
+
+def test_python_backend_matches_evaluator():
+    assert run(PROGRAM) == evaluate(analyse(PROGRAM))
+
+
+def test_python_backend_long_chain():
+    source = "f a a = " + " + ".join(["0.5"] * 5_000) + " p a"
+    assert run(source) == "2500.0\n"
+
+
+def test_python_backend_cache():
+    assert compile_python(PROGRAM) is compile_python(PROGRAM)
+    for value in range(PROGRAM_CACHE_SIZE + 1):
+        compile_python(f"i a a = {value} p a")
+    assert len(PROGRAM_CACHE) == PROGRAM_CACHE_SIZE
+    assert sha256(f"i a a = {PROGRAM_CACHE_SIZE} p a".encode()).hexdigest() in PROGRAM_CACHE
+    assert sha256(PROGRAM.encode()).hexdigest() not in PROGRAM_CACHE
+
+
+def test_python_backend_uninitialised():
+    # dc loads 0 from a register which was never stored to
+    source = "i a f b f c b = c + 1.5 a = a + 1 p a p b p c"
+    assert run(source) == evaluate(analyse(source)) == "1\n1.5\n0\n"
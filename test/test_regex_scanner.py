@@ -0,0 +1,19 @@
+from ac_compiler.scanner import RegexScanner, Scanner, Tokens
+from . import SAMPLE
+
+
+def token_stream(scanner):
+    return [(token.type, token.value) for token in scanner.tokens]
+
+
+def test_regex_scan_matches_legacy():
+    assert token_stream(RegexScanner(SAMPLE)) == token_stream(Scanner(SAMPLE))
+
+
+def test_regex_scan_numerals(tmp_path):
+    path = tmp_path / "numerals.ac"
+    path.write_text("f a a = 12.50 - 7 p a")
+    assert token_stream(RegexScanner(str(path))) == [
+        (Tokens.FLOATDCL, None), (Tokens.ID, "a"), (Tokens.ID, "a"), (Tokens.ASSIGN, None),
+        (Tokens.FNUM, 12.5), (Tokens.MINUS, None), (Tokens.INUM, 7), (Tokens.PRINT, None),
+        (Tokens.ID, "a"), (Tokens.END, None)]
@@ -1,6 +1,16 @@
 from ac_compiler.scanner.scanner import Scanner
+from ac_compiler.scanner.tokens import Tokens
+from . import SAMPLE
 
 
 def test_scan():
-    scanner = Scanner("sample.ac")
+    scanner = Scanner(SAMPLE)
     print(scanner)
+
+
+def test_scan_trailing_newline(tmp_path):
+    file = tmp_path / "program.ac"
+    file.write_text("i a\na = 5\np a\n")
+    assert [(token.type, token.value) for token in Scanner(str(file)).tokens] == [
+        (Tokens.INTDCL, None), (Tokens.ID, "a"), (Tokens.ID, "a"), (Tokens.ASSIGN, None),
+        (Tokens.INUM, 5), (Tokens.PRINT, None), (Tokens.ID, "a"), (Tokens.END, None)]
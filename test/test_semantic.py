@@ -1,13 +1,43 @@
+import pytest
 from ac_compiler.parser import Parser
-from ac_compiler.scanner import Scanner
+from ac_compiler.scanner import Scanner, iter_tokens
 from ac_compiler.semantic import SemanticAnalyser
+from ac_compiler.semantic.symbol_table import DataType
+from ac_compiler.util import SemanticError, SymbolError
+from . import SAMPLE, analysed
 
 
 def test_semantic():
-    scanner = Scanner("sample.ac")
+    scanner = Scanner(SAMPLE)
     parser = Parser(scanner.tokens)
     parser.parse()
     analyser = SemanticAnalyser(ast=parser.ast)
     analyser.populate_symbol_table()
     print(analyser.symbol_table)
     analyser.analyse()
+
+
+def annotated(node):
+    return node.type, node.datatype, [annotated(child) for child in node.children]
+
+
+def test_semantic_single_pass_matches_two_pass():
+    source = "f b i a f c a = 5 b = a + 3.2 c = b - a - 1 p c"
+    single = analysed(iter_tokens(source))
+    two = analysed(iter_tokens(source), single_pass=False)
+    assert single.symbol_table.symbols == two.symbol_table.symbols
+    assert annotated(single.ast.root) == annotated(two.ast.root)
+
+
+def test_semantic_single_pass_errors():
+    with pytest.raises(SymbolError):
+        analysed(iter_tokens("i a a = b + 1"))
+    with pytest.raises(SymbolError):
+        analysed(iter_tokens("i a f a"))
+    with pytest.raises(SemanticError):
+        analysed(iter_tokens("i a a = 1.5"))
+
+
+def test_semantic_single_pass_deep_expression():
+    analyser = analysed(iter_tokens("f a a = " + " + ".join(["1"] * 20_000) + " - 0.5"))
+    assert analyser.ast.children[1].right().datatype == DataType.FLOAT
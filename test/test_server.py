@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+from ac_compiler.driver import compile_source
+from ac_compiler.server import CompileClient, CompileServer
+from ac_compiler.util import RemoteError
+
+SOURCE = "f b i a a = 5 b = a + 3.2 p b"
+
+
+async def serve_and_compile(server: CompileServer):
+    async with server:
+        async with CompileClient(port=server.port, path=server.path,
+                                 max_connections=2) as client:
+            sources = [f"i a a = {value} p a" for value in range(40)]
+            results = await asyncio.gather(*(client.compile(source) for source in sources))
+            assert results == [compile_source(source) for source in sources]
+            assert len(client.connections) == 2
+            assert await client.compile(SOURCE, level=2) == compile_source(SOURCE, 2)
+            assert await client.run(SOURCE) == "8.2\n"
+            with pytest.raises(RemoteError, match="SymbolError"):
+                await client.compile("i a b = 1")
+            assert await client.compile(SOURCE) == compile_source(SOURCE)
+    return server.statistics
+
+
+def test_server_tcp():
+    server = CompileServer(port=0, workers=0, max_pending=4)
+    statistics = asyncio.run(serve_and_compile(server))
+    assert statistics["requests"] == 44 and statistics["errors"] == 1
+
+
+def test_server_unix_with_workers(tmp_path):
+    path = str(tmp_path / "ac.sock")
+    server = CompileServer(path=path, workers=1)
+    statistics = asyncio.run(serve_and_compile(server))
+    assert statistics["connections"] == 2
+
+
+async def close_with_pending_requests():
+    server = CompileServer(port=0, workers=1)
+    await server.start()
+    tasks = [asyncio.ensure_future(server.serve({"source": SOURCE})) for _ in range(20)]
+    await asyncio.sleep(0)
+    await server.close()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    return server, results
+
+
+def test_server_close_cancels_pending():
+    server, results = asyncio.run(close_with_pending_requests())
+    assert not server.futures
+    cancelled = [isinstance(result, asyncio.CancelledError) for result in results]
+    assert any(cancelled)
+    assert all(result == {"id": None, "dc": compile_source(SOURCE)}
+               for result, skipped in zip(results, cancelled) if not skipped)
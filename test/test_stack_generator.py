@@ -0,0 +1,46 @@
+import pytest
+from ac_compiler.driver import compile_source
+from ac_compiler.generator import StackSchedulingGenerator, render_script
+from benchmarks.workload import generate_program
+from . import analyse, evaluate, simulate
+
+
+def schedule(source):
+    generator = StackSchedulingGenerator(analyse(source))
+    return render_script(generator.generate()).strip(), generator
+
+
+def test_value_left_on_stack():
+    code, generator = schedule("i a i b i c a = 1 b = a + 2 c = 5 - b p c")
+    assert code == "1 0 k 2 + 0 k 5 r - 0 k p si"
+    assert (generator.removed_loads, generator.removed_stores) == (3, 3)
+
+
+def test_value_stored_when_live():
+    code, generator = schedule("i a i b a = 1 b = a + a a = a + 1 p b")
+    assert code == "1 d sa 0 k la + sb 0 k la 1 + sa 0 k lb p si"
+    assert (generator.removed_loads, generator.removed_stores) == (1, 0)
+
+
+def test_value_read_off_the_spine_is_loaded():
+    code, _ = schedule("i a i b a = 1 b = 2 - a p b")
+    assert code == "1 0 k 2 r - 0 k p si"
+    # Below the left operand, the value is not directly under the accumulated operand
+    ast = analyse("i a i b i c c = 1 a = 1 b = 2 - c p b")
+    subtraction = ast.root.children[5].right()
+    subtraction.replace_child(subtraction.right(), analyse("i a i b i c b = 3 - a").root
+                              .children[3].right())
+    generator = StackSchedulingGenerator(ast)
+    assert render_script(generator.generate()).startswith("1 sc 0 k 1 sa 0 k 2 3 la - -")
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("declarations", [2, 8])
+def test_scheduling_preserves_output(seed, declarations):
+    source = generate_program(300, seed=seed, declarations=declarations, chain_length=3,
+                              repeat_ratio=0.3)
+    expected = evaluate(analyse(source))
+    assert simulate(compile_source(source, 0)) == expected
+    optimised = compile_source(source, 3)
+    assert simulate(optimised) == expected
+    assert " r " in optimised and len(optimised.split()) < len(compile_source(source, 2).split())
@@ -0,0 +1,29 @@
+from io import BytesIO, StringIO
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from ac_compiler.scanner import RegexScanner, iter_tokens
+from . import SAMPLE
+
+
+def token_stream(tokens):
+    return [(token.type, token.value) for token in tokens]
+
+
+SOURCE = Path(SAMPLE).read_text()
+EXPECTED = token_stream(RegexScanner(SAMPLE).tokens)
+
+
+def test_stream_sources():
+    for source in (SOURCE, SOURCE.encode(), StringIO(SOURCE), BytesIO(SOURCE.encode()),
+                   Path(SAMPLE)):
+        assert token_stream(iter_tokens(source)) == EXPECTED
+
+
+def test_stream_mmap():
+    with open(SAMPLE, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+        assert token_stream(iter_tokens(mapped)) == EXPECTED
+
+
+def test_stream_chunk_boundaries():
+    for chunk_size in range(1, 8):
+        assert token_stream(iter_tokens(BytesIO(SOURCE.encode()), chunk_size)) == EXPECTED
@@ -0,0 +1,43 @@
+import socket
+import tracemalloc
+from io import BytesIO, StringIO
+from ac_compiler.driver import analyse, compile_source, compile_stream
+from ac_compiler.generator import StreamingCodeGenerator
+from benchmarks.workload import generate_program
+
+
+def test_streaming_generator_sinks():
+    source = generate_program(500, seed=6, chain_length=2)
+    expected = compile_source(source)
+    text, binary = StringIO(), BytesIO()
+    StreamingCodeGenerator(analyse(source), text, buffer_size=100).generate()
+    assert text.getvalue() == expected
+    assert compile_stream(source, binary, buffer_size=0) == len(expected)
+    assert binary.getvalue() == expected.encode()
+
+    reader, writer = socket.socketpair()
+    with reader, writer:
+        compile_stream("i a a = 5 p a", writer)
+        writer.shutdown(socket.SHUT_WR)
+        assert reader.makefile("rb").read() == compile_source("i a a = 5 p a").encode()
+
+
+class Discard:
+    encoding = "ascii"
+
+    def write(self, text):
+        pass
+
+
+def peak(source) -> int:
+    tracemalloc.start()
+    try:
+        compile_stream(source, Discard(), buffer_size=1024)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streaming_bounded_memory():
+    small, large = generate_program(500, seed=1), generate_program(8_000, seed=1)
+    assert peak(large) < 2 * peak(small)
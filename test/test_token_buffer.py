@@ -0,0 +1,44 @@
+import pickle
+from ac_compiler.driver.pipeline import generate
+from ac_compiler.generator import render_script
+from ac_compiler.parser import IterativeParser, Parser
+from ac_compiler.scanner import Token, TokenBuffer, Tokens, iter_tokens
+from benchmarks.workload import generate_program
+from . import analysed
+
+
+def token_stream(tokens):
+    return [(token.type, token.value) for token in tokens]
+
+
+def test_token_interning():
+    assert Token(Tokens.PLUS) is Token(Tokens.PLUS)
+    assert Token(Tokens.ID, "a") is Token(Tokens.ID, "a")
+    assert Token(Tokens.INUM, 5) is not Token(Tokens.INUM, 5)
+    assert pickle.loads(pickle.dumps(Token(Tokens.ASSIGN))) is Token(Tokens.ASSIGN)
+    number = pickle.loads(pickle.dumps(Token(Tokens.FNUM, 3.25)))
+    assert (number.type, number.value) == (Tokens.FNUM, 3.25)
+    assert not hasattr(number, "__dict__")
+
+
+def test_token_buffer():
+    source = generate_program(300, seed=2) + f" a = {2 ** 70}"
+    tokens = list(iter_tokens(source))
+    buffer = TokenBuffer.scan(source)
+    assert len(buffer) == len(tokens)
+    assert token_stream(buffer) == token_stream(tokens)
+    assert token_stream(buffer[-3:]) == token_stream(tokens[-3:])
+    assert buffer[-2].value == 2 ** 70 and buffer.nbytes() < 10 * len(buffer)
+    assert token_stream(pickle.loads(pickle.dumps(buffer))) == token_stream(tokens)
+
+
+def compiled(tokens, parser=IterativeParser):
+    return render_script(generate(analysed(tokens, parser).ast))
+
+
+def test_parsers_consume_token_buffer():
+    source = generate_program(300, seed=4)
+    expected = compiled(iter_tokens(source))
+    assert compiled(TokenBuffer.scan(source)) == expected
+    assert compiled(TokenBuffer.scan("i a a = 5 p a"), Parser) == \
+        compiled(iter_tokens("i a a = 5 p a"))
@@ -0,0 +1,38 @@
+import json
+from io import StringIO
+from ac_compiler.driver import compile_source
+from ac_compiler.trace import NULL_TRACER, ChromeTraceSink, JsonLinesSink, MemorySink, Tracer
+
+SOURCE = "f b i a a = 5 b = a + 3.2 p b"
+
+
+def test_trace_phases():
+    sink = MemorySink()
+    with Tracer(sink, memory=True) as tracer:
+        assert compile_source(SOURCE, 1, tracer) == compile_source(SOURCE, 1)
+    names = [span.name for span in sink.spans]
+    assert names == ["scan", "parse", "analyse", "fold", "generate", "peephole", "compile"]
+    counts = {span.name: span.counts for span in sink.spans}
+    assert counts["scan"]["tokens"] == 15 and counts["parse"]["nodes"] == 11
+    assert counts["analyse"]["lookups"] == 3
+    assert counts["generate"]["instructions"] == 11
+    assert all(span.wall > 0 and span.cpu >= 0 for span in sink.spans)
+    assert sink.totals()["compile"]["calls"] == 1
+
+
+def test_trace_sinks():
+    lines, chrome = StringIO(), StringIO()
+    for sink in (JsonLinesSink(lines), ChromeTraceSink(chrome)):
+        with Tracer(sink) as tracer:
+            compile_source(SOURCE, tracer=tracer)
+    spans = [json.loads(line) for line in lines.getvalue().splitlines()]
+    assert spans[0]["name"] == "scan" and spans[0]["counts"] == {"tokens": 15}
+    events = json.loads(chrome.getvalue())["traceEvents"]
+    assert [event["name"] for event in events] == [span["name"] for span in spans]
+    assert all(event["ph"] == "X" and event["dur"] > 0 for event in events)
+
+
+def test_null_tracer():
+    with NULL_TRACER.phase("compile") as phase:
+        phase.count("instructions", 1)
+    assert not NULL_TRACER.enabled
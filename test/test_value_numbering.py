@@ -0,0 +1,59 @@
+import pytest
+from ac_compiler.driver import compile_source
+from ac_compiler.generator import IterativeCodeGenerator, PeepholeOptimiser, render_script
+from ac_compiler.optimiser import ConstantFolder, DeadStoreEliminator, ValueNumbering
+from benchmarks.workload import generate_program
+from . import analyse, evaluate
+
+DECLARATIONS = "i a i b i c i x i y i z a = 1 b = 2 c = 3 "
+
+
+def number(source):
+    numbering = ValueNumbering(analyse(source))
+    ast = numbering.number()
+    code = PeepholeOptimiser(IterativeCodeGenerator(ast).generate(), 2).optimise()
+    return render_script(code).strip(), numbering
+
+
+def test_reuse_assigned_variable():
+    code, numbering = number(DECLARATIONS + "x = a + b - c y = a + b - c p y")
+    assert code.endswith("la lb + lc - d sx d sy p")
+    assert (numbering.reused, numbering.temporaries) == (1, 0)
+
+
+def test_reuse_temporary():
+    code, numbering = number(DECLARATIONS + "x = a + b - c y = a + b + 1 p x p y")
+    assert code.endswith("la lb + d sA lc - sx lA 1 + sy lx p ly p")
+    assert (numbering.reused, numbering.temporaries) == (1, 1)
+
+
+def test_reassignment_invalidates():
+    code, numbering = number(DECLARATIONS + "x = a + b a = 5 y = a + b x = c + 1 z = a + b "
+                                            "p x p y p z")
+    assert code.endswith("la lb + sx 5 d sa lb + sy lc 1 + sx ly sz lx p ly p lz p")
+    assert (numbering.reused, numbering.temporaries) == (1, 0)
+
+
+def test_temporaries_are_recycled():
+    repeated = " ".join(f"x = {name} + b + 1 y = {name} + b + 2 {name} = 1"
+                        for name in "acdeghjklmnoqrstuvwyz" * 2)
+    declarations = " ".join(f"i {name}" for name in "abcdeghjklmnoqrstuvwxyz")
+    initial = " ".join(f"{name} = 1" for name in "abcdeghjklmnoqrstuvwxyz")
+    ast = analyse(f"{declarations} {initial} {repeated} p x p y")
+    expected = evaluate(ast)
+    numbering = ValueNumbering(ast)
+    assert evaluate(numbering.number()) == expected
+    assert numbering.temporaries == 42 and numbering.reused == 42
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("declarations", [2, 8])
+def test_numbering_preserves_output(seed, declarations):
+    source = generate_program(300, seed=seed, declarations=declarations, chain_length=3,
+                              repeat_ratio=0.5)
+    ast = analyse(source)
+    expected = evaluate(ast)
+    numbering = ValueNumbering(DeadStoreEliminator(ConstantFolder(ast).fold()).eliminate())
+    assert evaluate(numbering.number()) == expected
+    assert numbering.reused > 0
+    assert "sA" in compile_source(source, 3)